@@ -12,6 +12,8 @@ import argparse
 import sys
 import os
 
+import numpy as np
+
 sys.path.insert(0, os.path.dirname(__file__))
 
 from monopoly_drl import train_ppo, train_ddqn, evaluate_agent
@@ -33,14 +35,15 @@ def demo_env():
     print(f"  Example actions: {[action_to_description(a) for a in allowed[:5]]}")
 
     # Take a few random steps
+    rng  = np.random.default_rng()
+    done = False
     for step in range(10):
-        player = env.turn_order[env.current_turn_idx]
+        player = env.whose_turn()
         acts   = env.get_allowed_actions(player)
         if not acts:
             break
-        import random
-        a = random.choice(acts)
-        state, reward, done, info = env.step(player, a)
+        a = int(rng.choice(acts))
+        state, reward, done, info = env.step(a)
         if done:
             break
     print(f"  Ran 10 steps OK. Done={done}, Round={env.round}")
@@ -11,16 +11,20 @@ Quick start
 -----------
 >>> from monopoly_drl import train_ppo, train_ddqn, evaluate_agent
 >>> agent, history = train_ppo(hybrid=True, n_games=2000)
+>>> agent, history = train_ppo(hybrid=True, n_games=2000, num_envs=8)  # parallel games
 >>> results = evaluate_agent(agent, is_ppo=True, n_games=2000)
 """
 
 from .env          import MonopolyEnv
+from .vec_env      import VecMonopolyEnv
 from .agent_ppo    import PPOAgent
 from .agent_ddqn   import DDQNAgent
 from .agents_fixed import FPAgentA, FPAgentB, FPAgentC
 from .train        import train, evaluate
+from .async_train  import train_async
+from .parallel_eval import run_games_parallel
 from .state        import build_state_vector
-from .actions      import ACTION_SPACE_SIZE, action_to_description
+from .actions      import ACTION_SPACE_SIZE, action_to_description, action_to_descriptions
 
 
 def train_ppo(
@@ -28,11 +32,16 @@ def train_ppo(
     player_id: int = 0,
     n_games: int = 2000,
     log_every: int = 100,
+    num_envs: int = 1,
     **kwargs,
 ):
-    """Train a PPO agent. Set hybrid=True for the hybrid approach."""
-    agent = PPOAgent(player_id=player_id, hybrid=hybrid, **kwargs)
-    history = train(agent, is_ppo=True, hybrid=hybrid, n_games=n_games, log_every=log_every)
+    """
+    Train a PPO agent. Set hybrid=True for the hybrid approach.
+    num_envs > 1 collects rollouts from that many games in parallel.
+    """
+    agent = PPOAgent(player_id=player_id, hybrid=hybrid, num_envs=num_envs, **kwargs)
+    history = train(agent, is_ppo=True, hybrid=hybrid, n_games=n_games,
+                    log_every=log_every, num_envs=num_envs)
     return agent, history
 
 
@@ -41,11 +50,16 @@ def train_ddqn(
     player_id: int = 0,
     n_games: int = 10_000,
     log_every: int = 100,
+    num_envs: int = 1,
     **kwargs,
 ):
-    """Train a DDQN agent. Set hybrid=True for the hybrid approach."""
+    """
+    Train a DDQN agent. Set hybrid=True for the hybrid approach.
+    num_envs > 1 collects transitions from that many games in parallel.
+    """
     agent = DDQNAgent(player_id=player_id, hybrid=hybrid, **kwargs)
-    history = train(agent, is_ppo=False, hybrid=hybrid, n_games=n_games, log_every=log_every)
+    history = train(agent, is_ppo=False, hybrid=hybrid, n_games=n_games,
+                    log_every=log_every, num_envs=num_envs)
     return agent, history
 
 
@@ -55,9 +69,9 @@ def evaluate_agent(agent, is_ppo: bool, n_games: int = 2000, n_runs: int = 5):
 
 
 __all__ = [
-    "MonopolyEnv",
+    "MonopolyEnv", "VecMonopolyEnv",
     "PPOAgent", "DDQNAgent",
     "FPAgentA", "FPAgentB", "FPAgentC",
-    "train_ppo", "train_ddqn", "evaluate_agent",
-    "build_state_vector", "ACTION_SPACE_SIZE", "action_to_description",
+    "train_ppo", "train_ddqn", "train_async", "evaluate_agent", "run_games_parallel",
+    "build_state_vector", "ACTION_SPACE_SIZE", "action_to_description", "action_to_descriptions",
 ]
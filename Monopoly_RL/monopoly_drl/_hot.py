@@ -0,0 +1,59 @@
+"""
+Numeric cores of the per-step hybrid decisions.
+
+The functions here only take NumPy arrays and scalars so they can be
+compiled with Numba's @njit. Numba is optional: without it they run as
+plain Python with identical results.
+
+The board tables they take (PRICE_ARR, COLOR_OF_SQ, GROUP_FLAT,
+GROUP_STARTS from constants) are laid out per square (length-40 arrays)
+so they can be indexed with the same square ids as MonopolyEnv.owner_array.
+"""
+
+try:
+    from numba import njit
+except ImportError:                                   # pragma: no cover
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True)
+def _owned_in_group(color, pid, owners, group_flat, group_starts):
+    count = 0
+    for i in range(group_starts[color], group_starts[color + 1]):
+        if owners[group_flat[i]] == pid:
+            count += 1
+    return count
+
+
+@njit(cache=True)
+def buy_decision(position, cash, pid, prices, owners,
+                 color_of_sq, group_flat, group_starts):
+    """Core of agent_ppo.fixed_buy_decision."""
+    color = color_of_sq[position]
+    if color < 0:
+        return False
+    price = prices[position]
+    if owners[position] != -1 or cash < price:
+        return False
+    group_size = group_starts[color + 1] - group_starts[color]
+    if _owned_in_group(color, pid, owners, group_flat, group_starts) + 1 == group_size:
+        return True  # creates monopoly
+    return cash >= price + 200
+
+
+@njit(cache=True)
+def accept_decision(pid, offered_sq, requested_sq, cash_offered, cash_requested,
+                    prices, owners, color_of_sq, group_flat, group_starts):
+    """Core of agent_ppo.fixed_accept_trade_decision (-1 = no property)."""
+    if requested_sq >= 0:
+        color      = color_of_sq[requested_sq]
+        group_size = group_starts[color + 1] - group_starts[color]
+        if _owned_in_group(color, pid, owners, group_flat, group_starts) + 1 == group_size:
+            return True
+
+    po = prices[offered_sq]   if offered_sq   >= 0 else 0
+    pr = prices[requested_sq] if requested_sq >= 0 else 0
+    return (pr + cash_requested) - (po + cash_offered) > 0
@@ -19,6 +19,7 @@ Total: 2922 dimensions
 We index each action with a unique integer and provide mappings.
 """
 
+import numpy as np
 from .constants import (
     PROPERTY_IDS, REAL_ESTATE_IDS, NUM_PLAYERS, TRADE_CASH_LEVELS
 )
@@ -38,6 +39,18 @@ class ActionType(IntEnum):
     DECLINE_TRADE    = 8
 
 
+# Binary action ids as plain ints (IntEnum members are slower to compare and
+# need int() before going into the allowed lists)
+DO_NOTHING       = int(ActionType.DO_NOTHING)
+END_TURN         = int(ActionType.END_TURN)
+ROLL_DICE        = int(ActionType.ROLL_DICE)
+BUY_PROPERTY     = int(ActionType.BUY_PROPERTY)
+USE_GOOJ_CARD    = int(ActionType.USE_GOOJ_CARD)
+PAY_BAIL         = int(ActionType.PAY_BAIL)
+DECLARE_BANKRUPT = int(ActionType.DECLARE_BANKRUPT)
+ACCEPT_TRADE     = int(ActionType.ACCEPT_TRADE)
+DECLINE_TRADE    = int(ActionType.DECLINE_TRADE)
+
 NUM_BINARY = len(ActionType)           # 9
 
 # Property-indexed actions
@@ -75,11 +88,41 @@ ACTION_SPACE_SIZE = cur   # should be ~2922
 
 OFFSETS = _o
 
-
-def action_to_description(action_idx: int) -> str:
-    """Human-readable action description for debugging."""
-    for name, start in sorted(OFFSETS.items(), key=lambda x: x[1]):
-        size = _section_size(name)
+# First action id of each section, in OFFSETS order; bisect an action id
+# into it to find its section
+SECTION_STARTS = tuple(OFFSETS.values())
+
+# Decode tables for the trade sections, indexed by the local action index:
+#   buy_trade / sell_trade → (player_idx, prop_idx, price_idx)
+#   exch_trade             → (player_idx, offer_idx, req_idx)
+_n_props     = len(PROPERTY_IDS)
+TRADE_DECODE = [(p, i, c) for p in range(OTHER_PLAYERS)
+                for i in range(_n_props) for c in range(NUM_TRADE_CASH)]
+EXCH_DECODE  = [(p, o, r) for p in range(OTHER_PLAYERS)
+                for o in range(_n_props) for r in range(_n_props) if r != o]
+
+# Encoding the other way round:
+#   local = player_idx * TRADE_PLAYER_STRIDE + prop_idx * NUM_TRADE_CASH + price_idx
+TRADE_PLAYER_STRIDE = _n_props * NUM_TRADE_CASH
+
+
+def allowed_mask(allowed_actions) -> np.ndarray:
+    """
+    (N, ACTION_SPACE_SIZE) bool mask from N lists of allowed action indices.
+    A mask that is already an array (as VecMonopolyEnv returns) is copied,
+    so callers can modify the result in place either way.
+    """
+    if isinstance(allowed_actions, np.ndarray):
+        return allowed_actions.astype(bool, copy=True)
+    mask = np.zeros((len(allowed_actions), ACTION_SPACE_SIZE), dtype=bool)
+    for i, acts in enumerate(allowed_actions):
+        mask[i, acts] = True
+    return mask
+
+
+def _compute_description(action_idx: int) -> str:
+    for name, start in _SECTIONS:
+        size = _SECTION_SIZES[name]
         if start <= action_idx < start + size:
             local = action_idx - start
             if name == "binary":
@@ -91,20 +134,12 @@ def action_to_description(action_idx: int) -> str:
                 prop = REAL_ESTATE_IDS[local % len(REAL_ESTATE_IDS)]
                 return f"{name}(sq={prop})"
             if name in ("buy_trade", "sell_trade"):
-                player_idx = local // (len(PROPERTY_IDS) * NUM_TRADE_CASH)
-                rem        = local % (len(PROPERTY_IDS) * NUM_TRADE_CASH)
-                prop_idx   = rem // NUM_TRADE_CASH
-                price_idx  = rem % NUM_TRADE_CASH
+                player_idx, prop_idx, price_idx = TRADE_DECODE[local]
                 return (f"{name}(player={player_idx}, "
                         f"prop={PROPERTY_IDS[prop_idx]}, "
                         f"price={TRADE_CASH_LEVELS[price_idx]}x)")
             if name == "exch_trade":
-                n_props = len(PROPERTY_IDS)
-                player_idx  = local // (n_props * (n_props - 1))
-                rem         = local % (n_props * (n_props - 1))
-                offer_idx   = rem // (n_props - 1)
-                req_idx_raw = rem % (n_props - 1)
-                req_idx     = req_idx_raw if req_idx_raw < offer_idx else req_idx_raw + 1
+                player_idx, offer_idx, req_idx = EXCH_DECODE[local]
                 return (f"exch_trade(player={player_idx}, "
                         f"offer={PROPERTY_IDS[offer_idx]}, "
                         f"req={PROPERTY_IDS[req_idx]})")
@@ -112,14 +147,28 @@ def action_to_description(action_idx: int) -> str:
     return f"UNKNOWN({action_idx})"
 
 
-def _section_size(name: str) -> int:
-    keys = sorted(OFFSETS.keys(), key=lambda k: OFFSETS[k])
-    for i, k in enumerate(keys):
-        if k == name:
-            if i + 1 < len(keys):
-                return OFFSETS[keys[i+1]] - OFFSETS[name]
-            return ACTION_SPACE_SIZE - OFFSETS[name]
-    return 0
+# Sections in offset order and their sizes, computed once.
+_SECTIONS      = sorted(OFFSETS.items(), key=lambda x: x[1])
+_SECTION_SIZES = {name: end - start for (name, start), end in
+                  zip(_SECTIONS, [s for _, s in _SECTIONS[1:]] + [ACTION_SPACE_SIZE])}
+
+# Every description is fixed at import time, so build the table once.
+_DESCRIPTIONS     = [_compute_description(i) for i in range(ACTION_SPACE_SIZE)]
+_DESCRIPTIONS_ARR = np.array(_DESCRIPTIONS, dtype=object)   # for fancy indexing
 
 
+def action_to_description(action_idx: int) -> str:
+    """Human-readable action description for debugging."""
+    if 0 <= action_idx < ACTION_SPACE_SIZE:
+        return _DESCRIPTIONS[action_idx]
+    return f"UNKNOWN({action_idx})"
+
 
+def action_to_descriptions(indices) -> list:
+    """action_to_description for a whole array of indices, as one table gather."""
+    idx   = np.asarray(indices, dtype=np.int64).ravel()
+    valid = (idx >= 0) & (idx < ACTION_SPACE_SIZE)
+    out   = _DESCRIPTIONS_ARR[np.where(valid, idx, 0)]
+    for i in np.flatnonzero(~valid).tolist():
+        out[i] = f"UNKNOWN({idx[i]})"
+    return out.tolist()
@@ -13,39 +13,84 @@ Hybrid mode: BUY_PROPERTY and ACCEPT_TRADE handled by fixed rules.
 import numpy as np
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
 import torch.optim as optim
-import random
-from collections import deque
-from typing import List, Tuple
-
-from .networks import DDQNNetwork
-from .actions import ActionType, ACTION_SPACE_SIZE
+from contextlib import contextmanager
+from typing import List, Tuple, Optional
+
+from .networks import (
+    DDQNNetwork, STATE_DIM, quantize_for_inference, script_for_inference,
+    resolve_device, PinnedStaging, epsilon_explore,
+)
+from .actions import ActionType, ACTION_SPACE_SIZE, allowed_mask
 from .constants import COLOR_GROUPS, NUM_PLAYERS
-from .agent_ppo import fixed_buy_decision, fixed_accept_trade_decision
+from .agent_ppo import fixed_hybrid_action
 
 
 # ── Replay Buffer ─────────────────────────────────────────────────────────────
 
 class ReplayBuffer:
-    def __init__(self, capacity: int = 50_000):
-        self.buffer = deque(maxlen=capacity)
+    """
+    Fixed-capacity ring buffer. Each field is a preallocated NumPy array
+    written by index, so sampling is one fancy-indexed gather per field.
+    When device is a GPU, minibatches are gathered straight into pinned
+    host tensors and copied over with non_blocking=True.
+    """
+
+    def __init__(self, capacity: int = 50_000, device="cpu"):
+        self.capacity    = capacity
+        self.device      = torch.device(device)
+        self.states      = np.empty((capacity, STATE_DIM), dtype=np.float32)
+        self.actions     = np.empty(capacity, dtype=np.int64)
+        self.rewards     = np.empty(capacity, dtype=np.float32)
+        self.next_states = np.empty((capacity, STATE_DIM), dtype=np.float32)
+        self.dones       = np.empty(capacity, dtype=np.float32)
+        self.ptr  = 0   # next write position
+        self.size = 0
+        self._pinned = None   # pinned staging tensors, allocated on first GPU sample
 
     def push(self, state, action, reward, next_state, done):
-        self.buffer.append((state, action, reward, next_state, done))
+        i = self.ptr
+        self.states[i]      = state
+        self.actions[i]     = action
+        self.rewards[i]     = reward
+        self.next_states[i] = next_state
+        self.dones[i]       = done
+        self.ptr  = (i + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def push_batch(self, states, actions, rewards, next_states, dones):
+        n   = len(actions)
+        idx = (self.ptr + np.arange(n)) % self.capacity
+        self.states[idx]      = states
+        self.actions[idx]     = actions
+        self.rewards[idx]     = rewards
+        self.next_states[idx] = next_states
+        self.dones[idx]       = dones
+        self.ptr  = (self.ptr + n) % self.capacity
+        self.size = min(self.size + n, self.capacity)
 
     def sample(self, batch_size: int):
-        batch = random.sample(self.buffer, batch_size)
-        states, actions, rewards, next_states, dones = zip(*batch)
-        return (
-            torch.FloatTensor(np.array(states)),
-            torch.LongTensor(actions),
-            torch.FloatTensor(rewards),
-            torch.FloatTensor(np.array(next_states)),
-            torch.FloatTensor(dones),
-        )
+        idx    = np.random.randint(0, self.size, batch_size)
+        fields = (self.states, self.actions, self.rewards, self.next_states, self.dones)
+        if self.device.type != "cuda":
+            return tuple(torch.from_numpy(f[idx]) for f in fields)
+
+        # Reusing the staging tensors is safe: update() syncs on loss.item()
+        # before the next sample, so the previous copy has completed.
+        if self._pinned is None or len(self._pinned[0]) != batch_size:
+            self._pinned = tuple(
+                torch.from_numpy(np.empty((batch_size,) + f.shape[1:], dtype=f.dtype)).pin_memory()
+                for f in fields
+            )
+        out = []
+        for f, pinned in zip(fields, self._pinned):
+            np.take(f, idx, axis=0, out=pinned.numpy())
+            out.append(pinned.to(self.device, non_blocking=True))
+        return tuple(out)
 
     def __len__(self):
-        return len(self.buffer)
+        return self.size
 
 
 # ── DDQN Agent ────────────────────────────────────────────────────────────────
@@ -71,26 +116,42 @@ class DDQNAgent:
         target_update_freq: int = 1_000,  # steps between target network updates
         hidden_dim: int = 256,
         win_loss_bonus: float = 10.0,   # constant c=10 for DDQN (paper Exp 1)
+        device: str = "cpu",     # "auto" = CUDA when available
+        compile: bool = False,   # torch.compile the online/target forward passes
+        amp_dtype: Optional[torch.dtype] = None,  # e.g. torch.bfloat16 for mixed precision
+        seed: Optional[int] = None,   # ε-exploration RNG (see reseed)
     ):
         self.player_id       = player_id
         self.hybrid          = hybrid
         self.gamma           = gamma
         self.epsilon         = epsilon_start
+        self.epsilon_start   = epsilon_start
         self.epsilon_end     = epsilon_end
         self.epsilon_decay   = epsilon_decay
         self.batch_size      = batch_size
         self.target_update_freq = target_update_freq
         self.win_loss_bonus  = win_loss_bonus
+        self.device          = resolve_device(device)
+        self.amp_dtype       = amp_dtype
 
-        self.online_net = DDQNNetwork(hidden_dim)
-        self.target_net = DDQNNetwork(hidden_dim)
+        self.online_net = DDQNNetwork(hidden_dim, seed=seed).to(self.device)
+        self.target_net = DDQNNetwork(hidden_dim).to(self.device)
         self.target_net.load_state_dict(self.online_net.state_dict())
         self.target_net.eval()
+        self._compile_networks(compile)
 
-        self.optimizer = optim.Adam(self.online_net.parameters(), lr=lr)
-        self.buffer    = ReplayBuffer(buffer_capacity)
+        # Fused Adam kernel on GPU, multi-tensor (foreach) Adam otherwise
+        fused          = self.device.type == "cuda"
+        self.optimizer = optim.Adam(self.online_net.parameters(), lr=lr,
+                                    fused=fused, foreach=not fused)
+        # Loss scaling is only needed for float16; bfloat16 has FP32's range
+        self.scaler    = torch.amp.GradScaler(self.device.type, enabled=amp_dtype == torch.float16)
+        self.buffer    = ReplayBuffer(buffer_capacity, self.device)
+        self._stage    = PinnedStaging(self.device)   # rollout batches → device
 
         self.step_count = 0
+        self._target_synced_at = 0
+        self._eps_anchor = (epsilon_start, 0)   # (ε, step_count) the decay starts from
         self.last_state  = None
         self.last_action = None
 
@@ -99,50 +160,125 @@ class DDQNAgent:
         if hybrid:
             self.fixed_actions.add(int(ActionType.BUY_PROPERTY))
             self.fixed_actions.add(int(ActionType.ACCEPT_TRADE))
+        self.fixed_action_mask = np.zeros(ACTION_SPACE_SIZE, dtype=bool)
+        self.fixed_action_mask[list(self.fixed_actions)] = True
+
+    def _compile_networks(self, enabled: bool):
+        """
+        Forward passes go through _online_fwd / _target_fwd, which are the
+        torch.compile'd networks when enabled. The raw modules stay on
+        self.online_net / self.target_net so target syncs and checkpoints
+        are unchanged.
+        """
+        self._online_fwd = self.online_net
+        self._target_fwd = self.target_net
+        if enabled:
+            self._online_fwd = torch.compile(self.online_net, mode="reduce-overhead", dynamic=False)
+            self._target_fwd = torch.compile(self.target_net, mode="reduce-overhead", dynamic=False)
+
+    @contextmanager
+    def quantized_inference(self):
+        """
+        Route action selection through an int8 copy of the online network
+        (networks.quantize_for_inference) inside the block, e.g. around an
+        evaluation. CPU only; do not call update() inside it.
+        """
+        with self._inference_copy(quantize_for_inference):
+            yield self
+
+    @contextmanager
+    def scripted_inference(self):
+        """
+        Like quantized_inference, with a frozen TorchScript copy
+        (networks.script_for_inference) that keeps float weights.
+        """
+        with self._inference_copy(script_for_inference):
+            yield self
+
+    @contextmanager
+    def _inference_copy(self, make_copy):
+        """Act with make_copy(online_net) until the block exits."""
+        saved = self.online_net, self._online_fwd
+        self.online_net = self._online_fwd = make_copy(self.online_net)
+        try:
+            yield
+        finally:
+            self.online_net, self._online_fwd = saved
+
+    def _autocast(self):
+        """Mixed-precision context for the update; a no-op unless amp_dtype is set."""
+        return torch.autocast(self.device.type, dtype=self.amp_dtype,
+                              enabled=self.amp_dtype is not None)
 
     # ── Action selection ──────────────────────────────────────────────────────
 
     def choose_action(self, state: np.ndarray, env, allowed_actions: List[int]) -> int:
         pid = self.player_id
 
-        # Hybrid: intercept buy
-        if self.hybrid and int(ActionType.BUY_PROPERTY) in allowed_actions:
-            if fixed_buy_decision(env, pid):
-                return int(ActionType.BUY_PROPERTY)
-
-        # Hybrid: intercept trade acceptance
+        # Hybrid: intercept buy / trade acceptance
         if self.hybrid:
-            pending = next(
-                (o for o in env.pending_trades.values() if o.to_player == pid),
-                None
-            )
-            if pending is not None:
-                if fixed_accept_trade_decision(env, pid):
-                    return int(ActionType.ACCEPT_TRADE)
-                return int(ActionType.DECLINE_TRADE)
+            fixed = fixed_hybrid_action(env, pid, allowed_actions)
+            if fixed is not None:
+                return fixed
 
         # NN actions only
-        nn_allowed = [a for a in allowed_actions if a not in self.fixed_actions]
+        allowed    = np.asarray(allowed_actions, dtype=np.int64)
+        nn_allowed = allowed[~self.fixed_action_mask[allowed]].tolist()
         if not nn_allowed:
             nn_allowed = [int(ActionType.DO_NOTHING)]
 
         action = self.online_net.get_action(state, nn_allowed, self.epsilon)
         return action
 
+    def choose_action_batch(self, states: np.ndarray, allowed_actions) -> np.ndarray:
+        """
+        ε-greedy actions for a batch of environments with one forward pass.
+        allowed_actions is a list of allowed-action lists or an (N, A) bool
+        mask, as VecMonopolyEnv returns.
+        Hybrid decisions are resolved inside the environments (see
+        vec_env.LearnerGame), so only the network-owned actions reach here.
+        """
+        mask = allowed_mask(allowed_actions)
+        mask &= ~self.fixed_action_mask
+        mask[~mask.any(axis=1), int(ActionType.DO_NOTHING)] = True
+
+        states_t = self._stage("states", states, torch.float32)
+        mask_t   = self._stage("mask", mask, torch.bool)
+        with torch.inference_mode():
+            q_values = self._online_fwd(states_t)
+            q_values = q_values.masked_fill(~mask_t, float('-inf'))
+            actions  = q_values.argmax(dim=1).cpu().numpy()
+        return epsilon_explore(actions, mask, self.epsilon, self.online_net.rng)
+
+    def reseed(self, seed: int):
+        """Restart the ε-exploration RNG (online_net.rng) from seed."""
+        self.online_net.rng.seed(seed)
+
     # ── Learning step ─────────────────────────────────────────────────────────
 
     def store_transition(self, state, action, reward, next_state, done):
         self.buffer.push(state, action, reward, next_state, done)
         self.step_count += 1
-        # Decay epsilon
-        self.epsilon = max(self.epsilon_end, self.epsilon * self.epsilon_decay)
+        self._decay_epsilon()
+
+    def store_transitions(self, states, actions, rewards, next_states, dones):
+        """Store one transition per environment (arrays of shape (N, ...))."""
+        self.buffer.push_batch(states, actions, rewards, next_states, dones)
+        self.step_count += len(actions)
+        self._decay_epsilon()
+
+    def _decay_epsilon(self):
+        """Exponential ε decay per stored step, in closed form of step_count."""
+        eps0, step0  = self._eps_anchor
+        self.epsilon = max(self.epsilon_end,
+                           eps0 * self.epsilon_decay ** (self.step_count - step0))
 
     def add_win_loss(self, won: bool):
         """Add win/loss bonus to the most recent transition."""
         if self.win_loss_bonus != 0 and len(self.buffer) > 0:
-            s, a, r, ns, d = self.buffer.buffer[-1]
+            last  = (self.buffer.ptr - 1) % self.buffer.capacity
             bonus = self.win_loss_bonus if won else -self.win_loss_bonus
-            self.buffer.buffer[-1] = (s, a, r + bonus, ns, d)
+            self.buffer.rewards[last] += bonus
 
     def update(self) -> dict:
         """Sample mini-batch and perform a DDQN gradient step."""
@@ -151,25 +287,31 @@ class DDQNAgent:
 
         states, actions, rewards, next_states, dones = self.buffer.sample(self.batch_size)
 
-        # Current Q-values
-        q_values = self.online_net(states).gather(1, actions.unsqueeze(1)).squeeze(1)
+        with self._autocast():
+            # Current Q-values
+            q_values = self._online_fwd(states).gather(1, actions.unsqueeze(1)).squeeze(1)
 
-        # DDQN target: use online net to select action, target net to evaluate
-        with torch.no_grad():
-            next_actions = self.online_net(next_states).argmax(1)
-            next_q       = self.target_net(next_states).gather(1, next_actions.unsqueeze(1)).squeeze(1)
-            targets      = rewards + self.gamma * next_q * (1 - dones)
+            # DDQN target: use online net to select action, target net to evaluate.
+            # no_grad rather than inference_mode: targets feed the loss's backward.
+            with torch.no_grad():
+                next_actions = self._online_fwd(next_states).argmax(1)
+                next_q       = self._target_fwd(next_states).gather(1, next_actions.unsqueeze(1)).squeeze(1)
+                targets      = rewards + self.gamma * next_q.float() * (1 - dones)
 
-        loss = nn.SmoothL1Loss()(q_values, targets)
+            loss = F.smooth_l1_loss(q_values.float(), targets)
 
         self.optimizer.zero_grad()
-        loss.backward()
+        self.scaler.scale(loss).backward()
+        self.scaler.unscale_(self.optimizer)
         nn.utils.clip_grad_norm_(self.online_net.parameters(), 1.0)
-        self.optimizer.step()
+        self.scaler.step(self.optimizer)
+        self.scaler.update()
 
-        # Hard update target network
-        if self.step_count % self.target_update_freq == 0:
+        # Hard update target network (vectorized rollouts add several
+        # transitions per update, so compare against the last sync point)
+        if self.step_count - self._target_synced_at >= self.target_update_freq:
             self.target_net.load_state_dict(self.online_net.state_dict())
+            self._target_synced_at = self.step_count
 
         return {"loss": loss.item(), "epsilon": self.epsilon}
 
@@ -185,3 +327,4 @@ class DDQNAgent:
         self.target_net.load_state_dict(ckpt["target"])
         self.target_net.eval()
         self.epsilon = self.epsilon_end  # inference mode
+        self._eps_anchor = (self.epsilon_end, self.step_count)
@@ -11,14 +11,23 @@ Hybrid mode: BUY_PROPERTY and ACCEPT_TRADE are handled by fixed rules,
 import numpy as np
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
 import torch.optim as optim
 from collections import deque
+from contextlib import contextmanager
 from typing import List, Tuple, Optional
 import random
 
-from .networks import ActorNetwork, CriticNetwork
-from .actions import ActionType, OFFSETS, ACTION_SPACE_SIZE
-from .constants import TRADE_CASH_LEVELS, PROPERTY_IDS, COLOR_GROUPS, JAIL_BAIL, NUM_PLAYERS
+from .networks import (
+    ActorNetwork, CriticNetwork, ActorCriticNetwork, STATE_DIM, gumbel_argmax,
+    quantize_for_inference, script_for_inference, resolve_device, PinnedStaging,
+)
+from .actions import ActionType, OFFSETS, ACTION_SPACE_SIZE, allowed_mask
+from .constants import (
+    TRADE_CASH_LEVELS, PROPERTY_IDS, JAIL_BAIL, NUM_PLAYERS,
+    PRICE_ARR, COLOR_OF_SQ, GROUP_FLAT, GROUP_STARTS
+)
+from . import _hot
 
 
 # ── Hybrid fixed-policy decisions ─────────────────────────────────────────────
@@ -31,19 +40,9 @@ def fixed_buy_decision(env, pid: int) -> bool:
       2. We have $200 more than the property price
     """
     player = env.players[pid]
-    sq     = player.position
-    if sq not in env.properties:
-        return False
-    prop = env.properties[sq]
-    if prop.owner is not None or not player.can_afford(prop.price):
-        return False
-
-    color = prop.color
-    group = COLOR_GROUPS[color]
-    owned_count = sum(1 for s in group if env.properties[s].owner == pid)
-    if owned_count + 1 == len(group):  # creates monopoly
-        return True
-    return player.cash >= prop.price + 200
+    return bool(_hot.buy_decision(
+        player.position, float(player.cash), pid, PRICE_ARR, env.owner_array,
+        COLOR_OF_SQ, GROUP_FLAT, GROUP_STARTS))
 
 
 def fixed_accept_trade_decision(env, pid: int) -> bool:
@@ -53,58 +52,81 @@ def fixed_accept_trade_decision(env, pid: int) -> bool:
       1. Trade increases our monopoly count, OR
       2. Net worth of the offer is positive (to us)
     """
-    offer = next(
-        (o for o in env.pending_trades.values() if o.to_player == pid),
-        None
-    )
+    offer = env._incoming_trade(pid)
     if offer is None:
         return False
+    return bool(_hot.accept_decision(
+        pid,
+        offer.offered_prop.square_id   if offer.offered_prop   else -1,
+        offer.requested_prop.square_id if offer.requested_prop else -1,
+        float(offer.cash_offered), float(offer.cash_requested),
+        PRICE_ARR, env.owner_array,
+        COLOR_OF_SQ, GROUP_FLAT, GROUP_STARTS))
 
-    # Check monopoly gain
-    if offer.requested_prop:
-        color = offer.requested_prop.color
-        group = COLOR_GROUPS[color]
-        owned_after = sum(1 for s in group
-                          if env.properties[s].owner == pid
-                          or env.properties[s] == offer.offered_prop)
-        if offer.requested_prop.square_id in [s for s in group]:
-            would_own = sum(1 for s in group if env.properties[s].owner == pid) + 1
-            if would_own == len(group):
-                return True
-
-    # Net worth of the trade for the *recipient* (pid)
-    po = offer.offered_prop.price   if offer.offered_prop   else 0
-    pr = offer.requested_prop.price if offer.requested_prop else 0
-    nwo_for_recipient = (pr + offer.cash_requested) - (po + offer.cash_offered)
-    return nwo_for_recipient > 0
+
+def fixed_hybrid_action(env, pid: int, allowed_actions: List[int]) -> Optional[int]:
+    """
+    Fixed-policy half of the hybrid agent (paper Section V-B).
+    Returns BUY_PROPERTY / ACCEPT_TRADE / DECLINE_TRADE when the rules
+    above own the decision, or None when the neural network should act.
+    """
+    if int(ActionType.BUY_PROPERTY) in allowed_actions:
+        if fixed_buy_decision(env, pid):
+            return int(ActionType.BUY_PROPERTY)
+
+    pending = env.pending_trades_by_recipient[pid]
+    if pending is not None:
+        if fixed_accept_trade_decision(env, pid):
+            return int(ActionType.ACCEPT_TRADE)
+        return int(ActionType.DECLINE_TRADE)
+    return None
 
 
 # ── Experience buffer ─────────────────────────────────────────────────────────
 
 class PPOBuffer:
-    """Stores a single rollout trajectory for PPO updates."""
+    """
+    Stores a rollout for PPO updates.
 
-    def __init__(self):
-        self.states    = []
-        self.actions   = []
-        self.log_probs = []
-        self.rewards   = []
-        self.values    = []
-        self.dones     = []
+    Storage is preallocated as one NumPy array per field of shape
+    (n_steps, num_envs, ...) and filled in place, one time step across all
+    environments per store(). The tensor attributes (states, actions, ...)
+    are torch.from_numpy views of the same memory, so update() reads the
+    rollout without a copy. The single-env path uses num_envs=1.
+    """
 
-    def store(self, state, action, log_prob, reward, value, done):
-        self.states.append(state)
-        self.actions.append(action)
-        self.log_probs.append(log_prob)
-        self.rewards.append(reward)
-        self.values.append(value)
-        self.dones.append(done)
+    _FIELDS = (("states", np.float32), ("actions", np.int64), ("log_probs", np.float32),
+               ("rewards", np.float32), ("values", np.float32), ("dones", np.float32))
+
+    def __init__(self, n_steps: int, num_envs: int = 1):
+        self.n_steps = n_steps
+        self._allocate(num_envs)
+
+    def _allocate(self, num_envs: int):
+        self.num_envs = num_envs
+        self._arrays  = []
+        for name, dtype in self._FIELDS:
+            shape = (self.n_steps, num_envs, STATE_DIM) if name == "states" else (self.n_steps, num_envs)
+            arr   = np.empty(shape, dtype=dtype)
+            self._arrays.append(arr)
+            setattr(self, name, torch.from_numpy(arr))
+        self.ptr = 0
+
+    def store(self, states, actions, log_probs, reward, values, dones):
+        if self.ptr == 0 and len(actions) != self.num_envs:
+            self._allocate(len(actions))
+        if self.ptr >= self.n_steps:
+            raise RuntimeError("PPOBuffer is full; call update() first")
+        t = self.ptr
+        for arr, data in zip(self._arrays, (states, actions, log_probs, reward, values, dones)):
+            arr[t] = data
+        self.ptr += 1
 
     def clear(self):
-        self.__init__()
+        self.ptr = 0
 
     def __len__(self):
-        return len(self.states)
+        return self.ptr
 
 
 # ── PPO Agent ─────────────────────────────────────────────────────────────────
@@ -129,9 +151,14 @@ class PPOAgent:
         max_grad_norm: float = 0.5,
         n_steps: int = 512,      # steps per rollout
         n_epochs: int = 4,       # PPO update epochs
-        batch_size: int = 64,
+        batch_size: Optional[int] = 64,  # None = full-batch PPO over each rollout
         hidden_dim: int = 256,
         win_loss_bonus: float = 0.0,  # constant c in paper (c=0 for PPO)
+        num_envs: int = 1,       # parallel games feeding the rollout buffer
+        compile: bool = False,   # torch.compile the actor/critic forward passes
+        shared_backbone: bool = False,  # one ActorCriticNetwork instead of separate actor/critic
+        device: str = "cpu",     # "auto" = CUDA when available
+        amp_dtype: Optional[torch.dtype] = None,  # e.g. torch.bfloat16 for mixed precision
     ):
         self.player_id     = player_id
         self.hybrid        = hybrid
@@ -143,24 +170,102 @@ class PPOAgent:
         self.max_grad_norm = max_grad_norm
         self.n_steps       = n_steps
         self.n_epochs      = n_epochs
-        self.batch_size    = batch_size
+        self.batch_size    = batch_size if batch_size is not None else n_steps * num_envs
         self.win_loss_bonus = win_loss_bonus
+        self.device        = resolve_device(device)
+        self.amp_dtype     = amp_dtype
 
-        self.actor  = ActorNetwork(hidden_dim)
-        self.critic = CriticNetwork(hidden_dim)
-        self.opt    = optim.Adam(
-            list(self.actor.parameters()) + list(self.critic.parameters()), lr=lr
-        )
-
-        self.buffer   = PPOBuffer()
+        self.shared_backbone = shared_backbone
+        if shared_backbone:
+            self.actor_critic = ActorCriticNetwork(hidden_dim).to(self.device)
+            self._params      = list(self.actor_critic.parameters())
+        else:
+            self.actor   = ActorNetwork(hidden_dim).to(self.device)
+            self.critic  = CriticNetwork(hidden_dim).to(self.device)
+            self._params = list(self.actor.parameters()) + list(self.critic.parameters())
+        self._compile_networks(compile)
+        # Fused Adam kernel on GPU, multi-tensor (foreach) Adam otherwise
+        fused       = self.device.type == "cuda"
+        self.opt    = optim.Adam(self._params, lr=lr, fused=fused, foreach=not fused)
+        # Loss scaling is only needed for float16; bfloat16 has FP32's range
+        self.scaler = torch.amp.GradScaler(self.device.type, enabled=amp_dtype == torch.float16)
+
+        self.buffer   = PPOBuffer(n_steps, num_envs)
+        self._stage   = PinnedStaging(self.device)   # rollout batches → device
         self.step_count = 0
 
         # Mask actions permanently handled by fixed policy (hybrid only)
-        self.fixed_action_mask = torch.zeros(ACTION_SPACE_SIZE, dtype=torch.bool)
+        self.fixed_action_mask = np.zeros(ACTION_SPACE_SIZE, dtype=bool)
         if hybrid:
             self.fixed_action_mask[int(ActionType.BUY_PROPERTY)] = True
             self.fixed_action_mask[int(ActionType.ACCEPT_TRADE)]  = True
 
+    def _compile_networks(self, enabled: bool):
+        """
+        Forward passes go through _policy_value, backed by _actor_fwd /
+        _critic_fwd or _actor_critic_fwd, which are the torch.compile'd
+        networks when enabled. The raw modules stay on self.actor /
+        self.critic (or self.actor_critic) so parameters and checkpoints
+        are unchanged.
+        """
+        def compiled(net):
+            return torch.compile(net, mode="reduce-overhead", dynamic=False)
+
+        if self.shared_backbone:
+            self._actor_critic_fwd = compiled(self.actor_critic) if enabled else self.actor_critic
+            return
+        self._actor_fwd  = self.actor
+        self._critic_fwd = self.critic
+        if enabled:
+            self._actor_fwd  = compiled(self.actor)
+            self._critic_fwd = compiled(self.critic)
+
+    def _policy_value(self, states: torch.Tensor, mask: torch.Tensor = None):
+        """(log_probs, values) for a state batch: one pass when the trunk is shared."""
+        if self.shared_backbone:
+            return self._actor_critic_fwd(states, mask)
+        return self._actor_fwd(states, mask), self._critic_fwd(states)
+
+    @contextmanager
+    def quantized_inference(self):
+        """
+        Route action selection through int8 copies of the networks
+        (networks.quantize_for_inference) inside the block, e.g. around an
+        evaluation. CPU only. Do not collect training rollouts or update
+        inside it: the stored log-probs and values would come from the
+        int8 copy, not the networks being trained.
+        """
+        with self._inference_copies(quantize_for_inference):
+            yield self
+
+    @contextmanager
+    def scripted_inference(self):
+        """
+        Like quantized_inference, with frozen TorchScript copies
+        (networks.script_for_inference) that keep float weights.
+        """
+        with self._inference_copies(script_for_inference):
+            yield self
+
+    @contextmanager
+    def _inference_copies(self, make_copy):
+        """Swap the forward passes for make_copy(network) until the block exits."""
+        names = ("_actor_critic_fwd",) if self.shared_backbone else ("_actor_fwd", "_critic_fwd")
+        saved = {n: getattr(self, n) for n in names}
+        nets  = (self.actor_critic,) if self.shared_backbone else (self.actor, self.critic)
+        for n, net in zip(names, nets):
+            setattr(self, n, make_copy(net))
+        try:
+            yield
+        finally:
+            for n, fwd in saved.items():
+                setattr(self, n, fwd)
+
+    def _autocast(self):
+        """Mixed-precision context for the update; a no-op unless amp_dtype is set."""
+        return torch.autocast(self.device.type, dtype=self.amp_dtype,
+                              enabled=self.amp_dtype is not None)
+
     # ── Action selection ──────────────────────────────────────────────────────
 
     def choose_action(self, state: np.ndarray, env, allowed_actions: List[int]):
@@ -169,44 +274,63 @@ class PPOAgent:
         """
         pid = self.player_id
 
-        # Hybrid: handle buy property
-        if self.hybrid and int(ActionType.BUY_PROPERTY) in allowed_actions:
-            if fixed_buy_decision(env, pid):
-                return int(ActionType.BUY_PROPERTY), 0.0, 0.0
-
-        # Hybrid: handle trade acceptance
+        # Hybrid: buy property / trade acceptance use the fixed rules
         if self.hybrid:
-            pending = next(
-                (o for o in env.pending_trades.values() if o.to_player == pid),
-                None
-            )
-            if pending is not None:
-                if fixed_accept_trade_decision(env, pid):
-                    return int(ActionType.ACCEPT_TRADE), 0.0, 0.0
-                else:
-                    return int(ActionType.DECLINE_TRADE), 0.0, 0.0
+            fixed = fixed_hybrid_action(env, pid, allowed_actions)
+            if fixed is not None:
+                return fixed, 0.0, 0.0
 
-        # Filter out fixed-policy actions from neural net consideration
-        nn_allowed = [a for a in allowed_actions
-                      if not self.fixed_action_mask[a]]
-        if not nn_allowed:
-            nn_allowed = [int(ActionType.DO_NOTHING)]
+        # Neural net picks among the remaining actions (batch of one)
+        actions, log_probs, values = self.choose_action_batch(state[None], [allowed_actions])
+        return int(actions[0]), float(log_probs[0]), float(values[0])
 
-        state_t  = torch.FloatTensor(state).unsqueeze(0)
-        value    = self.critic(state_t).item()
-        action, log_prob = self.actor.get_action(state, nn_allowed)
-        return action, log_prob, value
+    def choose_action_batch(self, states: np.ndarray, allowed_actions):
+        """
+        Choose actions for a batch of environments with one actor and one
+        critic forward pass, sampling every action with one Gumbel-max argmax.
+        allowed_actions is a list of allowed-action lists or an (N, A) bool
+        mask, as VecMonopolyEnv returns.
+        Hybrid decisions are resolved by the caller (choose_action, or
+        vec_env.LearnerGame), so only the network-owned actions reach here.
+
+        Returns (actions, log_probs, values), each an array of shape (N,).
+        """
+        # Filter out fixed-policy actions from neural net consideration
+        mask = allowed_mask(allowed_actions)
+        mask &= ~self.fixed_action_mask
+        mask[~mask.any(axis=1), int(ActionType.DO_NOTHING)] = True
+
+        states_t = self._stage("states", states, torch.float32)
+        mask_t   = self._stage("mask", mask, torch.bool)
+        with torch.inference_mode():
+            log_probs, values = self._policy_value(states_t, mask_t)
+            actions   = gumbel_argmax(log_probs)
+            log_probs = log_probs.gather(1, actions.unsqueeze(1)).squeeze(1)
+        return actions.cpu().numpy(), log_probs.cpu().numpy(), values.cpu().numpy()
 
     # ── Store experience ──────────────────────────────────────────────────────
 
     def store(self, state, action, log_prob, reward, value, done):
-        self.buffer.store(state, action, log_prob, reward, value, done)
-        self.step_count += 1
+        self.store_batch(np.asarray(state)[None], [action], [log_prob],
+                         [reward], [value], [done])
 
-    def add_win_loss(self, won: bool):
-        """Add terminal win/loss bonus (c=0 for PPO, but kept for generality)."""
-        if self.win_loss_bonus != 0 and len(self.buffer.rewards) > 0:
-            self.buffer.rewards[-1] += self.win_loss_bonus * (1.0 if won else -1.0)
+    def store_batch(self, states, actions, log_probs, rewards, values, dones):
+        """Store one time step for every environment (arrays of shape (N, ...))."""
+        self.buffer.store(states, actions, log_probs, rewards, values, dones)
+        self.step_count += len(actions)
+
+    def mark_terminal(self, env_idx: int = 0):
+        """Flag env_idx's most recent transition as the end of its episode."""
+        if len(self.buffer) > 0:
+            self.buffer.dones[len(self.buffer) - 1, env_idx] = 1.0
+
+    def add_win_loss(self, won: bool, env_idx: int = 0):
+        """
+        Add terminal win/loss bonus to env_idx's most recent transition
+        (c=0 for PPO, but kept for generality).
+        """
+        if self.win_loss_bonus != 0 and len(self.buffer) > 0:
+            self.buffer.rewards[len(self.buffer) - 1, env_idx] += self.win_loss_bonus * (1.0 if won else -1.0)
 
     # ── PPO update ────────────────────────────────────────────────────────────
 
@@ -215,62 +339,70 @@ class PPOAgent:
         if len(self.buffer) == 0:
             return {}
 
-        # Convert to tensors
-        states    = torch.FloatTensor(np.array(self.buffer.states))
-        actions   = torch.LongTensor(self.buffer.actions)
-        old_lps   = torch.FloatTensor(self.buffer.log_probs)
-        rewards   = self.buffer.rewards
-        values    = self.buffer.values
-        dones     = self.buffer.dones
-
-        # Compute GAE advantages
-        advantages = self._compute_gae(rewards, values, dones)
-        returns    = advantages + torch.FloatTensor(values)
+        # Views of the filled (T, N, ...) rollout, flattened to T·N samples
+        T         = len(self.buffer)
+        rewards   = self.buffer.rewards[:T]
+        values    = self.buffer.values[:T]
+        dones     = self.buffer.dones[:T]
+
+        # Compute GAE advantages per environment, then flatten
+        advantages = self._compute_gae(rewards, values, dones).view(-1)
+        returns    = advantages + values.reshape(-1)
+        states     = self.buffer.states[:T].view(-1, STATE_DIM).to(self.device)
+        actions    = self.buffer.actions[:T].view(-1).to(self.device)
+        old_lps    = self.buffer.log_probs[:T].view(-1).to(self.device)
+        returns    = returns.to(self.device)
+        advantages = advantages.to(self.device)
         if len(advantages) > 1:
             advantages = (advantages - advantages.mean()) / (advantages.std() + 1e-8)
         else:
             advantages = advantages - advantages.mean()
 
-        # Build full log-prob masks (all actions allowed in training)
-        all_mask = torch.ones(len(states), ACTION_SPACE_SIZE, dtype=torch.bool)
-
         stats = {"actor_loss": 0.0, "critic_loss": 0.0, "entropy": 0.0}
         n_batches = 0
 
-        for _ in range(self.n_epochs):
-            indices = torch.randperm(len(states))
-            for start in range(0, len(states), self.batch_size):
-                idx = indices[start:start + self.batch_size]
-                if len(idx) < 2:
-                    continue
+        # One argsort of uniform noise gives an independent permutation per
+        # epoch on the parameters' device. Trimming each to a multiple of the
+        # minibatch size leaves only full minibatches (none below 2 samples).
+        N       = len(states)
+        bs      = min(self.batch_size, N)
+        n_used  = N - N % bs if N >= 2 else 0
+        if bs == n_used == N:
+            # Full batch: one optimizer step per epoch, order is irrelevant
+            batches = torch.arange(n_used, device=self.device).expand(self.n_epochs, 1, n_used)
+        else:
+            perms   = torch.rand(self.n_epochs, N, device=self.device).argsort(dim=1)
+            batches = perms[:, :n_used].reshape(self.n_epochs, -1, bs)
 
+        for epoch_batches in batches:
+            for idx in epoch_batches:
                 sb  = states[idx]
                 ab  = actions[idx]
                 olp = old_lps[idx]
                 adv = advantages[idx]
                 ret = returns[idx]
 
-                log_probs_all = self.actor(sb, all_mask[idx])
-                new_lps  = log_probs_all.gather(1, ab.unsqueeze(1)).squeeze(1)
-                entropy  = -(log_probs_all.exp() * log_probs_all).sum(dim=-1).mean()
+                with self._autocast():
+                    # All actions are allowed in training, so the actor runs unmasked
+                    log_probs_all, values_pred = self._policy_value(sb)
+                    new_lps  = log_probs_all.gather(1, ab.unsqueeze(1)).squeeze(1)
+                    entropy  = -(log_probs_all.exp() * log_probs_all).sum(dim=-1).mean()
 
-                ratio        = (new_lps - olp).exp()
-                surr1        = ratio * adv
-                surr2        = torch.clamp(ratio, 1 - self.clip_eps, 1 + self.clip_eps) * adv
-                actor_loss   = -torch.min(surr1, surr2).mean()
+                    ratio        = (new_lps - olp).exp()
+                    surr1        = ratio * adv
+                    surr2        = torch.clamp(ratio, 1 - self.clip_eps, 1 + self.clip_eps) * adv
+                    actor_loss   = -torch.min(surr1, surr2).mean()
 
-                values_pred  = self.critic(sb)
-                critic_loss  = nn.MSELoss()(values_pred, ret)
+                    critic_loss  = F.mse_loss(values_pred.float(), ret)
 
-                loss = actor_loss + self.value_coef * critic_loss - self.entropy_coef * entropy
+                    loss = actor_loss + self.value_coef * critic_loss - self.entropy_coef * entropy
 
                 self.opt.zero_grad()
-                loss.backward()
-                nn.utils.clip_grad_norm_(
-                    list(self.actor.parameters()) + list(self.critic.parameters()),
-                    self.max_grad_norm
-                )
-                self.opt.step()
+                self.scaler.scale(loss).backward()
+                self.scaler.unscale_(self.opt)
+                nn.utils.clip_grad_norm_(self._params, self.max_grad_norm)
+                self.scaler.step(self.opt)
+                self.scaler.update()
 
                 stats["actor_loss"]  += actor_loss.item()
                 stats["critic_loss"] += critic_loss.item()
@@ -283,16 +415,27 @@ class PPOAgent:
         return stats
 
     def _compute_gae(self, rewards, values, dones) -> torch.Tensor:
-        advantages = torch.zeros(len(rewards))
-        gae = 0.0
-        for t in reversed(range(len(rewards))):
-            next_value = values[t + 1] if t + 1 < len(values) else 0.0
-            delta = rewards[t] + self.gamma * next_value * (1 - dones[t]) - values[t]
-            gae   = delta + self.gamma * self.lam * (1 - dones[t]) * gae
-            advantages[t] = gae
+        """
+        GAE over a (T, N) rollout; each column is one environment.
+        TD residuals are computed for the whole grid at once, leaving only
+        the reverse accumulation as a loop over T (N-wide per step).
+        """
+        not_done    = 1.0 - dones
+        next_values = torch.zeros_like(values)
+        next_values[:-1] = values[1:]
+        deltas = rewards + self.gamma * next_values * not_done - values
+        decay  = self.gamma * self.lam * not_done
+
+        advantages = torch.empty_like(deltas)
+        advantages[-1] = deltas[-1]
+        for t in range(len(deltas) - 2, -1, -1):
+            advantages[t] = deltas[t] + decay[t] * advantages[t + 1]
         return advantages
 
     def save(self, path: str):
+        if self.shared_backbone:
+            torch.save({"actor_critic": self.actor_critic.state_dict()}, path)
+            return
         torch.save({
             "actor":  self.actor.state_dict(),
             "critic": self.critic.state_dict(),
@@ -300,5 +443,8 @@ class PPOAgent:
 
     def load(self, path: str):
         ckpt = torch.load(path, map_location="cpu")
+        if self.shared_backbone:
+            self.actor_critic.load_state_dict(ckpt["actor_critic"])
+            return
         self.actor.load_state_dict(ckpt["actor"])
         self.critic.load_state_dict(ckpt["critic"])
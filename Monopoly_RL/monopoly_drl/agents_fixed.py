@@ -13,33 +13,44 @@ All agents:
 """
 
 import random
+import numpy as np
+from functools import lru_cache
 from typing import List, Optional
 
 from .constants import (
-    PROPERTY_IDS, REAL_ESTATE_IDS, COLOR_GROUPS, PROPERTIES,
-    RAILROAD_IDS, UTILITY_IDS, NUM_PLAYERS, JAIL_BAIL
+    PROPERTY_IDS, PROPERTY_IDX, REAL_ESTATE_IDS, PRICE_ARR, HOUSE_PRICE_ARR,
+    COLOR_GROUPS, GROUP_MASK, COLOR_OF_SQ, GROUP_FLAT, GROUP_STARTS,
+    COLOR_NAMES, GROUP_MATRIX, GROUP_SIZES,
+    RAILROAD_IDS, UTILITY_IDS, OTHERS_IDX, JAIL_BAIL
 )
-from .actions import ActionType, OFFSETS, TRADE_CASH_LEVELS
+from .actions import ActionType, OFFSETS, NUM_TRADE_CASH, TRADE_PLAYER_STRIDE
 from .env import MonopolyEnv, TradeOffer
+from . import _hot
 
 
 class FixedPolicyAgent:
     """Base class for all fixed-policy agents."""
 
+    __slots__ = ("player_id", "priority_order", "priority_order_arr", "priority_order_rev",
+                 "priority_indices", "mortgage_actions_rev")
+
     def __init__(self, player_id: int, priority_order: List[int] = None):
         self.player_id     = player_id
         self.priority_order = priority_order or PROPERTY_IDS  # highest priority first
 
+        # Array views of the priority order for vectorized checks; the
+        # _rev arrays run from lowest to highest priority
+        (self.priority_order_arr, self.priority_order_rev,
+         self.priority_indices, self.mortgage_actions_rev) = _priority_arrays(tuple(self.priority_order))
+
     def choose_action(self, env: MonopolyEnv) -> int:
-        allowed  = env.get_allowed_actions(self.player_id)
+        # Every check below is a membership test: one indexed load each
+        allowed  = env.get_allowed_mask(self.player_id)
         player   = env.players[self.player_id]
         props    = env.properties
 
         # --- Accept / reject incoming trade ---
-        pending = next(
-            (o for o in env.pending_trades.values() if o.to_player == self.player_id),
-            None
-        )
+        pending = env.pending_trades_by_recipient[self.player_id]
         if pending:
             if self._should_accept_trade(pending, env):
                 return int(ActionType.ACCEPT_TRADE)
@@ -47,13 +58,13 @@ class FixedPolicyAgent:
 
         # --- Jail escape ---
         if player.in_jail:
-            if int(ActionType.USE_GOOJ_CARD) in allowed:
+            if allowed[ActionType.USE_GOOJ_CARD]:
                 return int(ActionType.USE_GOOJ_CARD)
-            if int(ActionType.PAY_BAIL) in allowed:
+            if allowed[ActionType.PAY_BAIL]:
                 return int(ActionType.PAY_BAIL)
 
         # --- Buy property (post-roll) ---
-        if int(ActionType.BUY_PROPERTY) in allowed:
+        if allowed[ActionType.BUY_PROPERTY]:
             sq = player.position
             if sq in props and props[sq].owner is None:
                 if self._should_buy(player, props[sq], env):
@@ -75,23 +86,94 @@ class FixedPolicyAgent:
             return mort_action
 
         # --- Roll dice ---
-        if int(ActionType.ROLL_DICE) in allowed:
+        if allowed[ActionType.ROLL_DICE]:
             return int(ActionType.ROLL_DICE)
 
         return int(ActionType.END_TURN)
 
+    def choose_action_batched(self, envs: List[MonopolyEnv]) -> np.ndarray:
+        """
+        choose_action for this seat in several environments at once.
+
+        The rules apply in the same order. The table-driven ones (jail, buy,
+        build, mortgage, roll) are one NumPy expression over the stacked env
+        arrays. Only trade responses and the memoized trade candidates are
+        still looked up per environment. Returns an int32 array with one
+        action per environment.
+        """
+        pid     = self.player_id
+        n       = len(envs)
+        rows    = np.arange(n)
+        allowed = np.stack([env.get_allowed_mask(pid) for env in envs])   # (n, ACTION_SPACE_SIZE)
+        owners  = np.stack([env.owner_array for env in envs])             # (n, 40)
+        players = [env.players[pid] for env in envs]
+        cash    = np.array([p.cash for p in players], dtype=np.float64)
+        pos     = np.array([p.position for p in players], dtype=np.int64)
+        in_jail = np.array([p.in_jail for p in players], dtype=bool)
+
+        actions   = np.full(n, int(ActionType.END_TURN), dtype=np.int32)
+        undecided = np.ones(n, dtype=bool)
+
+        def decide(mask, action):
+            take = undecided & mask
+            actions[take] = action if np.isscalar(action) else action[take]
+            undecided[take] = False
+
+        # --- Accept / reject incoming trade ---
+        for i, env in enumerate(envs):
+            pending = env.pending_trades_by_recipient[pid]
+            if pending:
+                accept = self._should_accept_trade(pending, env)
+                actions[i]   = int(ActionType.ACCEPT_TRADE if accept else ActionType.DECLINE_TRADE)
+                undecided[i] = False
+
+        # --- Jail escape ---
+        decide(in_jail & allowed[:, ActionType.USE_GOOJ_CARD], int(ActionType.USE_GOOJ_CARD))
+        decide(in_jail & allowed[:, ActionType.PAY_BAIL], int(ActionType.PAY_BAIL))
+
+        # --- Buy property (post-roll): same rule as _should_buy ---
+        color     = COLOR_OF_SQ[pos]
+        price     = PRICE_ARR[pos]
+        owned     = ((owners == pid).astype(np.int8) @ GROUP_MATRIX.T)[rows, color]
+        completes = owned + 1 == GROUP_SIZES[color]
+        buy = (allowed[:, ActionType.BUY_PROPERTY] & (color >= 0)
+               & (owners[rows, pos] == -1) & (cash >= price)
+               & (completes | (cash >= price + 200)))
+        decide(buy, int(ActionType.BUY_PROPERTY))
+
+        # --- Build houses/hotels ---
+        build = (allowed[:, BUILD_ACTIONS] & (owners[:, BUILD_SQ] == pid)
+                 & (cash[:, None] >= BUILD_CASH))
+        hit   = build.argmax(axis=1)
+        decide(build[rows, hit], BUILD_ACTIONS[hit])
+
+        # --- Make a trade offer ---
+        for i in np.flatnonzero(undecided):
+            if envs[i].groups_in_reach[pid]:
+                action = _first_allowed(_trade_candidates(pid, owners[i].tobytes()), allowed[i])
+                if action is not None:
+                    actions[i]   = action
+                    undecided[i] = False
+
+        # --- Mortgage lowest-priority non-monopoly property if cash is low ---
+        mort  = self.mortgage_actions_rev
+        monos = np.stack([env.monopoly_array for env in envs])[:, self.priority_order_rev]
+        valid = allowed[:, mort] & ~monos & (cash < 200)[:, None]
+        hit   = valid.argmax(axis=1)
+        decide(valid[rows, hit], mort[hit])
+
+        # --- Roll dice ---
+        decide(allowed[:, ActionType.ROLL_DICE], int(ActionType.ROLL_DICE))
+        return actions
+
     # ── Decision logic ────────────────────────────────────────────────────────
 
     def _should_buy(self, player, prop, env) -> bool:
         """Buy if it creates a monopoly (affordably) or agent has cash to spare."""
-        if not player.can_afford(prop.price):
-            return False
-        color   = prop.color
-        group   = COLOR_GROUPS[color]
-        owned   = sum(1 for s in group if env.properties[s].owner == self.player_id)
-        if owned + 1 == len(group):  # completes monopoly
-            return True
-        return player.cash >= prop.price + 200  # keep $200 buffer
+        # Same rule as the hybrid agents' buy decision: one compiled kernel
+        return bool(_hot.buy_decision(
+            prop.square_id, float(player.cash), self.player_id, PRICE_ARR, env.owner_array,
+            COLOR_OF_SQ, GROUP_FLAT, GROUP_STARTS))
 
     def _should_accept_trade(self, offer: TradeOffer, env: MonopolyEnv) -> bool:
         """
@@ -103,18 +185,14 @@ class FixedPolicyAgent:
         pid = self.player_id
         # Check if accepting creates a monopoly
         if offer.requested_prop:
-            color = offer.requested_prop.color
-            group = COLOR_GROUPS[color]
-            owned_after = [s for s in group
-                           if env.properties[s].owner == pid
-                           or env.properties[s] == offer.offered_prop]
+            req_sq = offer.requested_prop.square_id
+            group  = GROUP_MASK[offer.requested_prop.color]
+            mask   = env.owner_bitmask[pid]
             # We'd gain requested_prop
-            if offer.requested_prop in [env.properties[s] for s in group]:
-                would_own = sum(1 for s in group if env.properties[s].owner == pid)
-                if offer.requested_prop.owner == offer.from_player:
-                    would_own += 1  # we gain it
-                if would_own == len(group):
-                    return True
+            if env.owner_array[req_sq] == offer.from_player:
+                mask |= 1 << req_sq  # we gain it
+            if mask & group == group:
+                return True
 
         # Net worth check (eq. 5)
         nwo = offer.net_worth()  # positive = offer is in our favour as recipient
@@ -122,49 +200,20 @@ class FixedPolicyAgent:
 
     def _best_build_action(self, allowed, env) -> Optional[int]:
         """Build a house/hotel on highest-priority monopoly property."""
-        player = env.players[self.player_id]
-        for i, sq in enumerate(REAL_ESTATE_IDS):
-            action = OFFSETS["improve_house"] + i
-            if action in allowed:
-                prop = env.properties[sq]
-                if prop.owner == self.player_id and player.can_afford(prop.data["house_price"] + 200):
-                    return action
-            action = OFFSETS["improve_hotel"] + i
-            if action in allowed:
-                prop = env.properties[sq]
-                if prop.owner == self.player_id and player.can_afford(prop.data["house_price"] + 200):
-                    return action
-        return None
+        pid   = self.player_id
+        build = (allowed[BUILD_ACTIONS] & (env.owner_array[BUILD_SQ] == pid)
+                 & (env.players[pid].cash >= BUILD_CASH))
+        hit   = build.argmax()
+        return int(BUILD_ACTIONS[hit]) if build[hit] else None
 
     def _make_trade_offer(self, allowed, env) -> Optional[int]:
         """
         Offer to trade low-value property we own for one that gives us a monopoly.
         """
-        pid    = self.player_id
-        others = [i for i in range(NUM_PLAYERS) if i != pid]
-        player = env.players[pid]
-
-        for color, group in COLOR_GROUPS.items():
-            owned = [s for s in group if env.properties[s].owner == pid]
-            if not owned:
-                continue
-            need  = [s for s in group if env.properties[s].owner not in (pid, None)]
-            if len(owned) + len(need) < len(group):
-                continue  # can't complete with one trade
-            for needed_sq in need:
-                needed_prop  = env.properties[needed_sq]
-                target       = needed_prop.owner
-                t_idx        = [i for i in range(NUM_PLAYERS) if i != pid].index(target)
-                prop_idx     = PROPERTY_IDS.index(needed_sq)
-                # Offer at market price
-                cash_idx = 1  # 1.0x price
-                if color == "railroad":
-                    action = (OFFSETS["buy_trade"] +
-                              t_idx * len(PROPERTY_IDS) * len(TRADE_CASH_LEVELS) +
-                              prop_idx * len(TRADE_CASH_LEVELS) + cash_idx)
-                    if action in allowed:
-                        return action
-        return None
+        if not env.groups_in_reach[self.player_id]:
+            return None   # no group that trades alone could complete
+        candidates = _trade_candidates(self.player_id, env.owner_array.tobytes())
+        return _first_allowed(candidates, allowed)
 
     def _maybe_mortgage(self, allowed, env) -> Optional[int]:
         """Mortgage lowest-priority non-monopoly property if cash is low."""
@@ -172,21 +221,94 @@ class FixedPolicyAgent:
         if player.cash >= 200:
             return None
         # Reverse priority: mortgage lowest-priority first
-        for sq in reversed(self.priority_order):
-            prop = env.properties.get(sq)
-            if prop is None:
-                continue
-            idx    = PROPERTY_IDS.index(sq)
-            action = OFFSETS["mortgage"] + idx
-            if action in allowed and not prop.is_monopoly:
-                return action
+        actions = self.mortgage_actions_rev
+        valid   = allowed[actions] & ~env.monopoly_array[self.priority_order_rev]
+        hit     = np.argmax(valid)
+        return int(actions[hit]) if valid[hit] else None
+
+
+@lru_cache(maxsize=None)
+def _priority_arrays(priority_order: tuple) -> tuple:
+    """Per-order arrays, built once and shared by every agent with that order."""
+    order     = [sq for sq in priority_order if sq in PROPERTY_IDX]
+    order_arr = np.array(order, dtype=np.int16)
+    indices   = np.array([PROPERTY_IDX[sq] for sq in order], dtype=np.int16)
+    mortgage_actions_rev = OFFSETS["mortgage"] + indices[::-1].astype(np.int64)
+    return order_arr, order_arr[::-1], indices, mortgage_actions_rev
+
+
+# ── Build tables ──────────────────────────────────────────────────────────────
+# Improve-house/hotel actions in the order the agent tries them (house then
+# hotel for each square, in REAL_ESTATE_IDS order), with the square each one
+# builds on and the cash it needs: house price plus a $200 buffer.
+
+BUILD_ACTIONS = np.array([OFFSETS[kind] + i for i in range(len(REAL_ESTATE_IDS))
+                          for kind in ("improve_house", "improve_hotel")], dtype=np.int64)
+BUILD_SQ      = np.repeat(REAL_ESTATE_IDS, 2)
+BUILD_CASH    = HOUSE_PRICE_ARR[BUILD_SQ] + 200
+
+
+# ── Memoized candidate enumeration ────────────────────────────────────────────
+# Which trade offers are worth trying depends only on who owns what, not on
+# the rest of the game state. Candidates are therefore cached per ownership
+# layout, in the order the agent tries them; the caller returns the first one
+# allowed. The key fully determines the result, so the cache never goes stale.
+# Candidates are int arrays so the allowed-mask lookup is one gather.
+
+
+@lru_cache(maxsize=8192)
+def _trade_candidates(pid: int, owners: bytes) -> np.ndarray:
+    """Buy-trade offers for squares that would complete one of our groups."""
+    # Per-color counts of our squares and opponents' squares in one pass over
+    # the group-membership matrix; only groups we can complete by trading
+    # (no bank-owned squares) remain
+    owner_array = np.frombuffer(owners, dtype=np.int8)
+    ours        = owner_array == pid
+    held        = ~ours & (owner_array != -1)
+    owned       = GROUP_MATRIX @ ours
+    needed      = GROUP_MATRIX @ held
+
+    candidates = []
+    for c in np.flatnonzero((owned > 0) & (owned + needed == GROUP_SIZES)):
+        color = COLOR_NAMES[c]
+        for needed_sq in np.flatnonzero(GROUP_MATRIX[c] * held).tolist():
+            target       = int(owner_array[needed_sq])
+            t_idx        = OTHERS_IDX[pid][target]
+            prop_idx     = PROPERTY_IDX[needed_sq]
+            # Offer at market price
+            cash_idx = 1  # 1.0x price
+            if color == "railroad":
+                candidates.append(OFFSETS["buy_trade"] + t_idx * TRADE_PLAYER_STRIDE +
+                                  prop_idx * NUM_TRADE_CASH + cash_idx)
+    return np.array(candidates, dtype=np.int64)
+
+
+def _first_allowed(candidates: np.ndarray, allowed: np.ndarray) -> Optional[int]:
+    """First candidate action set in the allowed mask, or None."""
+    if len(candidates) == 0:
         return None
+    hits = candidates[allowed[candidates]]
+    return int(hits[0]) if len(hits) else None
 
 
 # ── Concrete agents ───────────────────────────────────────────────────────────
+# Priority orders depend only on board constants, so they are built once here.
+
+# FP-B: railroads + Park Place (37) + Boardwalk (39), utilities last
+_FPB_HIGH  = tuple(RAILROAD_IDS) + (37, 39)
+_FPB_MID   = tuple(p for p in PROPERTY_IDS if p not in _FPB_HIGH and p not in UTILITY_IDS)
+_FPB_ORDER = _FPB_HIGH + _FPB_MID + tuple(UTILITY_IDS)
+
+# FP-C: railroads + orange + light-blue, utilities last
+_FPC_HIGH  = tuple(RAILROAD_IDS) + COLOR_GROUPS["orange"] + COLOR_GROUPS["lightblue"]
+_FPC_MID   = tuple(p for p in PROPERTY_IDS if p not in _FPC_HIGH and p not in UTILITY_IDS)
+_FPC_ORDER = _FPC_HIGH + _FPC_MID + tuple(UTILITY_IDS)
+
 
 class FPAgentA(FixedPolicyAgent):
     """Equal priority to all properties."""
+    __slots__ = ()
+
     def __init__(self, player_id: int):
         super().__init__(player_id, priority_order=PROPERTY_IDS)
 
@@ -196,25 +318,20 @@ class FPAgentB(FixedPolicyAgent):
     High priority: railroads + Park Place (37) + Boardwalk (39).
     Low priority: utilities (12, 28).
     """
+    __slots__ = ()
+
     def __init__(self, player_id: int):
-        high  = RAILROAD_IDS + [37, 39]
-        mid   = [p for p in PROPERTY_IDS if p not in high and p not in UTILITY_IDS]
-        low   = UTILITY_IDS
-        order = high + mid + low
-        super().__init__(player_id, priority_order=order)
+        super().__init__(player_id, priority_order=_FPB_ORDER)
 
 
 class FPAgentC(FixedPolicyAgent):
     """
     High priority: railroads + orange group (16,18,19) + light-blue (6,8,9).
     """
+    __slots__ = ()
+
     def __init__(self, player_id: int):
-        orange    = COLOR_GROUPS["orange"]
-        lightblue = COLOR_GROUPS["lightblue"]
-        high  = RAILROAD_IDS + orange + lightblue
-        mid   = [p for p in PROPERTY_IDS if p not in high and p not in UTILITY_IDS]
-        order = high + mid + UTILITY_IDS
-        super().__init__(player_id, priority_order=order)
+        super().__init__(player_id, priority_order=_FPC_ORDER)
 
 
 FP_AGENT_CLASSES = [FPAgentA, FPAgentB, FPAgentC]
\ No newline at end of file
@@ -0,0 +1,220 @@
+"""
+Asynchronous actor-learner training.
+
+Sample generation is decoupled from the gradient steps: num_workers
+producer processes each play whole games (a LearnerGame, i.e. the learning
+agent's seat against the three fixed-policy opponents) with their own copy
+of the learning agent, and push every finished game's learner transitions
+onto a multiprocessing.Queue. The main process is the learner: it feeds the
+games into the agent's buffer, updates, and every publish_every games
+publishes its current weights as a checkpoint file that the producers
+reload before their next game.
+
+The producers act with a policy that can be a few publishes old. DDQN is
+off-policy and does not mind; PPO's clipped ratio is computed against the
+log-probabilities of the snapshot that acted, which keeps the update
+bounded but makes it slightly off-policy.
+"""
+
+import os
+import queue
+import random
+import shutil
+import tempfile
+import multiprocessing as mp
+import numpy as np
+import torch
+from typing import Dict, Optional
+from collections import defaultdict
+
+from .vec_env import LearnerGame
+
+
+# ── Producer side ─────────────────────────────────────────────────────────────
+
+def _play_game(agent, game: LearnerGame, state, allowed, is_ppo: bool):
+    """
+    Play one game with agent from (state, allowed). Returns the game's
+    transitions and the first (state, allowed) of the next game.
+    """
+    states, actions, rewards, dones = [], [], [], []
+    log_probs, values, next_states  = [], [], []
+    while True:
+        if is_ppo:
+            action, log_prob, value = agent.choose_action_batch(state[None], [allowed])
+            log_probs.append(log_prob[0])
+            values.append(value[0])
+        else:
+            action = agent.choose_action_batch(state[None], [allowed])
+        states.append(state)
+        actions.append(action[0])
+
+        state, reward, done, allowed, info = game.step(action[0])
+        if done:
+            reward += agent.win_loss_bonus * (1.0 if info["won"] else -1.0)
+        rewards.append(reward)
+        dones.append(done)
+        if not is_ppo:
+            next_states.append(info["terminal_state"] if done else state)
+        if done:
+            break
+
+    traj = {
+        "states":  np.asarray(states, dtype=np.float32),
+        "actions": np.asarray(actions, dtype=np.int64),
+        "rewards": np.asarray(rewards, dtype=np.float32),
+        "dones":   np.asarray(dones, dtype=np.float32),
+        "won":     info["won"],
+    }
+    if is_ppo:
+        traj["log_probs"] = np.asarray(log_probs, dtype=np.float32)
+        traj["values"]    = np.asarray(values, dtype=np.float32)
+    else:
+        traj["next_states"] = np.asarray(next_states, dtype=np.float32)
+    return traj, state, allowed
+
+
+def _producer(agent, is_ppo: bool, hybrid: bool, max_rounds: int, seed: int,
+              games: mp.Queue, stop, version, epsilon, ckpt_path: str):
+    torch.set_num_threads(1)   # the producers share the machine with each other
+    torch.manual_seed(seed)
+    if hasattr(agent, "reseed"):
+        agent.reseed(seed)
+    game   = LearnerGame(agent_pid=agent.player_id, hybrid=hybrid,
+                         max_rounds=max_rounds, seed=seed)
+    loaded = version.value
+    state, allowed = game.reset()
+    try:
+        while not stop.is_set():
+            if version.value != loaded:
+                loaded = version.value
+                agent.load(ckpt_path)
+                if hasattr(agent, "epsilon"):
+                    agent.epsilon = epsilon.value
+            traj, state, allowed = _play_game(agent, game, state, allowed, is_ppo)
+            games.put(traj)
+    except KeyboardInterrupt:
+        pass
+
+
+# ── Learner side ──────────────────────────────────────────────────────────────
+
+def _learn_from(agent, traj: Dict, is_ppo: bool):
+    """Feed one game into the agent's buffer, updating like train() would."""
+    if is_ppo:
+        fields = ("states", "actions", "log_probs", "rewards", "values", "dones")
+        for t in range(len(traj["actions"])):
+            agent.store_batch(*(traj[name][t:t + 1] for name in fields))
+            if len(agent.buffer) >= agent.n_steps:
+                agent.update()
+    else:
+        agent.store_transitions(traj["states"], traj["actions"], traj["rewards"],
+                                traj["next_states"], traj["dones"])
+        # One gradient step per transition, as in the serial loop
+        for _ in range(len(traj["actions"])):
+            agent.update()
+
+
+def train_async(
+    learning_agent,
+    is_ppo: bool,
+    hybrid: bool,
+    n_games: int = 2000,
+    log_every: int = 50,
+    seed: int = 42,
+    num_workers: int = 4,
+    publish_every: int = 15,
+    max_rounds: int = 300,
+    start_method: Optional[str] = None,
+) -> Dict:
+    """
+    Train learning_agent on n_games games played by num_workers producer
+    processes (see module docstring). The learner publishes new weights to
+    the producers after every publish_every games it receives.
+
+    Returns the same history dict as train().
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+    torch.manual_seed(seed)
+
+    if start_method is None and "fork" in mp.get_all_start_methods():
+        start_method = "fork"
+    ctx       = mp.get_context(start_method)
+    games     = ctx.Queue(maxsize=2 * num_workers)   # producers block when the learner lags
+    stop      = ctx.Event()
+    version   = ctx.Value("i", 0, lock=False)   # bumped after each publish
+    epsilon   = ctx.Value("d", getattr(learning_agent, "epsilon", 0.0), lock=False)
+    ckpt_dir  = tempfile.mkdtemp(prefix="monopoly_async_")
+    ckpt_path = os.path.join(ckpt_dir, "snapshot.pt")
+
+    def publish():
+        # Write then rename, so a producer never loads a half-written file
+        learning_agent.save(ckpt_path + ".tmp")
+        os.replace(ckpt_path + ".tmp", ckpt_path)
+        if hasattr(learning_agent, "epsilon"):
+            epsilon.value = learning_agent.epsilon
+        version.value += 1
+
+    # Producer seeds are derived from (not equal to) seed, one stream each
+    worker_seeds = np.random.SeedSequence(seed).generate_state(num_workers)
+    producers = [
+        ctx.Process(target=_producer,
+                    args=(learning_agent, is_ppo, hybrid, max_rounds, int(s),
+                          games, stop, version, epsilon, ckpt_path),
+                    daemon=True)
+        for s in worker_seeds
+    ]
+
+    history = defaultdict(list)
+    wins_window  = 0
+    window_games = 0
+
+    print(f"\n{'='*60}")
+    print(f"Training {'Hybrid' if hybrid else 'Standard'} "
+          f"{'PPO' if is_ppo else 'DDQN'} agent (player {learning_agent.player_id})")
+    print(f"Total games: {n_games}  |  Log every: {log_every}  |  "
+          f"Producers: {num_workers} (async)")
+    print(f"{'='*60}")
+
+    for proc in producers:
+        proc.start()
+    try:
+        for game_num in range(1, n_games + 1):
+            traj = games.get()
+            _learn_from(learning_agent, traj, is_ppo)
+            if game_num % publish_every == 0:
+                publish()
+
+            wins_window  += int(traj["won"])
+            window_games += 1
+            if game_num % log_every == 0:
+                win_rate = wins_window / window_games * 100
+                history["win_rates"].append(win_rate)
+                history["games"].append(game_num)
+                history["rewards"].append(float(traj["rewards"].sum()))
+
+                eps_str = (f"  ε={learning_agent.epsilon:.3f}"
+                           if hasattr(learning_agent, "epsilon") else "")
+                print(f"  Game {game_num:5d} | Win rate (last {log_every}): "
+                      f"{win_rate:5.1f}%{eps_str}")
+
+                wins_window  = 0
+                window_games = 0
+    finally:
+        stop.set()
+        # A producer exits only once its queued games are flushed, so keep
+        # draining until they have all stopped
+        while any(proc.is_alive() for proc in producers):
+            try:
+                games.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        for proc in producers:
+            proc.join()
+        shutil.rmtree(ckpt_dir, ignore_errors=True)
+
+    if is_ppo and len(learning_agent.buffer) > 0:
+        learning_agent.update()
+
+    return dict(history)
@@ -3,6 +3,9 @@ Monopoly Constants - Board layout, property prices, color groups, etc.
 Based on the US standard Monopoly board.
 """
 
+import numpy as np
+from types import MappingProxyType
+
 # ── Board Squares ──────────────────────────────────────────────────────────────
 # Square index → name
 BOARD = {
@@ -95,15 +98,61 @@ PROPERTIES = {
     28: {"name": "Water Works",          "price": 150, "mortgage": 75,  "color": "utility",  "rent": [4, 10]},
 }
 
-PROPERTY_IDS = sorted(PROPERTIES.keys())   # list of 28 property squares
+# Read-only from here on: the memoized lookups elsewhere assume the board
+# never changes, so accidental mutation raises instead of going stale
+PROPERTIES = MappingProxyType({
+    sq: MappingProxyType({**pdata, "rent": tuple(pdata["rent"])})
+    for sq, pdata in PROPERTIES.items()
+})
+
+PROPERTY_IDS = tuple(sorted(PROPERTIES))   # the 28 property squares
+PROPERTY_IDX = {sq: i for i, sq in enumerate(PROPERTY_IDS)}   # square → index into PROPERTY_IDS
 REAL_ESTATE_IDS = [p for p in PROPERTY_IDS if PROPERTIES[p]["color"] not in ("railroad", "utility")]
 RAILROAD_IDS    = [p for p in PROPERTY_IDS if PROPERTIES[p]["color"] == "railroad"]
 UTILITY_IDS     = [p for p in PROPERTY_IDS if PROPERTIES[p]["color"] == "utility"]    
 
-# Color groups: color → list of property indices
+# Square-indexed property tables (0 for non-properties). RENT_ARR rows are
+# PROPERTIES' rent lists padded with zeros: railroads use the first 4
+# columns, utilities the first 2 (dice multipliers).
+PRICE_ARR       = np.zeros(len(BOARD), dtype=np.int32)
+MORTGAGE_ARR    = np.zeros(len(BOARD), dtype=np.int32)
+HOUSE_PRICE_ARR = np.zeros(len(BOARD), dtype=np.int32)
+RENT_ARR        = np.zeros((len(BOARD), 6), dtype=np.int32)
+for sq, pdata in PROPERTIES.items():
+    PRICE_ARR[sq]       = pdata["price"]
+    MORTGAGE_ARR[sq]    = pdata["mortgage"]
+    HOUSE_PRICE_ARR[sq] = pdata.get("house_price", 0)
+    RENT_ARR[sq, :len(pdata["rent"])] = pdata["rent"]
+
+# Color groups: color → tuple of property indices
 COLOR_GROUPS = {}
 for pid, pdata in PROPERTIES.items():
     COLOR_GROUPS.setdefault(pdata["color"], []).append(pid)
+COLOR_GROUPS = MappingProxyType({color: tuple(squares) for color, squares in COLOR_GROUPS.items()})
+COLOR_GROUP_SIZE = {color: len(squares) for color, squares in COLOR_GROUPS.items()}
+
+# Color group → bitmask with bit sq set for each square in the group
+GROUP_MASK = {color: sum(1 << sq for sq in squares) for color, squares in COLOR_GROUPS.items()}
+
+# Color group → square indices as an array, for vectorised lookups into
+# square-indexed arrays such as MonopolyEnv.owner_array
+COLOR_GROUP_IDX = {color: np.array(squares, dtype=np.int64)
+                   for color, squares in COLOR_GROUPS.items()}
+
+# All groups flattened, in COLOR_NAMES order: the squares of color id c are
+# GROUP_FLAT[GROUP_STARTS[c]:GROUP_STARTS[c + 1]]
+COLOR_NAMES  = list(COLOR_GROUPS)
+COLOR_ID     = {color: color_id for color_id, color in enumerate(COLOR_NAMES)}
+COLOR_OF_SQ  = np.full(len(BOARD), -1, dtype=np.int64)   # color id per square, -1 if unownable
+for color_id, color in enumerate(COLOR_NAMES):
+    COLOR_OF_SQ[list(COLOR_GROUPS[color])] = color_id
+GROUP_FLAT   = np.array([sq for color in COLOR_NAMES for sq in COLOR_GROUPS[color]], dtype=np.int64)
+GROUP_STARTS = np.cumsum([0] + [len(COLOR_GROUPS[c]) for c in COLOR_NAMES]).astype(np.int64)
+GROUP_SIZES  = np.diff(GROUP_STARTS)
+
+# GROUP_MATRIX[c, sq] = 1 if square sq belongs to color id c
+GROUP_MATRIX = np.zeros((len(COLOR_NAMES), len(BOARD)), dtype=np.int8)
+GROUP_MATRIX[COLOR_OF_SQ[GROUP_FLAT], GROUP_FLAT] = 1
 
 # Tax squares
 INCOME_TAX_SQUARE  = 4   # pay $200
@@ -130,6 +179,12 @@ TRADE_CASH_LEVELS = [0.75, 1.0, 1.25] # Work To Do Here
 
 NUM_PLAYERS = 4 # Work To Do Here
 
+# OTHERS[pid] → pid's opponents in seat order (the target order of trade actions)
+# OTHERS_IDX[pid][target] → index of target in OTHERS[pid]
+OTHERS     = tuple(tuple(o for o in range(NUM_PLAYERS) if o != pid) for pid in range(NUM_PLAYERS))
+OTHERS_IDX = tuple({other: t_idx for t_idx, other in enumerate(OTHERS[pid])}
+                   for pid in range(NUM_PLAYERS))
+
 
 CHANCE_CARDS = [
     "Advance to Go (Collect $200)",
@@ -10,21 +10,94 @@ Key fixes:
 
 """ Fix Trade Order """
 
-import random
+from bisect import bisect_right
 import numpy as np
+from functools import lru_cache
 from typing import Optional, List, Dict
 
 from .constants import (
-    BOARD, PROPERTIES, PROPERTY_IDS, REAL_ESTATE_IDS, COLOR_GROUPS,
+    BOARD, PROPERTIES, PROPERTY_IDS, REAL_ESTATE_IDS, COLOR_GROUPS, COLOR_ID, GROUP_MASK, PROPERTY_IDX,
     STARTING_CASH, GO_SALARY, JAIL_SQUARE, GO_TO_JAIL_SQUARE,
     INCOME_TAX_SQUARE, LUXURY_TAX_SQUARE, FREE_PARKING,
-    MAX_HOUSES, MAX_JAIL_TURNS, JAIL_BAIL, NUM_PLAYERS, TRADE_CASH_LEVELS
+    MAX_HOUSES, MAX_JAIL_TURNS, JAIL_BAIL, NUM_PLAYERS, OTHERS, TRADE_CASH_LEVELS
 )
-from .state import Player, Property, build_state_vector
-from .actions import ActionType, OFFSETS, ACTION_SPACE_SIZE, PROPERTY_IDS
+from .state import Player, Property, make_state_builder, property_net_worths
+from .actions import (
+    OFFSETS, SECTION_STARTS, ACTION_SPACE_SIZE, PROPERTY_IDS, TRADE_DECODE, EXCH_DECODE,
+    NUM_TRADE_CASH, TRADE_PLAYER_STRIDE,
+    DO_NOTHING, END_TURN, ROLL_DICE, BUY_PROPERTY, USE_GOOJ_CARD, PAY_BAIL,
+    DECLARE_BANKRUPT, ACCEPT_TRADE, DECLINE_TRADE
+)
+
+
+# ── Allowed-action tables ──────────────────────────────────────────────────────
+# Per-property constants for the allowed-action builders, which walk only the
+# squares a player owns (bits of owner_bitmask, ascending = PROPERTY_IDS order).
+
+_N_CASH          = NUM_TRADE_CASH
+_TRADE_STRIDE    = TRADE_PLAYER_STRIDE                          # per target index
+_RE_IDX          = {sq: i for i, sq in enumerate(REAL_ESTATE_IDS)}
+_REAL_ESTATE_MASK = sum(1 << sq for sq in REAL_ESTATE_IDS)
+_UNMORTGAGE_COST = {sq: int(PROPERTIES[sq]["mortgage"] * 1.1) for sq in PROPERTY_IDS}
+_BUY_OFFER_CASH  = {sq: int(PROPERTIES[sq]["price"] * 0.75) for sq in PROPERTY_IDS}
+_RAILROAD_MASK   = GROUP_MASK["railroad"]
+_UTILITY_MASK    = GROUP_MASK["utility"]
+
+# First action id per square in each property section, so the builders add
+# no OFFSETS lookups or index arithmetic per square
+_MORTGAGE_ID     = {sq: OFFSETS["mortgage"]      + i for sq, i in PROPERTY_IDX.items()}
+_UNMORTGAGE_ID   = {sq: OFFSETS["unmortgage"]    + i for sq, i in PROPERTY_IDX.items()}
+_HOUSE_ID        = {sq: OFFSETS["improve_house"] + i for sq, i in _RE_IDX.items()}
+_HOTEL_ID        = {sq: OFFSETS["improve_hotel"] + i for sq, i in _RE_IDX.items()}
+_SELL_HOUSE_ID   = {sq: OFFSETS["sell_house"]    + i for sq, i in _RE_IDX.items()}
+_SELL_HOTEL_ID   = {sq: OFFSETS["sell_hotel"]    + i for sq, i in _RE_IDX.items()}
+_BUY_TRADE_ID    = {sq: OFFSETS["buy_trade"]  + i * _N_CASH for sq, i in PROPERTY_IDX.items()}
+_SELL_TRADE_ID   = {sq: OFFSETS["sell_trade"] + i * _N_CASH for sq, i in PROPERTY_IDX.items()}
+_HOUSE_PRICE     = {sq: PROPERTIES[sq]["house_price"] for sq in REAL_ESTATE_IDS}
+
+# Record layout of MonopolyEnv.prop_state
+_PROP_STATE_DTYPE = np.dtype([("owner", np.int8), ("houses", np.int8),
+                              ("mortgaged", bool), ("is_monopoly", bool)])
+
+# Record layout of MonopolyEnv.player_table(), one row per pid
+_PLAYER_TABLE_DTYPE = np.dtype([("cash", np.int32), ("position", np.int8),
+                                ("bankrupt", bool), ("n_properties", np.int8),
+                                ("n_monopolies", np.int8)])
+
+# Trade sections decoded per sender pid straight to (target pid, square(s),
+# cash amount), so _make_trade_offer / _make_exchange_offer do no arithmetic
+_TRADE_OFFERS    = tuple(
+    tuple((OTHERS[pid][p], PROPERTY_IDS[i],
+           int(PROPERTIES[PROPERTY_IDS[i]]["price"] * TRADE_CASH_LEVELS[c]))
+          for p, i, c in TRADE_DECODE)
+    for pid in range(NUM_PLAYERS)
+)
+_EXCH_OFFERS     = tuple(
+    tuple((OTHERS[pid][p], PROPERTY_IDS[o], PROPERTY_IDS[r]) for p, o, r in EXCH_DECODE)
+    for pid in range(NUM_PLAYERS)
+)
+
+# All 36 (d1, d2) outcomes, so a roll is a single draw; rolls are drawn
+# from MonopolyEnv.rng in blocks of _DICE_BLOCK (see MonopolyEnv._do_roll)
+_DICE_PAIRS      = tuple((i // 6 + 1, i % 6 + 1) for i in range(36))
+_DICE_BLOCK      = 2048
+
+
+@lru_cache(maxsize=1 << 16)
+def _squares_of(mask: int) -> tuple:
+    """Squares whose bit is set in an owner bitmask, ascending."""
+    squares = []
+    while mask:
+        low   = mask & -mask
+        mask ^= low
+        squares.append(low.bit_length() - 1)
+    return tuple(squares)
 
 
 class TradeOffer:
+    __slots__ = ("from_player", "to_player", "offered_prop", "requested_prop",
+                 "cash_offered", "cash_requested", "_net_worth")
+
     def __init__(self, from_player, to_player,
                  offered_prop=None, requested_prop=None,
                  cash_offered=0, cash_requested=0):
@@ -35,10 +108,13 @@ class TradeOffer:
         self.cash_offered   = cash_offered
         self.cash_requested = cash_requested
 
+        # Offers are never modified once made, so the value is fixed
+        po = offered_prop.price   if offered_prop   else 0
+        pr = requested_prop.price if requested_prop else 0
+        self._net_worth = (po + cash_offered) - (pr + cash_requested)
+
     def net_worth(self):
-        po = self.offered_prop.price   if self.offered_prop   else 0
-        pr = self.requested_prop.price if self.requested_prop else 0
-        return (po + self.cash_offered) - (pr + self.cash_requested)
+        return self._net_worth
 
 
 # Phase constants
@@ -58,23 +134,69 @@ class MonopolyEnv:
       Then move to next player's PRE_ROLL.
     """
 
-    def __init__(self, agent_ids=None, max_rounds=200):
+    def __init__(self, agent_ids=None, max_rounds=200, seed=None):
         self.agent_ids  = agent_ids or [0]
         self.max_rounds = max_rounds
+        # Dice and turn order come from the env's own Generator. Without a
+        # seed it is seeded from np.random, so np.random.seed() still makes
+        # runs reproducible.
+        self.rng = np.random.default_rng(np.random.randint(2**63, dtype=np.int64) if seed is None else seed)
+        self._allowed_mask = np.zeros(ACTION_SPACE_SIZE, dtype=bool)  # reused by get_allowed_mask
+        self._mask_key     = None   # (version, pid) _allowed_mask was built for
+        self._version      = 0      # bumped whenever the game state may have changed
+        # pid → state-vector builder specialized for that seat (see _get_state)
+        self._state_builders = tuple(make_state_builder(pid) for pid in range(NUM_PLAYERS))
+        # action section → handler (see _apply_action)
+        self._section_handlers = tuple(getattr(self, "_act_" + name) for name in OFFSETS)
+        # (phase, is the active player) → allowed-action builder
+        self._allowed_builders = {
+            (PHASE_OUT_OF_TURN, False): self._allowed_out_of_turn,
+            (PHASE_PRE_ROLL,    True):  self._allowed_pre_roll,
+            (PHASE_POST_ROLL,   True):  self._allowed_post_roll,
+        }
         self.reset()
 
     # ── Setup ──────────────────────────────────────────────────────────────────
 
-    def reset(self):
+    def reset(self, seed=None):
+        """Start a new game; with seed, restart rng from it first."""
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        self._invalidate()
+        self._allowed_cache = [None] * NUM_PLAYERS   # pid → (version, allowed list)
+        self._state_cache   = [None] * NUM_PLAYERS   # pid → (version, inputs key, state vector)
+        self._board_version = 0   # bumped by the _set_* setters, i.e. whenever prop_state changes
         self.players    = [Player(i) for i in range(NUM_PLAYERS)]
         self.properties = {sq: Property(sq) for sq in PROPERTY_IDS}
+        self.prop_at    = [self.properties.get(sq) for sq in range(len(BOARD))]  # square → Property or None
+        self.active_others = list(OTHERS)   # pid → other non-bankrupt pids, rebuilt on bankruptcy
+        self.n_active      = NUM_PLAYERS    # players not bankrupt
+        # pid → Σ Property.calculate_net_worth() over the pid's properties,
+        # kept current by the _set_* setters (net worth = cash + asset_value)
+        self.asset_value   = [0.0] * NUM_PLAYERS
+        # Mutable per-square property state in one record array; the *_array
+        # attributes below are views of its fields
+        self.prop_state = np.zeros(len(BOARD), dtype=_PROP_STATE_DTYPE)
+        self.prop_state["owner"] = -1
+        self.owner_array = self.prop_state["owner"]        # square → owner pid, -1 = bank
+        self.owner_bitmask = [0] * NUM_PLAYERS   # pid → bit sq set for each owned square
+        # pid → bit COLOR_ID[c] set if pid owns part of group c and the rest is
+        # held by players, i.e. trades alone could complete it
+        self.groups_in_reach = [0] * NUM_PLAYERS
+        self.monopoly_array = self.prop_state["is_monopoly"]      # square → Property.is_monopoly
+        self.houses_array   = self.prop_state["houses"]           # square → Property.houses
+        self.built_bitmask  = 0                                   # bit sq set while sq has houses
+        self.mortgaged_array = self.prop_state["mortgaged"]       # square → Property.mortgaged
         self.turn_order = list(range(NUM_PLAYERS))
-        random.shuffle(self.turn_order)
+        self.rng.shuffle(self.turn_order)
+        self._refill_dice()
 
         self.current_turn_idx  = 0   # index into turn_order
         self.round             = 0
         self.done              = False
-        self.pending_trades    = {}  # sender_pid -> TradeOffer
+        self.pending_trades    = [None] * NUM_PLAYERS  # sender_pid -> TradeOffer or None
+        self.offer_order       = []   # senders with a pending offer, in posting order
+        self.pending_trades_by_recipient = [None] * NUM_PLAYERS  # recipient -> first offer to them
         self.last_dice         = (1, 1)
 
         # Phase tracking
@@ -82,7 +204,6 @@ class MonopolyEnv:
         self.has_rolled        = False   # has the active player rolled this turn?
         self.out_of_turn_pids  = []      # which players still get out-of-turn actions
 
-        self._update_monopolies()
         self._skip_bankrupt()
         return self._get_state(self.agent_ids[0])
 
@@ -124,6 +245,13 @@ class MonopolyEnv:
             self._advance_turn()
             return self._get_state(self.agent_ids[0]), 0.0, self.done, info
 
+        if action_idx == DO_NOTHING:
+            # No-op: the cached state vector and allowed actions stay valid
+            self._check_game_over()
+            reward = self._compute_reward(self.agent_ids[0])
+            return self._get_state(self.agent_ids[0]), reward, self.done, info
+
+        self._invalidate()
         self._apply_action(pid, action_idx, info)
         reward = self._compute_reward(self.agent_ids[0])
         self._check_game_over()
@@ -134,221 +262,240 @@ class MonopolyEnv:
         """
         Return valid action indices for the given player RIGHT NOW.
         If pid is None, uses whose_turn().
+
+        The list is cached per player until the next step()/reset(), since
+        the driver loop and the fixed-policy agents both ask for it on the
+        same state. Treat it as read-only.
         """
         if pid is None:
             pid = self.whose_turn()
 
-        player  = self.players[pid]
-        active  = self.active_player_id()
-        allowed = []
+        cached = self._allowed_cache[pid]
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        allowed = self._compute_allowed_actions(pid)
+        self._allowed_cache[pid] = (self._version, allowed)
+        return allowed
+
+    def _invalidate(self):
+        """Mark cached allowed actions stale; call after any state change."""
+        self._version += 1
 
+    def _compute_allowed_actions(self, pid: int) -> List[int]:
+        player = self.players[pid]
         if player.bankrupt:
-            return [int(ActionType.DO_NOTHING)]
+            return [DO_NOTHING]
+
+        build = self._allowed_builders.get((self.phase, pid == self.active_player_id()))
+        if build is None:
+            return [DO_NOTHING]
+        return build(pid, player)
+
+    # ── OUT-OF-TURN phase: non-active players ──────────────────────────────
+    def _allowed_out_of_turn(self, pid: int, player: Player) -> List[int]:
+        allowed = [END_TURN]  # skip out-of-turn
+        # Can respond to incoming trade
+        pending = self._incoming_trade(pid)
+        if pending:
+            allowed.append(ACCEPT_TRADE)
+            allowed.append(DECLINE_TRADE)
+        # Can make trade offers
+        allowed += self._trade_offer_actions(pid)
+        return allowed
 
-        # ── OUT-OF-TURN phase: non-active players ──────────────────────────
-        if self.phase == PHASE_OUT_OF_TURN:
-            if pid != active:
-                allowed.append(int(ActionType.END_TURN))  # skip out-of-turn
-                # Can respond to incoming trade
-                pending = self._incoming_trade(pid)
-                if pending:
-                    allowed.append(int(ActionType.ACCEPT_TRADE))
-                    allowed.append(int(ActionType.DECLINE_TRADE))
-                # Can make trade offers
-                allowed += self._trade_offer_actions(pid)
-                return allowed if allowed else [int(ActionType.END_TURN)]
-
-        # ── PRE-ROLL phase: active player before rolling ───────────────────
-        if self.phase == PHASE_PRE_ROLL and pid == active:
-            allowed.append(int(ActionType.END_TURN))  # end pre-roll, go to post-roll
+    # ── PRE-ROLL phase: active player before rolling ───────────────────────
+    def _allowed_pre_roll(self, pid: int, player: Player) -> List[int]:
+        allowed = [END_TURN]  # end pre-roll, go to post-roll
 
-            # Jail options
-            if player.in_jail:
-                if player.gooj_card:
-                    allowed.append(int(ActionType.USE_GOOJ_CARD))
-                if player.can_afford(JAIL_BAIL):
-                    allowed.append(int(ActionType.PAY_BAIL))
-
-            # Mortgage / unmortgage
-            allowed += self._mortgage_actions(pid)
-
-            # Build / sell houses
-            allowed += self._improve_actions(pid)
-
-            # Trade offers
-            allowed += self._trade_offer_actions(pid)
-
-            # Respond to incoming trade
-            pending = self._incoming_trade(pid)
-            if pending:
-                allowed.append(int(ActionType.ACCEPT_TRADE))
-                allowed.append(int(ActionType.DECLINE_TRADE))
-
-            return allowed if allowed else [int(ActionType.END_TURN)]
-
-        # ── POST-ROLL phase: active player rolls then handles landing ──────
-        if self.phase == PHASE_POST_ROLL and pid == active:
-            if not self.has_rolled:
-                # Must roll first
-                if player.in_jail:
-                    if player.gooj_card:
-                        allowed.append(int(ActionType.USE_GOOJ_CARD))
-                    if player.can_afford(JAIL_BAIL):
-                        allowed.append(int(ActionType.PAY_BAIL))
-                allowed.append(int(ActionType.ROLL_DICE))
-                return allowed
+        # Jail options
+        if player.in_jail:
+            if player.gooj_card:
+                allowed.append(USE_GOOJ_CARD)
+            if player.cash >= JAIL_BAIL:
+                allowed.append(PAY_BAIL)
 
-            else:
-                # Already rolled — decide on landing square
-                sq   = player.position
-                prop = self.properties.get(sq)
+        # Mortgage / unmortgage
+        allowed += self._mortgage_actions(pid)
 
-                if prop and prop.owner is None and player.can_afford(prop.price):
-                    allowed.append(int(ActionType.BUY_PROPERTY))
+        # Build / sell houses
+        allowed += self._improve_actions(pid)
 
-                # Can also mortgage to raise cash, or end turn
-                allowed += self._mortgage_actions(pid)
-                allowed.append(int(ActionType.END_TURN))
+        # Trade offers
+        allowed += self._trade_offer_actions(pid)
 
-                if player.cash < 0:
-                    allowed.append(int(ActionType.DECLARE_BANKRUPT))
+        # Respond to incoming trade
+        pending = self._incoming_trade(pid)
+        if pending:
+            allowed.append(ACCEPT_TRADE)
+            allowed.append(DECLINE_TRADE)
 
-                return allowed if allowed else [int(ActionType.END_TURN)]
+        return allowed
 
-        return [int(ActionType.DO_NOTHING)]
+    # ── POST-ROLL phase: active player rolls then handles landing ──────────
+    def _allowed_post_roll(self, pid: int, player: Player) -> List[int]:
+        allowed = []
+        if not self.has_rolled:
+            # Must roll first
+            if player.in_jail:
+                if player.gooj_card:
+                    allowed.append(USE_GOOJ_CARD)
+                if player.cash >= JAIL_BAIL:
+                    allowed.append(PAY_BAIL)
+            allowed.append(ROLL_DICE)
+            return allowed
 
-    # ── Action dispatch ────────────────────────────────────────────────────────
+        # Already rolled — decide on landing square
+        prop = self.prop_at[player.position]
+        if prop and prop.owner is None and player.cash >= prop.price:
+            allowed.append(BUY_PROPERTY)
 
-    def _apply_action(self, pid: int, action_idx: int, info: dict):
-        player = self.players[pid]
-        active = self.active_player_id()
+        # Can also mortgage to raise cash, or end turn
+        allowed += self._mortgage_actions(pid)
+        allowed.append(END_TURN)
 
-        # ── Binary actions ─────────────────────────────────────────────────
-        if action_idx < OFFSETS["mortgage"]:
-            atype = ActionType(action_idx)
+        if player.cash < 0:
+            allowed.append(DECLARE_BANKRUPT)
 
-            if atype in (ActionType.DO_NOTHING,):
-                pass  # no-op
+        return allowed
 
-            elif atype == ActionType.END_TURN:
-                self._handle_end_turn(pid)
+    def get_allowed_mask(self, pid: int = None) -> np.ndarray:
+        """
+        get_allowed_actions as a bool[ACTION_SPACE_SIZE] mask, so membership
+        tests are a single index. The array is a buffer owned by the env and
+        overwritten whenever the state or pid changes; copy it to keep it.
+        """
+        if pid is None:
+            pid = self.whose_turn()
+        mask = self._allowed_mask
+        if self._mask_key != (self._version, pid):
+            mask.fill(False)
+            mask[self.get_allowed_actions(pid)] = True
+            self._mask_key = (self._version, pid)
+        return mask
 
-            elif atype == ActionType.ROLL_DICE:
-                if self.phase == PHASE_POST_ROLL and not self.has_rolled:
-                    self._do_roll(pid, info)
+    # ── Action dispatch ────────────────────────────────────────────────────────
+    # The action space is a run of contiguous sections (see actions.OFFSETS);
+    # _apply_action finds the section with one bisect and calls its handler
+    # with the section-local index.
 
-            elif atype == ActionType.BUY_PROPERTY:
-                if self.phase == PHASE_POST_ROLL and self.has_rolled:
-                    self._do_buy(pid)
+    def _apply_action(self, pid: int, action_idx: int, info: dict):
+        section = bisect_right(SECTION_STARTS, action_idx) - 1
+        self._section_handlers[section](pid, action_idx - SECTION_STARTS[section], info)
 
-            elif atype == ActionType.USE_GOOJ_CARD:
-                if player.gooj_card and player.in_jail:
-                    player.gooj_card  = False
-                    player.in_jail    = False
-                    player.jail_turns = 0
+    # ── Binary actions ─────────────────────────────────────────────────────
+    def _act_binary(self, pid: int, atype: int, info: dict):
+        player = self.players[pid]
 
-            elif atype == ActionType.PAY_BAIL:
-                if player.in_jail and player.can_afford(JAIL_BAIL):
-                    player.cash      -= JAIL_BAIL
-                    player.in_jail    = False
-                    player.jail_turns = 0
+        if atype == DO_NOTHING:
+            pass  # no-op
 
-            elif atype == ActionType.DECLARE_BANKRUPT:
-                self._do_bankrupt(pid)
+        elif atype == END_TURN:
+            self._handle_end_turn(pid)
 
-            elif atype == ActionType.ACCEPT_TRADE:
-                self._do_accept_trade(pid)
+        elif atype == ROLL_DICE:
+            if self.phase == PHASE_POST_ROLL and not self.has_rolled:
+                self._do_roll(pid, info)
 
-            elif atype == ActionType.DECLINE_TRADE:
-                # Remove the offer directed at this player
-                for sid in list(self.pending_trades):
-                    if self.pending_trades[sid].to_player == pid:
-                        del self.pending_trades[sid]
-                        break
+        elif atype == BUY_PROPERTY:
+            if self.phase == PHASE_POST_ROLL and self.has_rolled:
+                self._do_buy(pid)
 
-            return
+        elif atype == USE_GOOJ_CARD:
+            if player.gooj_card and player.in_jail:
+                player.gooj_card  = False
+                player.in_jail    = False
+                player.jail_turns = 0
 
-        # ── Mortgage ───────────────────────────────────────────────────────
-        if action_idx < OFFSETS["unmortgage"]:
-            local = action_idx - OFFSETS["mortgage"]
-            prop  = self.properties[PROPERTY_IDS[local]]
-            if prop.owner == pid and not prop.mortgaged and prop.houses == 0:
-                prop.mortgaged = True
-                player.cash   += prop.mortgage_v
-            return
+        elif atype == PAY_BAIL:
+            if player.in_jail and player.can_afford(JAIL_BAIL):
+                player.cash      -= JAIL_BAIL
+                player.in_jail    = False
+                player.jail_turns = 0
 
-        # ── Unmortgage ─────────────────────────────────────────────────────
-        if action_idx < OFFSETS["improve_house"]:
-            local = action_idx - OFFSETS["unmortgage"]
-            prop  = self.properties[PROPERTY_IDS[local]]
-            cost  = int(prop.mortgage_v * 1.1)
-            if prop.owner == pid and prop.mortgaged and player.can_afford(cost):
-                prop.mortgaged = False
-                player.cash   -= cost
-            return
+        elif atype == DECLARE_BANKRUPT:
+            self._do_bankrupt(pid, info)
 
-        # ── Improve house ──────────────────────────────────────────────────
-        if action_idx < OFFSETS["improve_hotel"]:
-            local = action_idx - OFFSETS["improve_house"]
-            prop  = self.properties[REAL_ESTATE_IDS[local]]
-            hp    = prop.data["house_price"]
-            if (prop.owner == pid and prop.is_monopoly
-                    and prop.houses < MAX_HOUSES and player.can_afford(hp)):
-                prop.houses += 1
-                player.cash -= hp
-            return
+        elif atype == ACCEPT_TRADE:
+            self._do_accept_trade(pid)
 
-        # ── Improve hotel ──────────────────────────────────────────────────
-        if action_idx < OFFSETS["sell_house"]:
-            local = action_idx - OFFSETS["improve_hotel"]
-            prop  = self.properties[REAL_ESTATE_IDS[local]]
-            hp    = prop.data["house_price"]
-            if (prop.owner == pid and prop.is_monopoly
-                    and prop.houses == MAX_HOUSES and player.can_afford(hp)):
-                prop.houses  = 5
-                player.cash -= hp
-            return
+        elif atype == DECLINE_TRADE:
+            # Remove the offer directed at this player
+            offer = self.pending_trades_by_recipient[pid]
+            if offer is not None:
+                self._withdraw_offer(offer.from_player)
 
-        # ── Sell house ─────────────────────────────────────────────────────
-        if action_idx < OFFSETS["sell_hotel"]:
-            local = action_idx - OFFSETS["sell_house"]
-            prop  = self.properties[REAL_ESTATE_IDS[local]]
-            if prop.owner == pid and 1 <= prop.houses <= MAX_HOUSES:
-                prop.houses -= 1
-                player.cash += prop.data["house_price"] // 2
-            return
+    # ── Mortgage ───────────────────────────────────────────────────────────
+    def _act_mortgage(self, pid: int, local: int, info: dict):
+        player = self.players[pid]
+        prop   = self.prop_at[PROPERTY_IDS[local]]
+        if prop.owner == pid and not prop.mortgaged and prop.houses == 0:
+            self._set_mortgaged(prop, True)
+            player.cash   += prop.mortgage_v
 
-        # ── Sell hotel ─────────────────────────────────────────────────────
-        if action_idx < OFFSETS["sell_prop"]:
-            local = action_idx - OFFSETS["sell_hotel"]
-            prop  = self.properties[REAL_ESTATE_IDS[local]]
-            if prop.owner == pid and prop.houses == 5:
-                prop.houses  = MAX_HOUSES
-                player.cash += prop.data["house_price"] // 2
-            return
+    # ── Unmortgage ─────────────────────────────────────────────────────────
+    def _act_unmortgage(self, pid: int, local: int, info: dict):
+        player = self.players[pid]
+        prop   = self.prop_at[PROPERTY_IDS[local]]
+        cost   = int(prop.mortgage_v * 1.1)
+        if prop.owner == pid and prop.mortgaged and player.can_afford(cost):
+            self._set_mortgaged(prop, False)
+            player.cash   -= cost
+
+    # ── Improve house ──────────────────────────────────────────────────────
+    def _act_improve_house(self, pid: int, local: int, info: dict):
+        player = self.players[pid]
+        prop   = self.prop_at[REAL_ESTATE_IDS[local]]
+        hp     = prop.data["house_price"]
+        if (prop.owner == pid and prop.is_monopoly
+                and prop.houses < MAX_HOUSES and player.can_afford(hp)):
+            self._set_houses(prop, prop.houses + 1)
+            player.cash -= hp
+
+    # ── Improve hotel ──────────────────────────────────────────────────────
+    def _act_improve_hotel(self, pid: int, local: int, info: dict):
+        player = self.players[pid]
+        prop   = self.prop_at[REAL_ESTATE_IDS[local]]
+        hp     = prop.data["house_price"]
+        if (prop.owner == pid and prop.is_monopoly
+                and prop.houses == MAX_HOUSES and player.can_afford(hp)):
+            self._set_houses(prop, 5)
+            player.cash -= hp
+
+    # ── Sell house ─────────────────────────────────────────────────────────
+    def _act_sell_house(self, pid: int, local: int, info: dict):
+        player = self.players[pid]
+        prop   = self.prop_at[REAL_ESTATE_IDS[local]]
+        if prop.owner == pid and 1 <= prop.houses <= MAX_HOUSES:
+            self._set_houses(prop, prop.houses - 1)
+            player.cash += prop.data["house_price"] // 2
 
-        # ── Sell property to bank ──────────────────────────────────────────
-        if action_idx < OFFSETS["buy_trade"]:
-            local = action_idx - OFFSETS["sell_prop"]
-            prop  = self.properties[PROPERTY_IDS[local]]
-            if prop.owner == pid and prop.houses == 0:
-                player.cash  += prop.mortgage_v
-                player.properties.remove(prop)
-                prop.owner    = None
-                prop.mortgaged = False
-                self._update_monopolies()
-            return
+    # ── Sell hotel ─────────────────────────────────────────────────────────
+    def _act_sell_hotel(self, pid: int, local: int, info: dict):
+        player = self.players[pid]
+        prop   = self.prop_at[REAL_ESTATE_IDS[local]]
+        if prop.owner == pid and prop.houses == 5:
+            self._set_houses(prop, MAX_HOUSES)
+            player.cash += prop.data["house_price"] // 2
 
-        # ── Trade offers ───────────────────────────────────────────────────
-        if action_idx < OFFSETS["sell_trade"]:
-            self._make_trade_offer(pid, action_idx - OFFSETS["buy_trade"], "buy")
-            return
+    # ── Sell property to bank ──────────────────────────────────────────────
+    def _act_sell_prop(self, pid: int, local: int, info: dict):
+        player = self.players[pid]
+        prop   = self.prop_at[PROPERTY_IDS[local]]
+        if prop.owner == pid and prop.houses == 0:
+            player.cash  += prop.mortgage_v
+            player.properties.remove(prop)
+            self._set_owner(prop, None)
+            self._set_mortgaged(prop, False)
 
-        if action_idx < OFFSETS["exch_trade"]:
-            self._make_trade_offer(pid, action_idx - OFFSETS["sell_trade"], "sell")
-            return
+    # ── Trade offers ───────────────────────────────────────────────────────
+    def _act_buy_trade(self, pid: int, local: int, info: dict):
+        self._make_trade_offer(pid, local, "buy")
+
+    def _act_sell_trade(self, pid: int, local: int, info: dict):
+        self._make_trade_offer(pid, local, "sell")
 
-        self._make_exchange_offer(pid, action_idx - OFFSETS["exch_trade"])
+    def _act_exch_trade(self, pid: int, local: int, info: dict):
+        self._make_exchange_offer(pid, local)
 
     # ── Turn / phase advancement ───────────────────────────────────────────────
 
@@ -395,10 +542,13 @@ class MonopolyEnv:
         self.phase            = PHASE_PRE_ROLL
         self.has_rolled       = False
         self.out_of_turn_pids = []
-        self.pending_trades   = {}
+        self.pending_trades   = [None] * NUM_PLAYERS
+        self.offer_order      = []
+        self.pending_trades_by_recipient = [None] * NUM_PLAYERS
 
     def _advance_turn(self):
         """Force-advance (used when a bankrupt player is encountered)."""
+        self._invalidate()
         self._next_player()
 
     def _skip_bankrupt(self):
@@ -410,9 +560,17 @@ class MonopolyEnv:
 
     # ── Core game mechanics ────────────────────────────────────────────────────
 
+    def _refill_dice(self):
+        """Draw the next _DICE_BLOCK rolls as (d1, d2) tuples."""
+        self._dice        = [_DICE_PAIRS[i] for i in self.rng.integers(36, size=_DICE_BLOCK).tolist()]
+        self._dice_cursor = 0
+
     def _do_roll(self, pid: int, info: dict):
         player = self.players[pid]
-        d1, d2 = random.randint(1, 6), random.randint(1, 6)
+        if self._dice_cursor == _DICE_BLOCK:
+            self._refill_dice()
+        d1, d2 = self._dice[self._dice_cursor]
+        self._dice_cursor += 1
         self.last_dice  = (d1, d2)
         info["dice"]    = (d1, d2)
         self.has_rolled = True
@@ -460,11 +618,10 @@ class MonopolyEnv:
             player.cash = max(0, player.cash - 100)
             return
 
-        if sq not in self.properties:
+        prop = self.prop_at[sq]
+        if prop is None:
             return  # Go, Jail, Free Parking, Chance, Community Chest
 
-        prop = self.properties[sq]
-
         if prop.owner is None:
             info["can_buy"] = True
             return  # player decides whether to buy in get_allowed_actions
@@ -474,8 +631,9 @@ class MonopolyEnv:
 
         # Pay rent
         owner   = self.players[prop.owner]
-        n_rails = owner.railroads_owned()
-        n_utils = owner.utilities_owned()
+        held    = self.owner_bitmask[prop.owner]   # counts = Player.railroads_owned() / utilities_owned()
+        n_rails = bin(held & _RAILROAD_MASK).count("1")
+        n_utils = bin(held & _UTILITY_MASK).count("1")
         rent    = prop.get_rent(dice_total, n_rails, n_utils)
         payment = min(rent, player.cash)
         player.cash -= payment
@@ -483,42 +641,115 @@ class MonopolyEnv:
         info["rent_paid"] = payment
 
         if player.cash <= 0:
-            self._do_bankrupt(pid)
+            self._do_bankrupt(pid, info)
 
     def _do_buy(self, pid: int):
         player = self.players[pid]
         sq     = player.position
-        if sq not in self.properties:
+        prop   = self.prop_at[sq]
+        if prop is None:
             return
-        prop = self.properties[sq]
         if prop.owner is None and player.can_afford(prop.price):
-            prop.owner   = pid
+            self._set_owner(prop, pid)
             player.cash -= prop.price
             player.properties.append(prop)
-            self._update_monopolies()
 
-    def _do_bankrupt(self, pid: int):
+    def _do_bankrupt(self, pid: int, info: dict):
+        """Eliminate pid; step() reports it in info["newly_bankrupt"]."""
+        info.setdefault("newly_bankrupt", []).append(pid)
         player = self.players[pid]
         player.bankrupt = True
         player.cash     = 0
         for prop in player.properties:
-            prop.owner     = None
-            prop.houses    = 0
-            prop.mortgaged = False
+            self._set_owner(prop, None)
+            self._set_houses(prop, 0)
+            self._set_mortgaged(prop, False)
         player.properties = []
-        self._update_monopolies()
+        self._refresh_active_others()
+
+    def _refresh_active_others(self):
+        """Rebuild active_others and n_active; call after any player is marked bankrupt."""
+        self.active_others = [tuple(j for j in OTHERS[i] if not self.players[j].bankrupt)
+                              for i in range(NUM_PLAYERS)]
+        self.n_active      = sum(not p.bankrupt for p in self.players)
+
+    def _set_owner(self, prop: Property, pid: Optional[int]):
+        """
+        Single place property ownership changes, keeping owner_array,
+        owner_bitmask, groups_in_reach, the monopoly flags and asset_value
+        in sync.
+        """
+        masks  = self.owner_bitmask
+        assets = self.asset_value
+        bit    = 1 << prop.square_id
+        if prop.owner is not None:
+            masks[prop.owner]  &= ~bit
+            assets[prop.owner] -= prop.calculate_net_worth()
+        if pid is not None:
+            masks[pid] |= bit
+        prop.owner = pid
+        self.owner_array[prop.square_id] = -1 if pid is None else pid
+        self._board_version += 1
+
+        # Only the changed square's group can move in or out of reach
+        group    = GROUP_MASK[prop.color]
+        color    = 1 << COLOR_ID[prop.color]
+        held     = 0
+        for m in masks:
+            held |= m
+        held_all = held & group == group
+        mono     = False
+        for p in range(NUM_PLAYERS):
+            if held_all and masks[p] & group:
+                self.groups_in_reach[p] |= color
+                mono = mono or masks[p] & group == group
+            else:
+                self.groups_in_reach[p] &= ~color
+
+        # ...and only that group's monopoly flag can flip
+        # (the flag is part of the group's property values)
+        if mono != prop.is_monopoly:
+            for sq in COLOR_GROUPS[prop.color]:
+                other = self.prop_at[sq]
+                held  = other is not prop and other.owner is not None
+                if held:
+                    assets[other.owner] -= other.calculate_net_worth()
+                other.is_monopoly       = mono
+                self.monopoly_array[sq] = mono
+                if held:
+                    assets[other.owner] += other.calculate_net_worth()
+
+        if pid is not None:
+            assets[pid] += prop.calculate_net_worth()
+
+    def _set_houses(self, prop: Property, houses: int):
+        owner = prop.owner
+        if owner is not None:
+            self.asset_value[owner] -= prop.calculate_net_worth()
+        prop.houses = houses
+        if owner is not None:
+            self.asset_value[owner] += prop.calculate_net_worth()
+        self.houses_array[prop.square_id] = houses
+        self._board_version += 1
+        bit = 1 << prop.square_id
+        self.built_bitmask = self.built_bitmask | bit if houses else self.built_bitmask & ~bit
+
+    def _set_mortgaged(self, prop: Property, mortgaged: bool):
+        owner = prop.owner
+        if owner is not None:
+            self.asset_value[owner] -= prop.calculate_net_worth()
+        prop.mortgaged = mortgaged
+        if owner is not None:
+            self.asset_value[owner] += prop.calculate_net_worth()
+        self.mortgaged_array[prop.square_id] = mortgaged
+        self._board_version += 1
 
     def _do_accept_trade(self, pid: int):
-        offer  = None
-        sender = None
-        for sid, o in list(self.pending_trades.items()):
-            if o.to_player == pid:
-                offer  = o
-                sender = sid
-                break
+        offer = self.pending_trades_by_recipient[pid]
         if offer is None:
             return
-        del self.pending_trades[sender]
+        sender = offer.from_player
+        self._withdraw_offer(sender)
 
         s = self.players[sender]
         r = self.players[pid]
@@ -531,34 +762,20 @@ class MonopolyEnv:
             s.cash += offer.cash_requested
 
         if offer.offered_prop and offer.offered_prop.owner == sender:
-            offer.offered_prop.owner = pid
+            self._set_owner(offer.offered_prop, pid)
             s.properties.remove(offer.offered_prop)
             r.properties.append(offer.offered_prop)
 
         if offer.requested_prop and offer.requested_prop.owner == pid:
-            offer.requested_prop.owner = sender
+            self._set_owner(offer.requested_prop, sender)
             r.properties.remove(offer.requested_prop)
             s.properties.append(offer.requested_prop)
 
-        self._update_monopolies()
-
     # ── Trade offer construction ───────────────────────────────────────────────
 
     def _make_trade_offer(self, pid: int, local_idx: int, mode: str):
-        n_props    = len(PROPERTY_IDS)
-        n_cash     = len(TRADE_CASH_LEVELS)
-        player_idx = local_idx // (n_props * n_cash)
-        rem        = local_idx % (n_props * n_cash)
-        prop_idx   = rem // n_cash
-        price_idx  = rem % n_cash
-
-        others     = [i for i in range(NUM_PLAYERS) if i != pid]
-        if player_idx >= len(others):
-            return
-        target_pid  = others[player_idx]
-        prop        = self.properties[PROPERTY_IDS[prop_idx]]
-        multiplier  = TRADE_CASH_LEVELS[price_idx]
-        cash_amount = int(prop.price * multiplier)
+        target_pid, sq, cash_amount = _TRADE_OFFERS[pid][local_idx]
+        prop = self.prop_at[sq]
 
         if mode == "buy":
             if prop.owner != target_pid:
@@ -573,124 +790,190 @@ class MonopolyEnv:
                                offered_prop=prop,
                                cash_requested=cash_amount)
 
-        self.pending_trades[pid] = offer
+        self._post_offer(offer)
 
     def _make_exchange_offer(self, pid: int, local_idx: int):
-        n_props    = len(PROPERTY_IDS)
-        player_idx = local_idx // (n_props * (n_props - 1))
-        rem        = local_idx % (n_props * (n_props - 1))
-        offer_idx  = rem // (n_props - 1)
-        req_raw    = rem % (n_props - 1)
-        req_idx    = req_raw if req_raw < offer_idx else req_raw + 1
-
-        others = [i for i in range(NUM_PLAYERS) if i != pid]
-        if player_idx >= len(others):
-            return
-        target_pid   = others[player_idx]
-        offered_prop = self.properties[PROPERTY_IDS[offer_idx]]
-        req_prop     = self.properties[PROPERTY_IDS[req_idx]]
+        target_pid, offer_sq, req_sq = _EXCH_OFFERS[pid][local_idx]
+        offered_prop = self.prop_at[offer_sq]
+        req_prop     = self.prop_at[req_sq]
 
         if offered_prop.owner != pid or req_prop.owner != target_pid:
             return
         if offered_prop.houses > 0 or req_prop.houses > 0:
             return
 
-        self.pending_trades[pid] = TradeOffer(
+        self._post_offer(TradeOffer(
             pid, target_pid,
             offered_prop=offered_prop,
             requested_prop=req_prop
-        )
+        ))
+
+    def _post_offer(self, offer: TradeOffer):
+        """Record (or replace, keeping its place in line) the sender's pending offer."""
+        if self.pending_trades[offer.from_player] is None:
+            self.offer_order.append(offer.from_player)
+        self.pending_trades[offer.from_player] = offer
+        self._index_recipients()
+
+    def _withdraw_offer(self, sender: int):
+        self.pending_trades[sender] = None
+        self.offer_order.remove(sender)
+        self._index_recipients()
+
+    def _index_recipients(self):
+        """
+        Rebuild pending_trades_by_recipient. A recipient with several offers
+        sees the one posted first.
+        """
+        by_recipient = [None] * NUM_PLAYERS
+        for sender in self.offer_order:
+            offer = self.pending_trades[sender]
+            if by_recipient[offer.to_player] is None:
+                by_recipient[offer.to_player] = offer
+        self.pending_trades_by_recipient = by_recipient
 
     # ── Helpers for allowed actions ────────────────────────────────────────────
 
+    # The builders only visit the squares a player owns, so their cost grows
+    # with holdings rather than with the 28 properties on the board.
+
     def _mortgage_actions(self, pid: int) -> List[int]:
-        player  = self.players[pid]
-        allowed = []
-        for i, sq in enumerate(PROPERTY_IDS):
-            prop = self.properties[sq]
-            if prop.owner == pid:
-                if not prop.mortgaged and prop.houses == 0:
-                    allowed.append(OFFSETS["mortgage"] + i)
-                cost = int(prop.mortgage_v * 1.1)
-                if prop.mortgaged and player.can_afford(cost):
-                    allowed.append(OFFSETS["unmortgage"] + i)
+        cash      = self.players[pid].cash
+        props     = self.prop_at
+        unm_cost  = _UNMORTGAGE_COST
+        allowed   = []
+        append    = allowed.append
+        for sq in _squares_of(self.owner_bitmask[pid]):
+            prop = props[sq]
+            if prop.mortgaged:
+                if cash >= unm_cost[sq]:
+                    append(_UNMORTGAGE_ID[sq])
+            elif prop.houses == 0:
+                append(_MORTGAGE_ID[sq])
         return allowed
 
     def _improve_actions(self, pid: int) -> List[int]:
-        player  = self.players[pid]
-        allowed = []
-        for i, sq in enumerate(REAL_ESTATE_IDS):
-            prop = self.properties[sq]
-            if prop.owner != pid:
-                continue
-            hp = prop.data["house_price"]
-            if prop.is_monopoly and prop.houses < MAX_HOUSES and player.can_afford(hp):
-                allowed.append(OFFSETS["improve_house"] + i)
-            if prop.is_monopoly and prop.houses == MAX_HOUSES and player.can_afford(hp):
-                allowed.append(OFFSETS["improve_hotel"] + i)
-            if 1 <= prop.houses < 5:
-                allowed.append(OFFSETS["sell_house"] + i)
-            if prop.houses == 5:
-                allowed.append(OFFSETS["sell_hotel"] + i)
+        cash      = self.players[pid].cash
+        props     = self.prop_at
+        hp        = _HOUSE_PRICE
+        allowed   = []
+        append    = allowed.append
+        for sq in _squares_of(self.owner_bitmask[pid] & _REAL_ESTATE_MASK):
+            prop   = props[sq]
+            houses = prop.houses
+            if prop.is_monopoly and cash >= hp[sq]:
+                if houses < MAX_HOUSES:
+                    append(_HOUSE_ID[sq])
+                elif houses == MAX_HOUSES:
+                    append(_HOTEL_ID[sq])
+            if 1 <= houses < 5:
+                append(_SELL_HOUSE_ID[sq])
+            elif houses == 5:
+                append(_SELL_HOTEL_ID[sq])
         return allowed
 
     def _trade_offer_actions(self, pid: int) -> List[int]:
         """Only return trade actions for properties that actually exist and are owned."""
-        if pid in self.pending_trades:
+        if self.pending_trades[pid] is not None:
             return []
-        allowed = []
-        player  = self.players[pid]
-        others  = [i for i in range(NUM_PLAYERS) if i != pid and not self.players[i].bankrupt]
-
-        for t_idx, target_pid in enumerate(others):
-            target = self.players[target_pid]
-            for i, sq in enumerate(PROPERTY_IDS):
-                prop = self.properties[sq]
-                # Buy offer: target owns it, we want it
-                if prop.owner == target_pid and prop.houses == 0 and player.can_afford(int(prop.price * 0.75)):
-                    for j in range(3):
-                        allowed.append(OFFSETS["buy_trade"] + t_idx * len(PROPERTY_IDS) * 3 + i * 3 + j)
-                # Sell offer: we own it
-                if prop.owner == pid and prop.houses == 0:
-                    for j in range(3):
-                        allowed.append(OFFSETS["sell_trade"] + t_idx * len(PROPERTY_IDS) * 3 + i * 3 + j)
+        allowed   = []
+        cash      = self.players[pid].cash
+        masks     = self.owner_bitmask
+        ours      = masks[pid]
+        unbuilt   = ~self.built_bitmask    # squares with houses can't be traded
+        buy_cash  = _BUY_OFFER_CASH
+        buy_id    = _BUY_TRADE_ID
+        sell_id   = _SELL_TRADE_ID
+        n_cash    = _N_CASH
+
+        for t_idx, target_pid in enumerate(self.active_others[pid]):
+            base   = t_idx * _TRADE_STRIDE
+            theirs = masks[target_pid]
+            for sq in _squares_of((theirs | ours) & unbuilt):
+                if theirs >> sq & 1:
+                    # Buy offer: target owns it, we want it
+                    if cash >= buy_cash[sq]:
+                        first = buy_id[sq] + base
+                        allowed += range(first, first + n_cash)
+                else:
+                    # Sell offer: we own it
+                    first = sell_id[sq] + base
+                    allowed += range(first, first + n_cash)
         return allowed
 
     def _incoming_trade(self, pid: int) -> Optional[TradeOffer]:
-        for o in self.pending_trades.values():
-            if o.to_player == pid:
-                return o
-        return None
+        return self.pending_trades_by_recipient[pid]
 
     # ── Reward & game-over ─────────────────────────────────────────────────────
 
-    def _update_monopolies(self):
-        for color, squares in COLOR_GROUPS.items():
-            owners  = [self.properties[s].owner for s in squares]
-            is_mono = (len(set(owners)) == 1 and owners[0] is not None)
-            for s in squares:
-                self.properties[s].is_monopoly = is_mono
-
     def _compute_reward(self, pid: int) -> float:
-        active = [p for p in self.players if not p.bankrupt]
-        if len(active) <= 1:
+        if self.n_active <= 1:
             return 1.0 if not self.players[pid].bankrupt else -1.0
-        nw_self  = self.players[pid].net_worth()
-        nw_other = sum(p.net_worth() for p in active if p.player_id != pid)
+        # Player.net_worth() from the maintained asset_value
+        players  = self.players
+        assets   = self.asset_value
+        nw_self  = players[pid].cash + assets[pid]
+        nw_other = sum(players[o].cash + assets[o] for o in self.active_others[pid])
         if nw_other == 0:
             return 1.0
         return nw_self / (nw_other + 1e-8)
 
     def _check_game_over(self):
-        active = [p for p in self.players if not p.bankrupt]
-        if len(active) <= 1 or self.round >= self.max_rounds:
+        if self.n_active <= 1 or self.round >= self.max_rounds:
             self.done = True
 
     def _get_state(self, pid: int) -> np.ndarray:
-        return build_state_vector(self.players, self.properties, pid)
+        """
+        State vector for pid, cached like get_allowed_actions (step() returns
+        it and the drivers ask again). Most steps (out-of-turn passes, ending
+        a turn) change nothing the vector reads, so after a state change the
+        cached vector is still reused while its inputs — prop_state, tracked
+        by _board_version, and the player features — are unchanged.
+        Treat it as read-only.
+        """
+        cached = self._state_cache[pid]
+        if cached is not None and cached[0] == self._version:
+            return cached[2]
+        key = (self._board_version,
+               [(p.position, p.cash, p.in_jail, p.gooj_card) for p in self.players])
+        if cached is not None and cached[1] == key:
+            state = cached[2]
+        else:
+            state = self._state_builders[pid](self.players, self.prop_state)
+        self._state_cache[pid] = (self._version, key, state)
+        return state
+
+    def net_worth(self, pid: int) -> float:
+        """Player.net_worth() for pid in O(1), from the maintained asset_value."""
+        return self.players[pid].cash + self.asset_value[pid]
+
+    def net_worths(self) -> np.ndarray:
+        """Player.net_worth() for every pid, computed from prop_state in one pass."""
+        owners = self.owner_array
+        owned  = owners >= 0
+        assets = np.bincount(owners[owned], weights=property_net_worths(self.prop_state)[owned],
+                             minlength=NUM_PLAYERS)
+        return assets + [p.cash for p in self.players]
+
+    def player_table(self) -> np.ndarray:
+        """
+        Snapshot of the per-player fields as a pid-indexed record array (see
+        _PLAYER_TABLE_DTYPE). Property and monopoly counts come from
+        prop_state, so reading them costs no walk over Player.properties.
+        """
+        table  = np.empty(NUM_PLAYERS, dtype=_PLAYER_TABLE_DTYPE)
+        table["cash"]     = [p.cash for p in self.players]
+        table["position"] = [p.position for p in self.players]
+        table["bankrupt"] = [p.bankrupt for p in self.players]
+        owners = self.owner_array
+        owned  = owners >= 0
+        table["n_properties"] = np.bincount(owners[owned], minlength=NUM_PLAYERS)
+        table["n_monopolies"] = np.bincount(owners[owned & self.monopoly_array],
+                                            minlength=NUM_PLAYERS)
+        return table
 
     def winner(self) -> Optional[int]:
         active = [p for p in self.players if not p.bankrupt]
         if len(active) == 1:
             return active[0].player_id
-        return max(self.players, key=lambda p: p.net_worth()).player_id
\ No newline at end of file
+        return int(np.argmax(self.net_worths()))
\ No newline at end of file
@@ -3,15 +3,69 @@ Neural network architectures for PPO (actor-critic) and DDQN agents.
 State dim = 240, Action dim = ACTION_SPACE_SIZE
 """
 
+import copy
+import random
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
 import numpy as np
+from typing import Optional
 from .actions import ACTION_SPACE_SIZE
 
 STATE_DIM = 240
 
 
+def resolve_device(device) -> torch.device:
+    """torch.device for device; "auto" picks CUDA when it is available."""
+    if device == "auto":
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+    return torch.device(device)
+
+
+class PinnedStaging:
+    """
+    Copies NumPy batches to a CUDA device through reusable pinned host
+    buffers with non_blocking=True, one buffer per name (reallocated when
+    the shape changes). On other devices it is plain torch.as_tensor.
+    Refilling a buffer is only safe once its previous copy has completed;
+    the agents read their results back to the host before the next call,
+    which synchronizes.
+    """
+
+    def __init__(self, device):
+        self.device = torch.device(device)
+        self._bufs  = {}
+
+    def __call__(self, name: str, array, dtype: torch.dtype) -> torch.Tensor:
+        if self.device.type != "cuda":
+            return torch.as_tensor(array, dtype=dtype, device=self.device)
+        array = np.asarray(array)
+        buf   = self._bufs.get(name)
+        if buf is None or buf.shape != array.shape or buf.dtype != dtype:
+            buf = self._bufs[name] = torch.empty(array.shape, dtype=dtype).pin_memory()
+        buf.numpy()[...] = array
+        return buf.to(self.device, non_blocking=True)
+
+
+def _mask_logits_(logits: torch.Tensor, mask: torch.Tensor) -> torch.Tensor:
+    """
+    Push disallowed logits (mask False) to the dtype's lowest finite value,
+    in place. Their softmax weight is exactly 0 like with -inf, but rows
+    stay finite, so log_softmax and Categorical need no extra copies.
+    """
+    return logits.masked_fill_(mask.logical_not(), torch.finfo(logits.dtype).min)
+
+
+def gumbel_argmax(log_probs: torch.Tensor) -> torch.Tensor:
+    """
+    One categorical sample per row via the Gumbel-max trick:
+    argmax(log p + G) with G = -log(Exp(1)) noise, instead of exp() and
+    torch.multinomial. Masked actions stay far below any allowed one.
+    """
+    gumbel = torch.empty_like(log_probs).exponential_().log_().neg_()
+    return (gumbel.add_(log_probs)).argmax(dim=-1)
+
+
 class ActorNetwork(nn.Module):
     """
     PPO Actor: maps state → action probability distribution.
@@ -28,32 +82,60 @@ class ActorNetwork(nn.Module):
             nn.ReLU(),
             nn.Linear(hidden_dim // 2, ACTION_SPACE_SIZE),
         )
+        # Reused input buffers for get_action (not saved in the state_dict)
+        self.register_buffer("_state_buf", torch.zeros(1, STATE_DIM), persistent=False)
+        self.register_buffer("_mask_buf", torch.zeros(1, ACTION_SPACE_SIZE, dtype=torch.bool),
+                             persistent=False)
 
-    def forward(self, state: torch.Tensor, mask: torch.Tensor = None) -> torch.Tensor:
+    def forward_logits(self, state: torch.Tensor, mask: torch.Tensor = None) -> torch.Tensor:
         """
         Args:
             state : (batch, STATE_DIM)
             mask  : (batch, ACTION_SPACE_SIZE) bool tensor, True = allowed
         Returns:
-            log_probs : (batch, ACTION_SPACE_SIZE)
+            logits : (batch, ACTION_SPACE_SIZE), dtype minimum for disallowed actions
         """
         logits = self.net(state)
         if mask is not None:
-            logits = logits.masked_fill(~mask, float('-inf'))
-        return F.log_softmax(logits, dim=-1)
+            _mask_logits_(logits, mask)
+        return logits
+
+    def forward(self, state: torch.Tensor, mask: torch.Tensor = None) -> torch.Tensor:
+        """
+        Args:
+            state : (batch, STATE_DIM)
+            mask  : (batch, ACTION_SPACE_SIZE) bool tensor, True = allowed
+        Returns:
+            log_probs : (batch, ACTION_SPACE_SIZE)
+        """
+        return F.log_softmax(self.forward_logits(state, mask), dim=-1)
 
     def get_action(self, state: np.ndarray, allowed_actions: list):
         """Sample an action given allowed actions."""
-        state_t  = torch.FloatTensor(state).unsqueeze(0)
-        mask     = torch.zeros(1, ACTION_SPACE_SIZE, dtype=torch.bool)
-        mask[0, allowed_actions] = True
-        with torch.no_grad():
-            log_probs = self.forward(state_t, mask)
-        probs    = log_probs.exp().squeeze(0)
-        action   = torch.multinomial(probs, 1).item()
-        log_prob = log_probs[0, action].item()
+        self._state_buf.copy_(torch.from_numpy(state))
+        self._mask_buf.zero_()
+        self._mask_buf[0, allowed_actions] = True
+        with torch.inference_mode():
+            log_probs = self.forward(self._state_buf, self._mask_buf)
+            action    = gumbel_argmax(log_probs).item()
+            log_prob  = log_probs[0, action].item()
         return action, log_prob
 
+    def get_action_batch(self, states: np.ndarray, masks: np.ndarray):
+        """
+        Sample one action per row of a (N, STATE_DIM) state batch with a
+        single forward pass. masks is the (N, ACTION_SPACE_SIZE) bool allowed
+        mask. Returns (actions, log_probs) as arrays of shape (N,).
+        """
+        device   = self._state_buf.device
+        states_t = torch.as_tensor(states, dtype=torch.float32, device=device)
+        mask_t   = torch.as_tensor(masks, dtype=torch.bool, device=device)
+        with torch.inference_mode():
+            log_probs = self.forward(states_t, mask_t)
+            actions   = gumbel_argmax(log_probs)
+            chosen    = log_probs.gather(1, actions.unsqueeze(1)).squeeze(1)
+        return actions.cpu().numpy(), chosen.cpu().numpy()
+
 
 class CriticNetwork(nn.Module):
     """PPO Critic: maps state → scalar value estimate V(s)."""
@@ -73,13 +155,57 @@ class CriticNetwork(nn.Module):
         return self.net(state).squeeze(-1)
 
 
+class ActorCriticNetwork(nn.Module):
+    """
+    PPO actor and critic on one shared trunk: a single pass over the two
+    hidden_dim layers feeds both a policy head and a value head, instead
+    of running ActorNetwork and CriticNetwork over the same state.
+    """
+    def __init__(self, hidden_dim: int = 256):
+        super().__init__()
+        self.trunk = nn.Sequential(
+            nn.Linear(STATE_DIM, hidden_dim),
+            nn.ReLU(),
+            nn.Linear(hidden_dim, hidden_dim),
+            nn.ReLU(),
+        )
+        self.pi_head = nn.Sequential(
+            nn.Linear(hidden_dim, hidden_dim // 2),
+            nn.ReLU(),
+            nn.Linear(hidden_dim // 2, ACTION_SPACE_SIZE),
+        )
+        self.v_head = nn.Sequential(
+            nn.Linear(hidden_dim, hidden_dim // 2),
+            nn.ReLU(),
+            nn.Linear(hidden_dim // 2, 1),
+        )
+
+    def forward(self, state: torch.Tensor, mask: torch.Tensor = None):
+        """
+        Args:
+            state : (batch, STATE_DIM)
+            mask  : (batch, ACTION_SPACE_SIZE) bool tensor, True = allowed
+        Returns:
+            log_probs : (batch, ACTION_SPACE_SIZE)
+            value     : (batch,)
+        """
+        feat   = self.trunk(state)
+        logits = self.pi_head(feat)
+        if mask is not None:
+            _mask_logits_(logits, mask)
+        return F.log_softmax(logits, dim=-1), self.v_head(feat).squeeze(-1)
+
+
 class DDQNNetwork(nn.Module):
     """
     Double DQN network: maps state → Q-values for all actions.
     Uses dueling architecture for stability.
+    ε-exploration draws from the network's own random.Random (self.rng),
+    seeded with seed, or seeded from the global random module when seed is None.
     """
-    def __init__(self, hidden_dim: int = 256):
+    def __init__(self, hidden_dim: int = 256, seed: Optional[int] = None):
         super().__init__()
+        self.rng = random.Random(random.getrandbits(64) if seed is None else seed)
         self.feature = nn.Sequential(
             nn.Linear(STATE_DIM, hidden_dim),
             nn.ReLU(),
@@ -98,6 +224,10 @@ class DDQNNetwork(nn.Module):
             nn.ReLU(),
             nn.Linear(hidden_dim // 2, ACTION_SPACE_SIZE),
         )
+        # Reused input buffers for get_action (not saved in the state_dict)
+        self.register_buffer("_state_buf", torch.zeros(1, STATE_DIM), persistent=False)
+        self.register_buffer("_neg_inf_mask", torch.full((ACTION_SPACE_SIZE,), float('-inf')),
+                             persistent=False)
 
     def forward(self, state: torch.Tensor) -> torch.Tensor:
         feat  = self.feature(state)
@@ -108,16 +238,75 @@ class DDQNNetwork(nn.Module):
 
     def get_action(self, state: np.ndarray, allowed_actions: list, epsilon: float = 0.0):
         """ε-greedy action selection with action masking."""
-        if random.random() < epsilon:
-            return random.choice(allowed_actions)
-        state_t = torch.FloatTensor(state).unsqueeze(0)
-        with torch.no_grad():
-            q_values = self.forward(state_t).squeeze(0)
+        if self.rng.random() < epsilon:
+            return self.rng.choice(allowed_actions)
+        self._state_buf.copy_(torch.from_numpy(state))
         # Mask illegal actions
-        mask = torch.full((ACTION_SPACE_SIZE,), float('-inf'))
-        mask[allowed_actions] = 0.0
-        q_masked = q_values + mask
-        return q_masked.argmax().item()
+        self._neg_inf_mask.fill_(float('-inf'))
+        self._neg_inf_mask[allowed_actions] = 0.0
+        with torch.inference_mode():
+            q_values = self.forward(self._state_buf).squeeze(0)
+            return (q_values + self._neg_inf_mask).argmax().item()
+
+    def get_action_batch(self, states: np.ndarray, masks: np.ndarray, epsilon: float = 0.0):
+        """
+        ε-greedy actions for a (N, STATE_DIM) state batch with one forward
+        pass. masks is the (N, ACTION_SPACE_SIZE) bool allowed mask; every
+        row needs an allowed action. Returns an (N,) action array.
+        """
+        device   = self._state_buf.device
+        states_t = torch.as_tensor(states, dtype=torch.float32, device=device)
+        mask_t   = torch.as_tensor(masks, dtype=torch.bool, device=device)
+        with torch.inference_mode():
+            q_values = self.forward(states_t).masked_fill_(~mask_t, float('-inf'))
+            actions  = q_values.argmax(dim=1).cpu().numpy()
+        return epsilon_explore(actions, masks, epsilon, self.rng)
+
+
+def epsilon_explore(actions: np.ndarray, masks: np.ndarray, epsilon: float,
+                    rng: random.Random) -> np.ndarray:
+    """
+    Replace each greedy action by a uniformly random allowed one with
+    probability epsilon, drawing from rng. Modifies and returns actions.
+    A scalar rng.random() per row is cheaper than one NumPy draw for the
+    whole batch at these sizes, and only exploring rows are scanned.
+    """
+    for i in range(len(actions)):
+        if rng.random() < epsilon:
+            actions[i] = rng.choice(np.flatnonzero(masks[i]))
+    return actions
+
 
+def quantize_for_inference(net: nn.Module) -> nn.Module:
+    """
+    Int8 copy of net for CPU action selection: every nn.Linear is
+    dynamically quantized (int8 weights, per-batch activation scales).
+    The original module is left untouched; the copy is not trainable.
+    """
+    return torch.ao.quantization.quantize_dynamic(
+        copy.deepcopy(net).cpu().eval(), {nn.Linear}, dtype=torch.qint8)
+
+
+def script_for_inference(net: nn.Module) -> nn.Module:
+    """
+    Copy of net with its forward pass TorchScript-compiled and frozen
+    (weights folded in as constants), which cuts the per-layer dispatch
+    cost of small-batch forwards. The copy keeps its Python methods
+    (get_action etc.). If forward as a whole does not script, each
+    nn.Sequential stack is scripted instead and the rest stays eager.
+    The copy does not follow later updates to net and is not trainable.
+    """
+    net = copy.deepcopy(net).eval()
+    try:
+        net.forward = torch.jit.freeze(torch.jit.script(copy.deepcopy(net))).forward
+        return net
+    except RuntimeError:
+        pass
+    for name, child in net.named_children():
+        if isinstance(child, nn.Sequential):
+            try:
+                setattr(net, name, torch.jit.freeze(torch.jit.script(child)))
+            except RuntimeError:
+                pass
+    return net
 
-import random  # noqa – needed by DDQNNetwork.get_action
@@ -0,0 +1,112 @@
+"""
+Parallel fixed-policy games.
+
+Games between fixed-policy agents are independent of each other, so they
+are spread over a multiprocessing.Pool (root parallelization: one whole
+game per task). Workers are forked where the platform allows it, so the
+board tables built at import (constants, actions, _hot) are shared with
+the parent copy-on-write instead of being rebuilt in every worker.
+
+Each game g is seeded with seed + g, so the results do not depend on the
+number of workers or on how games are scheduled across them.
+"""
+
+import multiprocessing as mp
+import numpy as np
+from typing import Dict, List, Optional, Sequence
+
+from .env import MonopolyEnv
+from .agents_fixed import FPAgentA, FPAgentB, FPAgentC, FixedPolicyAgent
+from .actions import ActionType
+from .constants import NUM_PLAYERS
+
+
+# Seat i is played by DEFAULT_LINEUP[i]
+DEFAULT_LINEUP = (FPAgentA, FPAgentB, FPAgentC, FPAgentA)
+
+
+def play_until_done(env: MonopolyEnv, agents: List[FixedPolicyAgent],
+                    seed: Optional[int] = None) -> int:
+    """
+    Reset env (reseeding its dice from seed, if given) and play one game
+    with agents[pid] in every seat; returns the winner.
+    """
+    env.reset(seed=seed)
+    max_steps = env.max_rounds * NUM_PLAYERS * 30
+    steps     = 0
+    while not env.done and steps < max_steps:
+        steps += 1
+        pid = env.whose_turn()
+        if env.players[pid].bankrupt:
+            env._advance_turn()
+            continue
+
+        allowed = env.get_allowed_actions(pid)
+        if not allowed:
+            allowed = [int(ActionType.DO_NOTHING)]
+        action = agents[pid].choose_action(env)
+        if action not in allowed:
+            action = int(ActionType.END_TURN) if int(ActionType.END_TURN) in allowed else allowed[0]
+        env.step(action)
+    return env.winner()
+
+
+# ── Worker side ───────────────────────────────────────────────────────────────
+# One environment and one set of agents per worker process, reused for
+# every game it plays.
+
+_worker_env    = None
+_worker_agents = None
+
+
+def _init_worker(lineup: Sequence[type], max_rounds: int):
+    global _worker_env, _worker_agents
+    _worker_env    = MonopolyEnv(max_rounds=max_rounds)
+    _worker_agents = [cls(pid) for pid, cls in enumerate(lineup)]
+
+
+def _play_game(game_seed: int):
+    winner = play_until_done(_worker_env, _worker_agents, seed=game_seed)
+    return winner, _worker_env.round
+
+
+# ── Driver ────────────────────────────────────────────────────────────────────
+
+def run_games_parallel(
+    n_games: int,
+    workers: Optional[int] = None,
+    lineup: Sequence[type] = DEFAULT_LINEUP,
+    max_rounds: int = 300,
+    seed: int = 0,
+) -> Dict:
+    """
+    Play n_games fixed-policy games on `workers` processes (default: one
+    per CPU; workers=1 plays in-process). lineup[pid] is the agent class
+    in seat pid.
+
+    Returns {"wins": games won per seat, "win_rates": % per seat,
+             "mean_rounds": average game length in rounds}.
+    """
+    assert len(lineup) == NUM_PLAYERS, "lineup needs one agent class per seat"
+    seeds = range(seed, seed + n_games)
+
+    if workers == 1:
+        _init_worker(lineup, max_rounds)
+        results = [_play_game(s) for s in seeds]
+    else:
+        start_method = "fork" if "fork" in mp.get_all_start_methods() else None
+        ctx = mp.get_context(start_method)
+        with ctx.Pool(workers, initializer=_init_worker,
+                      initargs=(tuple(lineup), max_rounds)) as pool:
+            results = pool.map(_play_game, seeds,
+                               chunksize=max(1, n_games // (4 * (workers or mp.cpu_count()))))
+
+    wins = [0] * NUM_PLAYERS
+    for winner, _ in results:
+        wins[winner] += 1
+    rounds = [r for _, r in results]
+    return {
+        "wins":        wins,
+        "win_rates":   [w / max(n_games, 1) * 100 for w in wins],
+        "mean_rounds": float(np.mean(rounds)) if rounds else 0.0,
+    }
@@ -3,15 +3,21 @@ Game State: Player and Property data structures, plus the 240-dim state vector
 as described in the paper (Section IV-A).
 """
 import numpy as np
+from functools import partial
+from typing import Optional
 from .constants import (
     PROPERTY_IDS, REAL_ESTATE_IDS, COLOR_GROUPS, PROPERTIES,
-    NUM_PLAYERS, MAX_HOUSES, STARTING_CASH
+    OTHERS, MAX_HOUSES, STARTING_CASH, PRICE_ARR, MORTGAGE_ARR, HOUSE_PRICE_ARR,
+    NUM_PLAYERS
 )
 
 
 class Property:
     """Represents one purchasable property on the board."""
 
+    __slots__ = ("square_id", "data", "name", "price", "mortgage_v", "color",
+                 "owner", "mortgaged", "houses", "is_monopoly")
+
     def __init__(self, square_id: int):
         self.square_id   = square_id
         self.data        = PROPERTIES[square_id]
@@ -24,6 +30,16 @@ class Property:
         self.houses      = 0     # 0-4 houses  or  5 = hotel
         self.is_monopoly = False  # True if owner has full color group
 
+    def __getstate__(self):
+        # data is a read-only view into PROPERTIES, which does not pickle;
+        # __setstate__ looks it up again from square_id
+        return {name: getattr(self, name) for name in self.__slots__ if name != "data"}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+        self.data = PROPERTIES[self.square_id]
+
     @property
     def is_real_estate(self):
         return self.color not in ("railroad", "utility")
@@ -63,6 +79,9 @@ class Property:
 class Player:
     """Represents a single Monopoly player."""
 
+    __slots__ = ("player_id", "cash", "position", "in_jail", "jail_turns",
+                 "gooj_card", "bankrupt", "properties")
+
     def __init__(self, player_id: int):
         self.player_id  = player_id
         self.cash       = STARTING_CASH
@@ -94,9 +113,55 @@ class Player:
                 f"pos={self.position}, nw={self.net_worth():.0f})")
 
 
+def property_net_worths(prop_state: np.ndarray) -> np.ndarray:
+    """
+    Property.calculate_net_worth for every square at once, from a
+    square-indexed record array like MonopolyEnv.prop_state (0 for
+    non-properties). A hotel (houses == 5) is worth 5 house prices, and
+    railroads/utilities have no house price, so the improvement term is
+    just houses × house price.
+    """
+    mult = np.where(prop_state["is_monopoly"], 2.0, 1.5)
+    base = PRICE_ARR - np.where(prop_state["mortgaged"], MORTGAGE_ARR, 0)
+    return base * mult + prop_state["houses"] * HOUSE_PRICE_ARR
+
+
 # ── State Vector Construction ──────────────────────────────────────────────────
 
-def build_state_vector(players, properties_dict, agent_id: int) -> np.ndarray:
+_N_PROPS     = len(PROPERTY_IDS)
+# Owner one-hot per owner id: rows 0-3 = players, row 4 (= index -1) = bank
+_OWNER_LUT   = np.zeros((5, 5), dtype=np.float32)
+_OWNER_LUT[:4, :4] = np.eye(4)
+_PROP_SQ     = np.asarray(PROPERTY_IDS, dtype=np.int64)
+_PROP_IS_RE  = np.asarray([PROPERTIES[sq]["color"] not in ("railroad", "utility")
+                           for sq in PROPERTY_IDS], dtype=bool)
+
+
+def _player_writer(agent_id: int):
+    """
+    Player section writer specialized for agent_id: the seat order (agent
+    first, then OTHERS[agent_id]) is bound once, so each call is a single
+    16-value slice assignment with no per-call order tuple or loop.
+    """
+    a, b, c, d = (agent_id,) + OTHERS[agent_id]
+
+    def write_players(state, players):
+        p0 = players[a]; p1 = players[b]; p2 = players[c]; p3 = players[d]
+        state[:16] = (
+            p0.position / 39.0, min(p0.cash / 5000.0, 1.0), p0.in_jail, p0.gooj_card,
+            p1.position / 39.0, min(p1.cash / 5000.0, 1.0), p1.in_jail, p1.gooj_card,
+            p2.position / 39.0, min(p2.cash / 5000.0, 1.0), p2.in_jail, p2.gooj_card,
+            p3.position / 39.0, min(p3.cash / 5000.0, 1.0), p3.in_jail, p3.gooj_card,
+        )
+
+    return write_players
+
+
+_PLAYER_WRITERS = tuple(_player_writer(pid) for pid in range(NUM_PLAYERS))
+
+
+def build_state_vector(players, properties_dict, agent_id: int,
+                       out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Build the 240-dimensional state vector for the learning agent.
     
@@ -107,39 +172,59 @@ def build_state_vector(players, properties_dict, agent_id: int) -> np.ndarray:
           [owner_onehot(5), mortgaged, is_monopoly, improvement_fraction]
     
     The agent's own player comes first in the player section.
+    If out (a float32 array of 240) is given it is overwritten and returned
+    instead of allocating a new vector.
+    """
+    props = [properties_dict[sq] for sq in PROPERTY_IDS]
+    return _assemble_state(
+        out, players, _PLAYER_WRITERS[agent_id],
+        np.fromiter((-1 if p.owner is None else p.owner for p in props), dtype=np.int64, count=_N_PROPS),
+        np.fromiter((p.mortgaged for p in props), dtype=bool, count=_N_PROPS),
+        np.fromiter((p.is_monopoly for p in props), dtype=bool, count=_N_PROPS),
+        np.fromiter((p.houses for p in props), dtype=np.int64, count=_N_PROPS),
+    )
+
+
+def make_state_builder(agent_id: int):
+    """
+    build_state_vector_from_arrays with agent_id fixed, returned as
+    f(players, prop_state, out=None). MonopolyEnv builds one per seat at
+    construction. A partial of the module-level function (not a closure),
+    so envs holding builders stay picklable.
     """
-    state = np.zeros(240, dtype=np.float32)
-    idx   = 0
+    return partial(build_state_vector_from_arrays, agent_id=agent_id)
+
+
+def build_state_vector_from_arrays(players, prop_state: np.ndarray, agent_id: int,
+                                   out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    build_state_vector reading the property section from the env's
+    square-indexed record array (MonopolyEnv.prop_state) instead of the
+    Property objects.
+    """
+    rows = prop_state[_PROP_SQ]
+    return _assemble_state(out, players, _PLAYER_WRITERS[agent_id], rows["owner"],
+                           rows["mortgaged"], rows["is_monopoly"], rows["houses"])
+
+
+def _assemble_state(out, players, write_players, owners, mortgaged, is_monopoly, houses) -> np.ndarray:
+    """Write the state vector from per-property arrays in PROPERTY_IDS order."""
+    if out is None:
+        state = np.zeros(240, dtype=np.float32)
+    else:
+        state = out
+        state.fill(0.0)
 
     # ── Player features (16 dims) ──
-    order = [agent_id] + [i for i in range(NUM_PLAYERS) if i != agent_id]
-    for pid in order:
-        p = players[pid]
-        state[idx]   = p.position / 39.0
-        state[idx+1] = min(p.cash / 5000.0, 1.0)
-        state[idx+2] = float(p.in_jail)
-        state[idx+3] = float(p.gooj_card)
-        idx += 4
+    write_players(state, players)
 
     # ── Property features (224 dims) ──
-    for sq in PROPERTY_IDS:
-        prop = properties_dict[sq]
-        # owner: one-hot of size 5 (bank=all zeros, players 0-3)
-        owner_vec = np.zeros(5)
-        if prop.owner is not None:
-            owner_vec[prop.owner] = 1.0
-        state[idx:idx+5] = owner_vec
-        idx += 5
-        # mortgaged
-        state[idx]   = float(prop.mortgaged)
-        idx += 1
-        # is_monopoly
-        state[idx]   = float(prop.is_monopoly)
-        idx += 1
-        # improvement fraction (houses/4 for RE, 0 for others)
-        if prop.is_real_estate:
-            state[idx] = prop.houses / 5.0  # 5 = hotel
-        idx += 1
-
-    assert idx == 240, f"State vector size mismatch: {idx}"
+    block  = state[16:].reshape(_N_PROPS, 8)
+    # owner: one-hot of size 5 (bank=all zeros, players 0-3)
+    block[:, :5] = _OWNER_LUT.take(owners, axis=0)
+    block[:, 5] = mortgaged
+    block[:, 6] = is_monopoly
+    # improvement fraction (houses/5 for RE, 0 for others; 5 = hotel)
+    block[_PROP_IS_RE, 7] = houses[_PROP_IS_RE] / 5.0
+
     return state
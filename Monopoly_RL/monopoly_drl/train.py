@@ -9,11 +9,14 @@ import random
 import numpy as np
 from typing import List, Dict
 from collections import defaultdict
+from contextlib import nullcontext
 
 from .env import MonopolyEnv
+from .vec_env import VecMonopolyEnv
 from .agents_fixed import FPAgentA, FPAgentB, FPAgentC, FixedPolicyAgent
+from .agent_ppo import fixed_hybrid_action
 from .actions import ActionType
-from .constants import NUM_PLAYERS
+from .constants import NUM_PLAYERS, OTHERS
 
 
 def run_episode(env: MonopolyEnv,
@@ -60,7 +63,22 @@ def run_episode(env: MonopolyEnv,
         if not allowed:
             allowed = [int(ActionType.DO_NOTHING)]
 
+        forced = None
         if pid == agent_pid:
+            if len(allowed) == 1:
+                forced = allowed[0]
+            elif learning_agent.hybrid:
+                forced = fixed_hybrid_action(env, pid, allowed)
+
+        if forced is not None:
+            # ── Forced move or hybrid fixed-rule BUY / ACCEPT: no network
+            #    decision, so no transition (as in vec_env.LearnerGame) ──
+            # (prev_state stays paired with prev_action for DDQN)
+            state, reward, done, _ = env.step(forced)
+            total_reward += reward
+            steps        += 1
+
+        elif pid == agent_pid:
             # ── Learning agent ──────────────────────────────────────────
             if is_ppo:
                 action, log_prob, value = learning_agent.choose_action(state, env, allowed)
@@ -74,7 +92,8 @@ def run_episode(env: MonopolyEnv,
 
             if update_online:
                 if is_ppo:
-                    learning_agent.store(prev_state, action, log_prob, reward, value, done)
+                    # The observation the action was chosen on
+                    learning_agent.store(state, action, log_prob, reward, value, done)
                     if len(learning_agent.buffer) >= learning_agent.n_steps:
                         update_stats = learning_agent.update()
                 else:
@@ -103,6 +122,10 @@ def run_episode(env: MonopolyEnv,
 
     if update_online:
         if is_ppo:
+            # The game may have ended on a forced or an opponent move, after
+            # the agent's last stored transition
+            if env.done:
+                learning_agent.mark_terminal()
             learning_agent.add_win_loss(won)
             if len(learning_agent.buffer) > 0:
                 update_stats.update(learning_agent.update())
@@ -125,21 +148,36 @@ def train(
     n_games: int = 2000,
     log_every: int = 50,
     seed: int = 42,
+    num_envs: int = 1,
 ) -> Dict:
     """
     Main training function.
 
+    With num_envs > 1, rollouts are collected from num_envs games running
+    in parallel worker processes, batching the learning agent's forward
+    pass across them (see vec_env.VecMonopolyEnv). Both paths store only
+    the network's decisions: forced moves and, in hybrid mode, the
+    fixed-rule BUY / ACCEPT decisions are played without a transition, and
+    DDQN takes one gradient step per stored transition.
+
     Returns:
         history: dict with win_rates (list per log_every games) and other metrics
     """
     random.seed(seed)
     np.random.seed(seed)
+    if hasattr(learning_agent, "reseed"):
+        # Exploration gets its own stream, derived from (not equal to) seed
+        learning_agent.reseed(int(np.random.SeedSequence(seed).generate_state(1)[0]))
+
+    if num_envs > 1:
+        return train_vectorized(learning_agent, is_ppo, hybrid, n_games,
+                                log_every, seed, num_envs)
 
     agent_pid = learning_agent.player_id
     env       = MonopolyEnv(agent_ids=[agent_pid], max_rounds=300)
 
     # Create fixed-policy opponents with the remaining player IDs
-    other_pids = [i for i in range(NUM_PLAYERS) if i != agent_pid]
+    other_pids = OTHERS[agent_pid]
     fp_classes = [FPAgentA, FPAgentB, FPAgentC]
     fp_agents  = [fp_classes[i](other_pids[i]) for i in range(3)]
 
@@ -178,6 +216,95 @@ def train(
     return dict(history)
 
 
+def train_vectorized(
+    learning_agent,
+    is_ppo: bool,
+    hybrid: bool,
+    n_games: int = 2000,
+    log_every: int = 50,
+    seed: int = 42,
+    num_envs: int = 8,
+) -> Dict:
+    """
+    Training loop over num_envs parallel games. Each step stacks the
+    learning agent's observations into one (num_envs, 240) batch, picks all
+    actions with a single forward pass and steps every game at once.
+    Stops after n_games games have finished.
+    """
+    agent_pid = learning_agent.player_id
+    vec_env   = VecMonopolyEnv(num_envs, agent_pid=agent_pid, hybrid=hybrid,
+                               max_rounds=300, seed=seed)
+
+    history = defaultdict(list)
+    wins_window  = 0
+    window_games = 0
+    games_done   = 0
+    ep_rewards   = np.zeros(num_envs)
+
+    print(f"\n{'='*60}")
+    print(f"Training {'Hybrid' if hybrid else 'Standard'} "
+          f"{'PPO' if is_ppo else 'DDQN'} agent (player {agent_pid})")
+    print(f"Total games: {n_games}  |  Log every: {log_every}  |  Envs: {num_envs}")
+    print(f"{'='*60}")
+
+    states, allowed = vec_env.reset()
+    try:
+        while games_done < n_games:
+            if is_ppo:
+                actions, log_probs, values = learning_agent.choose_action_batch(states, allowed)
+            else:
+                actions = learning_agent.choose_action_batch(states, allowed)
+
+            next_states, rewards, dones, allowed, infos = vec_env.step(actions)
+            ep_rewards += rewards
+
+            # Sparse win/loss bonus on the last transition of finished games
+            won     = np.array([info.get("won", False) for info in infos])
+            rewards = rewards + dones * np.where(won, 1.0, -1.0) * learning_agent.win_loss_bonus
+
+            if is_ppo:
+                learning_agent.store_batch(states, actions, log_probs, rewards, values, dones)
+                if len(learning_agent.buffer) >= learning_agent.n_steps:
+                    learning_agent.update()
+            else:
+                final_states = next_states.copy()
+                for i in np.flatnonzero(dones):
+                    final_states[i] = infos[i]["terminal_state"]
+                learning_agent.store_transitions(states, actions, rewards, final_states, dones)
+                # One gradient step per transition, as in the serial loop
+                for _ in range(len(actions)):
+                    learning_agent.update()
+
+            for i in np.flatnonzero(dones):
+                games_done   += 1
+                wins_window  += int(won[i])
+                window_games += 1
+
+                if games_done % log_every == 0:
+                    win_rate = wins_window / window_games * 100
+                    history["win_rates"].append(win_rate)
+                    history["games"].append(games_done)
+                    history["rewards"].append(float(ep_rewards[i]))
+
+                    eps_str = (f"  ε={learning_agent.epsilon:.3f}"
+                               if hasattr(learning_agent, "epsilon") else "")
+                    print(f"  Game {games_done:5d} | Win rate (last {log_every}): "
+                          f"{win_rate:5.1f}%{eps_str}")
+
+                    wins_window  = 0
+                    window_games = 0
+                ep_rewards[i] = 0.0
+
+            states = next_states
+    finally:
+        vec_env.close()
+
+    if is_ppo and len(learning_agent.buffer) > 0:
+        learning_agent.update()
+
+    return dict(history)
+
+
 # ── Evaluation ────────────────────────────────────────────────────────────────
 
 def evaluate(
@@ -186,34 +313,46 @@ def evaluate(
     n_games: int = 2000,
     n_runs: int = 5,
     seed: int = 0,
+    quantize: bool = False,
+    script: bool = False,
 ) -> Dict:
     """
     Evaluate a trained agent over n_runs × n_games.
-    Sets epsilon=0 for DDQN automatically.
+    Sets epsilon=0 for DDQN automatically. quantize=True picks actions with
+    int8 copies of the agent's networks (see agent.quantized_inference),
+    script=True with frozen TorchScript copies (agent.scripted_inference).
     """
     if hasattr(learning_agent, "epsilon"):
         learning_agent.epsilon = 0.0
 
     agent_pid = learning_agent.player_id
     env       = MonopolyEnv(agent_ids=[agent_pid], max_rounds=300)
-    other_pids = [i for i in range(NUM_PLAYERS) if i != agent_pid]
+    other_pids = OTHERS[agent_pid]
     fp_agents  = [FPAgentA(other_pids[0]),
                   FPAgentB(other_pids[1]),
                   FPAgentC(other_pids[2])]
 
     all_wins = []
-    for run in range(n_runs):
-        random.seed(seed + run)
-        np.random.seed(seed + run)
-        wins = 0
-        for _ in range(n_games):
-            result = run_episode(env, learning_agent, fp_agents,
-                                 agent_pid, is_ppo, update_online=False)
-            if result["won"]:
-                wins += 1
-        rate = wins / n_games * 100
-        all_wins.append(rate)
-        print(f"  Run {run+1}/{n_runs}:  win rate = {rate:.1f}%")
+    if quantize:
+        inference = learning_agent.quantized_inference()
+    elif script:
+        inference = learning_agent.scripted_inference()
+    else:
+        inference = nullcontext()
+    with inference:
+        for run in range(n_runs):
+            random.seed(seed + run)
+            np.random.seed(seed + run)
+            env.reset(seed=seed + run)
+            wins = 0
+            for _ in range(n_games):
+                result = run_episode(env, learning_agent, fp_agents,
+                                     agent_pid, is_ppo, update_online=False)
+                if result["won"]:
+                    wins += 1
+            rate = wins / n_games * 100
+            all_wins.append(rate)
+            print(f"  Run {run+1}/{n_runs}:  win rate = {rate:.1f}%")
 
     mean = float(np.mean(all_wins))
     std  = float(np.std(all_wins))
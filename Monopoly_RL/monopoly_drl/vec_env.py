@@ -0,0 +1,262 @@
+"""
+Vectorized training environments.
+
+Each sub-environment is one full game seen from the learning agent's seat:
+a MonopolyEnv plus the three fixed-policy opponents. Opponent turns, the
+learner's forced moves (a single allowed action) and, in hybrid mode, the
+fixed-rule BUY / ACCEPT decisions are played inside the sub-environment,
+so the learner only sees the states where its network has to act. Observations from all sub-environments are stacked into one
+(num_envs, 240) array so the learner runs a single batched forward pass per
+step instead of num_envs single-sample ones.
+
+Sub-environments run in worker processes connected by pipes (as in the
+OpenAI baselines SubprocVecEnv), or in-process with subprocess=False.
+Workers write observations and allowed-action masks straight into
+shared-memory arrays, so only rewards, flags and infos are pickled through
+the pipes.
+"""
+
+import multiprocessing as mp
+import numpy as np
+from typing import List, Optional, Tuple
+
+from .env import MonopolyEnv
+from .agents_fixed import FP_AGENT_CLASSES
+from .agent_ppo import fixed_hybrid_action
+from .actions import ActionType, ACTION_SPACE_SIZE, allowed_mask
+from .networks import STATE_DIM
+from .constants import NUM_PLAYERS, OTHERS
+
+
+def seat_players(env: MonopolyEnv, n_players: int):
+    """Seat only pids below n_players in a freshly reset env; the rest start bankrupt."""
+    for pid in range(n_players, NUM_PLAYERS):
+        env.players[pid].bankrupt = True
+    env._refresh_active_others()
+
+    # Restrict turn order to active players only
+    env.turn_order       = [p for p in env.turn_order if p < n_players]
+    env.current_turn_idx = 0
+
+
+class LearnerGame:
+    """
+    One game, advanced until the learning agent's network must act.
+    With n_players < NUM_PLAYERS only pids below n_players are seated (see
+    seat_players); max_steps defaults to max_rounds × NUM_PLAYERS × 30.
+    """
+
+    def __init__(self, agent_pid: int = 0, hybrid: bool = True,
+                 max_rounds: int = 300, seed: Optional[int] = None,
+                 n_players: int = NUM_PLAYERS, max_steps: Optional[int] = None):
+        self.agent_pid = agent_pid
+        self.hybrid    = hybrid
+        self.n_players = n_players
+        # The seed goes to the env's own Generator, not the global state
+        self.env       = MonopolyEnv(agent_ids=[agent_pid], max_rounds=max_rounds, seed=seed)
+        other_pids     = OTHERS[agent_pid]
+        self.fp_agents = {pid: cls(pid) for pid, cls in zip(other_pids, FP_AGENT_CLASSES)}
+        self.max_steps = max_steps or max_rounds * NUM_PLAYERS * 30
+        self.steps     = 0
+
+    def reset(self) -> Tuple[np.ndarray, List[int]]:
+        self.env.reset()
+        if self.n_players < NUM_PLAYERS:
+            seat_players(self.env, self.n_players)
+        self.steps = 0
+        allowed = self._play_until_agent_turn()
+        if allowed is None:
+            allowed = [int(ActionType.DO_NOTHING)]
+        return self.env._get_state(self.agent_pid), allowed
+
+    def step(self, action: int):
+        """
+        Apply the learning agent's action, then play everyone else.
+        Returns (state, reward, done, allowed, info). When the game ends the
+        game is reset automatically: state/allowed belong to the new game and
+        info holds "won", "winner" and "terminal_state".
+        """
+        _, reward, done, _ = self.env.step(int(action))
+        self.steps += 1
+        allowed = None if done else self._play_until_agent_turn()
+        state   = self.env._get_state(self.agent_pid)
+        if allowed is not None:
+            return state, reward, False, allowed, {}
+
+        winner = self.winner()
+        info   = {"won": winner == self.agent_pid, "winner": winner, "terminal_state": state}
+        state, allowed = self.reset()
+        return state, reward, True, allowed, info
+
+    def winner(self) -> int:
+        """env.winner(), but a game that hit the round or step limit goes to the richest seated pid."""
+        winner = self.env.winner()
+        if winner is None or winner >= self.n_players:
+            winner = int(np.argmax(self.env.net_worths()[:self.n_players]))
+        return winner
+
+    def _play_until_agent_turn(self) -> Optional[List[int]]:
+        """Step opponents until the agent must act; None once the game is over."""
+        env = self.env
+        while not env.done and self.steps < self.max_steps:
+            pid = env.whose_turn()
+            if env.players[pid].bankrupt:
+                env._advance_turn()
+                self.steps += 1
+                continue
+
+            allowed = env.get_allowed_actions(pid)
+            if not allowed:
+                allowed = [int(ActionType.DO_NOTHING)]
+
+            if pid == self.agent_pid:
+                if len(allowed) == 1:
+                    # Forced move: nothing for the network to decide
+                    env.step(allowed[0])
+                    self.steps += 1
+                    continue
+                if self.hybrid:
+                    fixed = fixed_hybrid_action(env, pid, allowed)
+                    if fixed is not None:
+                        env.step(fixed)
+                        self.steps += 1
+                        continue
+                return allowed
+
+            action = self.fp_agents[pid].choose_action(env)
+            if action not in allowed:
+                action = int(ActionType.END_TURN) if int(ActionType.END_TURN) in allowed else allowed[0]
+            env.step(action)
+            self.steps += 1
+        return None
+
+
+def _shared_rows(raw) -> np.ndarray:
+    """(num_envs, STATE_DIM) float32 view of a shared RawArray."""
+    return np.frombuffer(raw, dtype=np.float32).reshape(-1, STATE_DIM)
+
+
+def _shared_masks(raw) -> np.ndarray:
+    """(num_envs, ACTION_SPACE_SIZE) bool view of a shared RawArray."""
+    return np.frombuffer(raw, dtype=bool).reshape(-1, ACTION_SPACE_SIZE)
+
+
+def _worker(remote, parent_remote, game_kwargs: dict,
+            shared_obs, shared_terminal, shared_mask, index: int):
+    parent_remote.close()
+    game     = LearnerGame(**game_kwargs)
+    obs      = _shared_rows(shared_obs)[index]
+    terminal = _shared_rows(shared_terminal)[index]
+    mask     = _shared_masks(shared_mask)[index]
+    try:
+        while True:
+            cmd, data = remote.recv()
+            if cmd == "step":
+                state, reward, done, allowed, info = game.step(data)
+                obs[:] = state
+                mask.fill(False)
+                mask[allowed] = True
+                if done:
+                    terminal[:] = info.pop("terminal_state")
+                remote.send((reward, done, info))
+            elif cmd == "reset":
+                state, allowed = game.reset()
+                obs[:] = state
+                mask.fill(False)
+                mask[allowed] = True
+                remote.send(None)
+            elif cmd == "close":
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        remote.close()
+
+
+class VecMonopolyEnv:
+    """
+    num_envs LearnerGames stepped in lockstep.
+
+    reset() -> (states, allowed)
+    step(actions) -> (states, rewards, dones, allowed, infos)
+
+    states is a (num_envs, 240) float32 array, allowed a
+    (num_envs, ACTION_SPACE_SIZE) bool mask of the allowed actions,
+    rewards/dones arrays of shape (num_envs,).
+    """
+
+    def __init__(self, num_envs: int, agent_pid: int = 0, hybrid: bool = True,
+                 max_rounds: int = 300, seed: int = 0,
+                 subprocess: bool = True, start_method: Optional[str] = None):
+        self.num_envs   = num_envs
+        self.subprocess = subprocess
+        self.closed     = False
+        game_kwargs = [dict(agent_pid=agent_pid, hybrid=hybrid,
+                            max_rounds=max_rounds, seed=seed + i)
+                       for i in range(num_envs)]
+
+        if subprocess:
+            ctx = mp.get_context(start_method)
+            # Row i of each array is written only by worker i
+            self._shared_obs      = ctx.RawArray("f", num_envs * STATE_DIM)
+            self._shared_terminal = ctx.RawArray("f", num_envs * STATE_DIM)
+            self._shared_mask     = ctx.RawArray("B", num_envs * ACTION_SPACE_SIZE)
+            self._obs      = _shared_rows(self._shared_obs)
+            self._terminal = _shared_rows(self._shared_terminal)
+            self._mask     = _shared_masks(self._shared_mask)
+
+            self.remotes, work_remotes = zip(*[ctx.Pipe() for _ in range(num_envs)])
+            self.processes = []
+            for i, (work_remote, remote, kwargs) in enumerate(zip(work_remotes, self.remotes, game_kwargs)):
+                proc = ctx.Process(target=_worker,
+                                   args=(work_remote, remote, kwargs,
+                                         self._shared_obs, self._shared_terminal,
+                                         self._shared_mask, i),
+                                   daemon=True)
+                proc.start()
+                self.processes.append(proc)
+                work_remote.close()
+        else:
+            self.games = [LearnerGame(**kwargs) for kwargs in game_kwargs]
+
+    def reset(self):
+        if self.subprocess:
+            for remote in self.remotes:
+                remote.send(("reset", None))
+            for remote in self.remotes:
+                remote.recv()
+            return self._obs.copy(), self._mask.copy()
+        states, allowed = zip(*[game.reset() for game in self.games])
+        return np.stack(states), allowed_mask(allowed)
+
+    def step(self, actions):
+        if self.subprocess:
+            for remote, action in zip(self.remotes, actions):
+                remote.send(("step", int(action)))
+            rewards, dones, infos = zip(*[remote.recv() for remote in self.remotes])
+            # Copy out: the workers overwrite the shared rows on the next step
+            states  = self._obs.copy()
+            allowed = self._mask.copy()
+            for i, done in enumerate(dones):
+                if done:
+                    infos[i]["terminal_state"] = self._terminal[i].copy()
+        else:
+            results = [game.step(action) for game, action in zip(self.games, actions)]
+            states, rewards, dones, allowed, infos = zip(*results)
+            states  = np.stack(states)
+            allowed = allowed_mask(allowed)
+        return (states,
+                np.asarray(rewards, dtype=np.float32),
+                np.asarray(dones, dtype=bool),
+                allowed,
+                list(infos))
+
+    def close(self):
+        if self.closed:
+            return
+        if self.subprocess:
+            for remote in self.remotes:
+                remote.send(("close", None))
+            for proc in self.processes:
+                proc.join()
+        self.closed = True
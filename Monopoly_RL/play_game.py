@@ -9,24 +9,37 @@ Usage:
     python play_game.py --model ppo_hybrid_model.pt --players 3
     python play_game.py --model ppo_hybrid_model.pt --players 2 --seed 42
     python play_game.py --algo ddqn --model ddqn_model.pt --players 4
+    python play_game.py --model ppo_hybrid_model.pt --games 200 --batch 16
 """
 
 import argparse
 import random
 import os
 import sys
+import queue
+import threading
+from bisect import bisect_right
+from functools import lru_cache
 from datetime import datetime
 
+import numpy as np
+import torch
+
 from monopoly_drl.env import MonopolyEnv, TradeOffer, PHASE_PRE_ROLL, PHASE_POST_ROLL, PHASE_OUT_OF_TURN
 from monopoly_drl.agent_ppo  import PPOAgent
 from monopoly_drl.agent_ddqn import DDQNAgent
 from monopoly_drl.agents_fixed import FPAgentA, FPAgentB, FPAgentC
-from monopoly_drl.actions import ActionType, OFFSETS, PROPERTY_IDS
+from monopoly_drl.vec_env import LearnerGame, seat_players
+from monopoly_drl.actions import (
+    OFFSETS, SECTION_STARTS, PROPERTY_IDS, TRADE_DECODE, EXCH_DECODE,
+    DO_NOTHING, END_TURN, ROLL_DICE, BUY_PROPERTY, USE_GOOJ_CARD, PAY_BAIL,
+    DECLARE_BANKRUPT, ACCEPT_TRADE, DECLINE_TRADE
+)
 from monopoly_drl.constants import (
     BOARD, PROPERTIES, COLOR_GROUPS,
     NUM_PLAYERS, JAIL_SQUARE, GO_TO_JAIL_SQUARE,
     INCOME_TAX_SQUARE, LUXURY_TAX_SQUARE, JAIL_BAIL,
-    REAL_ESTATE_IDS
+    REAL_ESTATE_IDS, OTHERS, TRADE_CASH_LEVELS
 )
 
 # ── Chance / Community Chest cards ───────────────────────────────────────────
@@ -73,25 +86,96 @@ COMMUNITY_CHEST_CARDS = [
 CHANCE_SQUARES    = {7, 22, 36}
 COMMUNITY_SQUARES = {2, 17, 33}
 
+# The card text is cosmetic, so it is drawn from its own RNG: logging (or
+# not) never shifts the random stream the game itself uses. Each
+# simulate() owns its streams (env._card_draws), so concurrent simulations
+# share no RNG state. Indices are drawn _CARD_BLOCK at a time, like
+# MonopolyEnv's dice.
+_CARD_BLOCK = 1024
+
+
+def _card_stream(cards, rng):
+    """Endless uniform draws from cards."""
+    while True:
+        for i in rng.integers(len(cards), size=_CARD_BLOCK).tolist():
+            yield cards[i]
+
+
+def card_draws(seed=None):
+    """
+    (Chance, Community Chest) text streams from a fresh PCG64 Generator;
+    seed=None seeds it from OS entropy.
+    """
+    rng = np.random.default_rng(seed)
+    return _card_stream(CHANCE_CARDS, rng), _card_stream(COMMUNITY_CHEST_CARDS, rng)
+
 
 # ── Logger ────────────────────────────────────────────────────────────────────
 
 class GameLogger:
-    def __init__(self, log_path="game_log.txt"):
+    """
+    Collects lines in memory and hands them over in batches (maybe_flush,
+    flush) to a background thread. The thread writes each batch to the log
+    file and, if verbose, echoes it to stdout, so a slow terminal never
+    stalls the game loop. Batches are written in the order they were queued.
+
+    With log_path=None there is no file; if verbose is also False the
+    logger is disabled (enabled=False) and log/separator do nothing.
+    """
+
+    def __init__(self, log_path="game_log.txt", verbose=True):
         self.log_path = log_path
-        self.file     = open(log_path, "w", buffering=1)  # line-buffered
+        self.verbose  = verbose
+        self.enabled  = verbose or log_path is not None
+        self.file     = open(log_path, "w", buffering=1 << 16) if log_path is not None else None
+        self.buf      = []   # lines not yet handed to the writer
+        self.buf_len  = 0    # total characters in buf
+        self.q        = queue.Queue()   # batches for _writer; None = stop
+        self.writer   = threading.Thread(target=self._writer, daemon=True)
+        if self.enabled:
+            self.writer.start()
+        else:
+            self.log = self.separator = self.maybe_flush = _discard
+
+    def _writer(self):
+        while True:
+            chunk = self.q.get()
+            if chunk is None:
+                break
+            if self.file is not None:
+                self.file.write(chunk)
+            if self.verbose:
+                sys.stdout.write(chunk)
 
     def log(self, text=""):
-        print(text)
-        self.file.write(text + "\n")
+        line = text + "\n"
+        self.buf.append(line)
+        self.buf_len += len(line)
+
+    def maybe_flush(self, threshold=4096):
+        """Queue the buffered lines for writing once they add up to threshold characters."""
+        if self.buf_len >= threshold:
+            self.q.put("".join(self.buf))
+            self.buf.clear()
+            self.buf_len = 0
 
     def separator(self, char="─", width=60):
         self.log(char * width)
 
     def flush(self):
-        self.file.flush()
-        self.file.close()
-        print(f"\n[Game log saved to: {self.log_path}]")
+        if not self.enabled:
+            return
+        self.maybe_flush(threshold=1)
+        self.q.put(None)
+        self.writer.join()
+        sys.stdout.flush()
+        if self.file is not None:
+            self.file.close()
+            print(f"\n[Game log saved to: {self.log_path}]")
+
+
+def _discard(*args, **kwargs):
+    pass
 
 
 # ── Name helpers ──────────────────────────────────────────────────────────────
@@ -100,166 +184,171 @@ def square_name(sq):
     return BOARD.get(sq, f"Square {sq}")
 
 def _pname_from_pid(pid, env):
-    return env._pnames.get(pid, f"Player {pid+1}")
+    return env._pnames[pid]
+
 
-def _pid_from_pname(pname, env):
-    return env._pnames_rev.get(pname, 0)
+@lru_cache(maxsize=8)
+def _seat_setup(n_players, trained_pid):
+    """
+    (display name per pid, FP agent class per opponent pid) for a game,
+    built once per seating and shared by every simulate() call with it.
+    Unused seats get a name too.
+    """
+    pnames = tuple("Player 1 (AI★)" if pid == trained_pid else f"Player {pid + 1}"
+                   for pid in range(NUM_PLAYERS))
+    fp_classes = (FPAgentA, FPAgentB, FPAgentC)
+    other_pids = [pid for pid in range(n_players) if pid != trained_pid]
+    fp_seats   = tuple((pid, fp_classes[i % 3]) for i, pid in enumerate(other_pids))
+    return pnames, fp_seats
 
 
 # ── Action logger ─────────────────────────────────────────────────────────────
 
-def log_action(logger, pid, pname, action_idx, env, info):
-    """Log what happened after an action was applied to the env."""
-    lines = []
+# Each _log_<section> returns the lines for an action from that action
+# section, given its index local to the section.
 
-    if action_idx < OFFSETS["mortgage"]:
-        atype = ActionType(action_idx)
-
-        if atype == ActionType.ROLL_DICE:
-            d1, d2 = env.last_dice
-            lines.append(f"{pname} rolls a {d1} and a {d2}  (total: {d1+d2})")
-            sq = env.players[pid].position
-            sn = square_name(sq)
-
-            if sq == GO_TO_JAIL_SQUARE:
-                lines.append(f"{pname} lands on Go To Jail → sent directly to Jail!")
-            elif sq == JAIL_SQUARE and env.players[pid].in_jail:
-                lines.append(f"{pname} is in Jail")
-            elif sq == INCOME_TAX_SQUARE:
-                lines.append(f"{pname} lands on Income Tax — pays $200")
-            elif sq == LUXURY_TAX_SQUARE:
-                lines.append(f"{pname} lands on Luxury Tax — pays $100")
-            elif sq in CHANCE_SQUARES:
-                card = random.choice(CHANCE_CARDS)
-                lines.append(f"{pname} lands on Chance")
-                lines.append(f"  ► Card: \"{card}\"")
-            elif sq in COMMUNITY_SQUARES:
-                card = random.choice(COMMUNITY_CHEST_CARDS)
-                lines.append(f"{pname} lands on Community Chest")
-                lines.append(f"  ► Card: \"{card}\"")
-            elif sq in env.properties:
-                prop = env.properties[sq]
-                lines.append(f"{pname} lands on {prop.name}")
-                if prop.owner is None:
-                    lines.append(f"  → Unowned  |  Price: ${prop.price}")
-                elif prop.owner == pid:
-                    lines.append(f"  → {pname} owns this property")
-                else:
-                    rent = info.get("rent_paid", "?")
-                    owner_pn = _pname_from_pid(prop.owner, env)
-                    lines.append(f"  → Owned by {owner_pn}  |  {pname} pays ${rent} rent")
+def _log_binary(pid, pname, local, env, info):
+    lines = []
+    if local == ROLL_DICE:
+        d1, d2 = env.last_dice
+        lines.append(f"{pname} rolls a {d1} and a {d2}  (total: {d1+d2})")
+        sq = env.players[pid].position
+        sn = square_name(sq)
+
+        if sq == GO_TO_JAIL_SQUARE:
+            lines.append(f"{pname} lands on Go To Jail → sent directly to Jail!")
+        elif sq == JAIL_SQUARE and env.players[pid].in_jail:
+            lines.append(f"{pname} is in Jail")
+        elif sq == INCOME_TAX_SQUARE:
+            lines.append(f"{pname} lands on Income Tax — pays $200")
+        elif sq == LUXURY_TAX_SQUARE:
+            lines.append(f"{pname} lands on Luxury Tax — pays $100")
+        elif sq in CHANCE_SQUARES:
+            card = next(env._card_draws[0])
+            lines.append(f"{pname} lands on Chance")
+            lines.append(f"  ► Card: \"{card}\"")
+        elif sq in COMMUNITY_SQUARES:
+            card = next(env._card_draws[1])
+            lines.append(f"{pname} lands on Community Chest")
+            lines.append(f"  ► Card: \"{card}\"")
+        elif sq in env.properties:
+            prop = env.properties[sq]
+            lines.append(f"{pname} lands on {prop.name}")
+            if prop.owner is None:
+                lines.append(f"  → Unowned  |  Price: ${prop.price}")
+            elif prop.owner == pid:
+                lines.append(f"  → {pname} owns this property")
             else:
-                lines.append(f"{pname} lands on {sn}")
-
-        elif atype == ActionType.BUY_PROPERTY:
-            sq   = env.players[pid].position
-            prop = env.properties.get(sq)
-            if prop:
-                lines.append(f"{pname} BUYS {prop.name} for ${prop.price}")
-                lines.append(f"  → Cash remaining: ${env.players[pid].cash}")
-
-        elif atype == ActionType.END_TURN:
-            lines.append(f"{pname} ends their turn")
-
-        elif atype == ActionType.DO_NOTHING:
-            pass
-
-        elif atype == ActionType.USE_GOOJ_CARD:
-            lines.append(f"{pname} uses Get Out of Jail Free card — released!")
-
-        elif atype == ActionType.PAY_BAIL:
-            lines.append(f"{pname} pays ${JAIL_BAIL} bail — released from Jail")
-
-        elif atype == ActionType.ACCEPT_TRADE:
-            lines.append(f"{pname} ACCEPTS the trade offer")
-
-        elif atype == ActionType.DECLINE_TRADE:
-            lines.append(f"{pname} DECLINES the trade offer")
-
-        elif atype == ActionType.DECLARE_BANKRUPT:
-            lines.append(f"💀 {pname} declares BANKRUPTCY!")
-
-    elif action_idx < OFFSETS["unmortgage"]:
-        local = action_idx - OFFSETS["mortgage"]
-        prop  = env.properties[PROPERTY_IDS[local]]
-        lines.append(f"{pname} mortgages {prop.name} — receives ${prop.mortgage_v}")
-
-    elif action_idx < OFFSETS["improve_house"]:
-        local = action_idx - OFFSETS["unmortgage"]
-        prop  = env.properties[PROPERTY_IDS[local]]
-        cost  = int(prop.mortgage_v * 1.1)
-        lines.append(f"{pname} lifts mortgage on {prop.name} — pays ${cost}")
-
-    elif action_idx < OFFSETS["improve_hotel"]:
-        local = action_idx - OFFSETS["improve_house"]
-        prop  = env.properties[REAL_ESTATE_IDS[local]]
-        lines.append(f"{pname} builds a HOUSE on {prop.name}  ({prop.houses} house(s))")
-
-    elif action_idx < OFFSETS["sell_house"]:
-        local = action_idx - OFFSETS["improve_hotel"]
-        prop  = env.properties[REAL_ESTATE_IDS[local]]
-        lines.append(f"{pname} builds a HOTEL on {prop.name}!")
-
-    elif action_idx < OFFSETS["sell_hotel"]:
-        local = action_idx - OFFSETS["sell_house"]
-        prop  = env.properties[REAL_ESTATE_IDS[local]]
-        lines.append(f"{pname} sells a house on {prop.name}")
-
-    elif action_idx < OFFSETS["sell_prop"]:
-        local = action_idx - OFFSETS["sell_hotel"]
-        prop  = env.properties[REAL_ESTATE_IDS[local]]
-        lines.append(f"{pname} sells the hotel on {prop.name}")
-
-    elif action_idx < OFFSETS["buy_trade"]:
-        local = action_idx - OFFSETS["sell_prop"]
-        prop  = env.properties[PROPERTY_IDS[local]]
-        lines.append(f"{pname} sells {prop.name} back to bank for ${prop.mortgage_v}")
-
-    elif action_idx < OFFSETS["sell_trade"]:
-        local      = action_idx - OFFSETS["buy_trade"]
-        n, nc      = len(PROPERTY_IDS), 3
-        t_idx      = local // (n * nc)
-        rem        = local % (n * nc)
-        prop       = env.properties[PROPERTY_IDS[rem // nc]]
-        price_lvl  = [0.75, 1.0, 1.25][rem % nc]
-        others     = [i for i in range(NUM_PLAYERS) if i != pid]
-        target_pid = others[t_idx] if t_idx < len(others) else others[0]
-        cash       = int(prop.price * price_lvl)
-        target_pn  = _pname_from_pid(target_pid, env)
-        lines.append(f"{pname} sends a BUY offer to {target_pn}:")
-        lines.append(f"  ► Wants: {prop.name}  |  Offering: ${cash}")
-
-    elif action_idx < OFFSETS["exch_trade"]:
-        local      = action_idx - OFFSETS["sell_trade"]
-        n, nc      = len(PROPERTY_IDS), 3
-        t_idx      = local // (n * nc)
-        rem        = local % (n * nc)
-        prop       = env.properties[PROPERTY_IDS[rem // nc]]
-        price_lvl  = [0.75, 1.0, 1.25][rem % nc]
-        others     = [i for i in range(NUM_PLAYERS) if i != pid]
-        target_pid = others[t_idx] if t_idx < len(others) else others[0]
-        cash       = int(prop.price * price_lvl)
-        target_pn  = _pname_from_pid(target_pid, env)
-        lines.append(f"{pname} sends a SELL offer to {target_pn}:")
-        lines.append(f"  ► Offering: {prop.name}  |  Requesting: ${cash}")
+                rent = info.get("rent_paid", "?")
+                owner_pn = _pname_from_pid(prop.owner, env)
+                lines.append(f"  → Owned by {owner_pn}  |  {pname} pays ${rent} rent")
+        else:
+            lines.append(f"{pname} lands on {sn}")
 
-    else:
-        local      = action_idx - OFFSETS["exch_trade"]
-        n          = len(PROPERTY_IDS)
-        t_idx      = local // (n * (n - 1))
-        rem        = local % (n * (n - 1))
-        oi         = rem // (n - 1)
-        ri_raw     = rem % (n - 1)
-        ri         = ri_raw if ri_raw < oi else ri_raw + 1
-        others     = [i for i in range(NUM_PLAYERS) if i != pid]
-        target_pid = others[t_idx] if t_idx < len(others) else others[0]
-        offered    = env.properties[PROPERTY_IDS[oi]]
-        requested  = env.properties[PROPERTY_IDS[ri]]
-        target_pn  = _pname_from_pid(target_pid, env)
-        lines.append(f"{pname} sends an EXCHANGE offer to {target_pn}:")
-        lines.append(f"  ► Offering:   {offered.name}  (${offered.price})")
-        lines.append(f"  ► Requesting: {requested.name}  (${requested.price})")
+    elif local == BUY_PROPERTY:
+        sq   = env.players[pid].position
+        prop = env.properties.get(sq)
+        if prop:
+            lines.append(f"{pname} BUYS {prop.name} for ${prop.price}")
+            lines.append(f"  → Cash remaining: ${env.players[pid].cash}")
+
+    elif local == END_TURN:
+        lines.append(f"{pname} ends their turn")
+
+    elif local == DO_NOTHING:
+        pass
+
+    elif local == USE_GOOJ_CARD:
+        lines.append(f"{pname} uses Get Out of Jail Free card — released!")
+
+    elif local == PAY_BAIL:
+        lines.append(f"{pname} pays ${JAIL_BAIL} bail — released from Jail")
+
+    elif local == ACCEPT_TRADE:
+        lines.append(f"{pname} ACCEPTS the trade offer")
+
+    elif local == DECLINE_TRADE:
+        lines.append(f"{pname} DECLINES the trade offer")
+
+    elif local == DECLARE_BANKRUPT:
+        lines.append(f"💀 {pname} declares BANKRUPTCY!")
+    return lines
+
+
+def _log_mortgage(pid, pname, local, env, info):
+    prop = env.properties[PROPERTY_IDS[local]]
+    return [f"{pname} mortgages {prop.name} — receives ${prop.mortgage_v}"]
+
+
+def _log_unmortgage(pid, pname, local, env, info):
+    prop = env.properties[PROPERTY_IDS[local]]
+    cost = int(prop.mortgage_v * 1.1)
+    return [f"{pname} lifts mortgage on {prop.name} — pays ${cost}"]
+
+
+def _log_improve_house(pid, pname, local, env, info):
+    prop = env.properties[REAL_ESTATE_IDS[local]]
+    return [f"{pname} builds a HOUSE on {prop.name}  ({prop.houses} house(s))"]
+
+
+def _log_improve_hotel(pid, pname, local, env, info):
+    prop = env.properties[REAL_ESTATE_IDS[local]]
+    return [f"{pname} builds a HOTEL on {prop.name}!"]
+
+
+def _log_sell_house(pid, pname, local, env, info):
+    prop = env.properties[REAL_ESTATE_IDS[local]]
+    return [f"{pname} sells a house on {prop.name}"]
+
+
+def _log_sell_hotel(pid, pname, local, env, info):
+    prop = env.properties[REAL_ESTATE_IDS[local]]
+    return [f"{pname} sells the hotel on {prop.name}"]
+
+
+def _log_sell_prop(pid, pname, local, env, info):
+    prop = env.properties[PROPERTY_IDS[local]]
+    return [f"{pname} sells {prop.name} back to bank for ${prop.mortgage_v}"]
+
+
+def _decode_cash_offer(pid, local, env):
+    """(target pname, property, cash) of a buy_trade / sell_trade action."""
+    t_idx, prop_idx, price_idx = TRADE_DECODE[local]
+    prop = env.properties[PROPERTY_IDS[prop_idx]]
+    cash = int(prop.price * TRADE_CASH_LEVELS[price_idx])
+    return _pname_from_pid(OTHERS[pid][t_idx], env), prop, cash
 
+
+def _log_buy_trade(pid, pname, local, env, info):
+    target_pn, prop, cash = _decode_cash_offer(pid, local, env)
+    return [f"{pname} sends a BUY offer to {target_pn}:",
+            f"  ► Wants: {prop.name}  |  Offering: ${cash}"]
+
+
+def _log_sell_trade(pid, pname, local, env, info):
+    target_pn, prop, cash = _decode_cash_offer(pid, local, env)
+    return [f"{pname} sends a SELL offer to {target_pn}:",
+            f"  ► Offering: {prop.name}  |  Requesting: ${cash}"]
+
+
+def _log_exch_trade(pid, pname, local, env, info):
+    t_idx, oi, ri = EXCH_DECODE[local]
+    offered   = env.properties[PROPERTY_IDS[oi]]
+    requested = env.properties[PROPERTY_IDS[ri]]
+    target_pn = _pname_from_pid(OTHERS[pid][t_idx], env)
+    return [f"{pname} sends an EXCHANGE offer to {target_pn}:",
+            f"  ► Offering:   {offered.name}  (${offered.price})",
+            f"  ► Requesting: {requested.name}  (${requested.price})"]
+
+
+# The _log_* handler for each section, in OFFSETS (= SECTION_STARTS) order
+_LOG_HANDLERS   = tuple(globals()["_log_" + name] for name in OFFSETS)
+
+
+def log_action(logger, pid, pname, action_idx, env, info):
+    """Log what happened after an action was applied to the env."""
+    section = bisect_right(SECTION_STARTS, action_idx) - 1
+    lines   = _LOG_HANDLERS[section](pid, pname, action_idx - SECTION_STARTS[section], env, info)
     for line in lines:
         if line:
             logger.log(f"  {line}")
@@ -270,26 +359,51 @@ def log_action(logger, pid, pname, action_idx, env, info):
 def log_standings(logger, env, n_players):
     logger.log()
     logger.log("  📊 Current standings:")
+    table  = env.player_table()[:n_players]
+    worths = env.net_worths()
     for pid in range(n_players):
-        player = env.players[pid]
-        pname  = env._pnames[pid]
-        if player.bankrupt:
+        pname = env._pnames[pid]
+        row   = table[pid]
+        if row["bankrupt"]:
             logger.log(f"    {pname}: BANKRUPT")
             continue
         logger.log(
             f"    {pname}: "
-            f"Cash=${player.cash}  |  "
-            f"Properties={len(player.properties)}  |  "
-            f"Monopolies={player.num_monopolies()}  |  "
-            f"Net Worth=${player.net_worth():.0f}"
+            f"Cash=${row['cash']}  |  "
+            f"Properties={row['n_properties']}  |  "
+            f"Monopolies={row['n_monopolies']}  |  "
+            f"Net Worth=${worths[pid]:.0f}"
         )
     logger.log()
 
 
 # ── Main simulation ───────────────────────────────────────────────────────────
 
-def simulate(model_path, algo, n_players, log_path):
-    logger = GameLogger(log_path)
+def _load_agent(model_path, algo, trained_pid):
+    """The hybrid agent to evaluate, greedy, with model_path's weights if it exists."""
+    if algo == "ppo":
+        trained_agent = PPOAgent(player_id=trained_pid, hybrid=True)
+    else:
+        trained_agent = DDQNAgent(player_id=trained_pid, hybrid=True)
+
+    if model_path and os.path.exists(model_path):
+        trained_agent.load(model_path)
+
+    if hasattr(trained_agent, "epsilon"):
+        trained_agent.epsilon = 0.0
+    return trained_agent
+
+
+def _new_env(n_players, trained_pid, seed=None):
+    """A reset env seating n_players; the unused seats start bankrupt."""
+    env = MonopolyEnv(agent_ids=[trained_pid], max_rounds=200, seed=seed)
+    env.reset()
+    seat_players(env, n_players)
+    return env
+
+
+def simulate(model_path, algo, n_players, log_path, verbose=True, seed=None):
+    logger = GameLogger(log_path, verbose=verbose)
 
     logger.separator("═")
     logger.log("  MONOPOLY — AI Game Simulation")
@@ -299,30 +413,16 @@ def simulate(model_path, algo, n_players, log_path):
     logger.separator("═")
 
     # ── Load trained agent ────────────────────────────────────────────────
-    trained_pid = 0
-    if algo == "ppo":
-        trained_agent = PPOAgent(player_id=trained_pid, hybrid=True)
-    else:
-        trained_agent = DDQNAgent(player_id=trained_pid, hybrid=True)
-
+    trained_pid   = 0
+    trained_agent = _load_agent(model_path, algo, trained_pid)
     if model_path and os.path.exists(model_path):
-        trained_agent.load(model_path)
         logger.log(f"\n✓ Loaded trained model: {model_path}")
     else:
         logger.log(f"\n⚠ No model at '{model_path}' — using untrained weights")
 
-    if hasattr(trained_agent, "epsilon"):
-        trained_agent.epsilon = 0.0
-
     # ── Fixed-policy opponents ────────────────────────────────────────────
-    fp_classes = [FPAgentA, FPAgentB, FPAgentC]
-    other_pids = list(range(1, n_players))
-    fp_agents  = {other_pids[i]: fp_classes[i % 3](other_pids[i])
-                  for i in range(len(other_pids))}
-
-    pnames = {trained_pid: "Player 1 (AI★)"}
-    for pid in other_pids:
-        pnames[pid] = f"Player {pid + 1}"
+    pnames, fp_seats = _seat_setup(n_players, trained_pid)
+    fp_agents = {pid: cls(pid) for pid, cls in fp_seats}
 
     agents_map = {trained_pid: trained_agent}
     agents_map.update(fp_agents)
@@ -334,20 +434,13 @@ def simulate(model_path, algo, n_players, log_path):
         logger.log(f"    {pnames[pid]}  →  {role}")
 
     # ── Build env ─────────────────────────────────────────────────────────
-    env = MonopolyEnv(agent_ids=[trained_pid], max_rounds=200)
-    env.reset()
+    # Dice and card text get independent streams derived from seed
+    dice_seed, card_seed = (None, None) if seed is None else np.random.SeedSequence(seed).spawn(2)
+    env = _new_env(n_players, trained_pid, dice_seed)
 
-    # Attach name maps to env for logging helpers
+    # Attach the names and card streams to env for logging helpers
     env._pnames     = pnames
-    env._pnames_rev = {v: k for k, v in pnames.items()}
-
-    # Mark unused player slots as bankrupt
-    for pid in range(n_players, NUM_PLAYERS):
-        env.players[pid].bankrupt = True
-
-    # Restrict turn order to active players only
-    env.turn_order       = [p for p in env.turn_order if p < n_players]
-    env.current_turn_idx = 0
+    env._card_draws = card_draws(card_seed)
 
     logger.separator()
     logger.log(f"\n  Turn order: {' → '.join(pnames[p] for p in env.turn_order)}")
@@ -363,8 +456,9 @@ def simulate(model_path, algo, n_players, log_path):
         steps += 1
 
         # Round header
-        if env.round != current_round:
+        if env.round != current_round and logger.enabled:
             current_round = env.round
+            logger.maybe_flush()
             logger.separator()
             logger.log(f"  ROUND {current_round + 1}")
             logger.separator()
@@ -372,7 +466,7 @@ def simulate(model_path, algo, n_players, log_path):
 
         # Who acts right now?
         pid   = env.whose_turn()
-        pname = pnames.get(pid, f"Player {pid+1}")
+        pname = pnames[pid]
 
         # Skip bankrupt players
         if env.players[pid].bankrupt:
@@ -385,7 +479,7 @@ def simulate(model_path, algo, n_players, log_path):
         # Get allowed actions
         allowed = env.get_allowed_actions(pid)
         if not allowed:
-            allowed = [int(ActionType.END_TURN)]
+            allowed = [END_TURN]
 
         # Ask agent for action
         if pid == trained_pid:
@@ -398,18 +492,18 @@ def simulate(model_path, algo, n_players, log_path):
             agent  = agents_map[pid]
             action = agent.choose_action(env)
             if action not in allowed:
-                action = int(ActionType.END_TURN) if int(ActionType.END_TURN) in allowed else allowed[0]
+                action = END_TURN if END_TURN in allowed else allowed[0]
 
         # Apply to env
         _, _, done, info = env.step(action)
 
         # Log (skip silent DO_NOTHING)
-        if action != int(ActionType.DO_NOTHING):
+        if action != DO_NOTHING and logger.enabled:
             log_action(logger, pid, pname, action, env, info)
 
         # Announce any newly bankrupt players
-        for p in range(n_players):
-            if env.players[p].bankrupt and p not in bankrupt_announced:
+        for p in info.get("newly_bankrupt", ()):
+            if p not in bankrupt_announced:
                 bankrupt_announced.add(p)
                 logger.log(f"  💀 {pnames[p]} has gone BANKRUPT and is eliminated!")
 
@@ -419,19 +513,20 @@ def simulate(model_path, algo, n_players, log_path):
     logger.log("  GAME OVER")
     logger.separator("═")
 
+    worths = env.net_worths()[:n_players]
     winner = env.winner()
     if winner is not None and winner < n_players:
         logger.log(f"\n  🏆 WINNER: {pnames[winner]}!")
     else:
         logger.log("\n  Round limit reached")
-        richest = max(range(n_players), key=lambda p: env.players[p].net_worth())
+        richest = int(np.argmax(worths))
         logger.log(f"  🏆 WINNER by net worth: {pnames[richest]}!")
 
     logger.log()
     logger.log("  Final standings:")
     for pid in range(n_players):
         player = env.players[pid]
-        status = "BANKRUPT" if player.bankrupt else f"Net Worth: ${player.net_worth():.0f}"
+        status = "BANKRUPT" if player.bankrupt else f"Net Worth: ${worths[pid]:.0f}"
         props  = [p.name for p in player.properties]
         logger.log(f"    {pnames[pid]}: {status}")
         if props:
@@ -441,6 +536,49 @@ def simulate(model_path, algo, n_players, log_path):
     logger.flush()
 
 
+# ── Batched simulation ────────────────────────────────────────────────────────
+
+def simulate_batched(model_path, algo, n_players, n_games, batch_size=16, seed=None):
+    """
+    Play n_games unlogged games with batch_size of them in flight, each a
+    vec_env.LearnerGame seated like simulate(). Whenever the trained
+    agent's network has to act, the states of every game in flight go
+    through one choose_action_batch forward pass. Finished games restart
+    until n_games have been played.
+
+    Returns the number of wins per seat (length n_players).
+    """
+    trained_pid   = 0
+    trained_agent = _load_agent(model_path, algo, trained_pid)
+
+    n_flight = min(batch_size, n_games)
+    seeds    = [None] * n_flight if seed is None else np.random.SeedSequence(seed).spawn(n_flight)
+    games    = [LearnerGame(agent_pid=trained_pid, hybrid=True, max_rounds=200, seed=s,
+                            n_players=n_players, max_steps=10_000)
+                for s in seeds]
+    obs      = [game.reset() for game in games]   # (state, allowed) per game
+    started  = n_flight
+    wins     = [0] * n_players
+    while games:
+        actions = trained_agent.choose_action_batch(np.stack([state for state, _ in obs]),
+                                                    [allowed for _, allowed in obs])
+        if algo == "ppo":
+            actions = actions[0]
+
+        in_flight = []
+        for game, action in zip(games, actions):
+            state, _, done, allowed, info = game.step(action)
+            if done:
+                wins[info["winner"]] += 1
+                if started == n_games:
+                    continue   # drop the game it restarted
+                started += 1
+            in_flight.append((game, (state, allowed)))
+        games = [game for game, _ in in_flight]
+        obs   = [o for _, o in in_flight]
+    return wins
+
+
 # ── Entry point ───────────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
@@ -450,6 +588,12 @@ if __name__ == "__main__":
     parser.add_argument("--players", type=int,   default=3)
     parser.add_argument("--log",     type=str,   default="game_log.txt")
     parser.add_argument("--seed",    type=int,   default=None)
+    parser.add_argument("--quiet",   action="store_true", help="only write the log file")
+    parser.add_argument("--no-log",  action="store_true", help="write no log file")
+    parser.add_argument("--games",   type=int,   default=1,
+                        help="with more than 1, play that many unlogged games and report wins")
+    parser.add_argument("--batch",   type=int,   default=16,
+                        help="games in flight per forward pass with --games")
     args = parser.parse_args()
 
     if not 2 <= args.players <= 4:
@@ -458,10 +602,22 @@ if __name__ == "__main__":
 
     if args.seed is not None:
         random.seed(args.seed)
+        np.random.seed(args.seed)
+        torch.manual_seed(args.seed)   # PPO samples its actions with torch
+
+    if args.games > 1:
+        wins = simulate_batched(args.model, args.algo, args.players, args.games, args.batch,
+                                seed=args.seed)
+        pnames, _ = _seat_setup(args.players, 0)
+        for pid, n in enumerate(wins):
+            print(f"  {pnames[pid]}: {n} wins ({n / args.games * 100:.1f}%)")
+        sys.exit(0)
 
     simulate(
         model_path=args.model,
         algo=args.algo,
         n_players=args.players,
-        log_path=args.log,
+        log_path=None if args.no_log else args.log,
+        verbose=not args.quiet,
+        seed=args.seed,
     )
\ No newline at end of file
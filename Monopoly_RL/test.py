@@ -1,6 +1,8 @@
 # test_action.py
-from monopoly_drl.actions import action_to_description, ACTION_SPACE_SIZE
+from monopoly_drl.actions import action_to_description, action_to_descriptions, ACTION_SPACE_SIZE
 import random
+import sys
+import numpy as np
 
 # Test a specific index
 print(action_to_description(131))
@@ -12,4 +14,8 @@ print(action_to_description(240))
 # Test a few random ones
 for _ in range(5):
     idx = random.randint(0, ACTION_SPACE_SIZE - 1)
-    print(f"  {idx:4d} → {action_to_description(idx)}")
\ No newline at end of file
+    print(f"  {idx:4d} → {action_to_description(idx)}")
+
+# Whole action space in one batched lookup:  python test.py --all
+if "--all" in sys.argv:
+    print("\n".join(action_to_descriptions(np.arange(ACTION_SPACE_SIZE))))
@@ -9,6 +9,8 @@ Usage:
     python train_and_save.py --games 5000           # more training
     python train_and_save.py --algo ddqn --games 10000
     python train_and_save.py --algo ppo --games 2000 --out my_model.pt
+    python train_and_save.py --games 5000 --num-workers 8   # 8 games in parallel
+    python train_and_save.py --games 5000 --mode async --num-workers 8
 """
 
 import argparse
@@ -17,7 +19,12 @@ import os
 import json
 import time
 
-from monopoly_drl import train_ppo, train_ddqn
+try:
+    import orjson
+except ImportError:                                   # pragma: no cover
+    orjson = None
+
+from monopoly_drl import train_ppo, train_ddqn, train_async, PPOAgent, DDQNAgent
 
 
 def main():
@@ -32,6 +39,12 @@ def main():
                         help="Number of training games (default: 2000)")
     parser.add_argument("--out",    type=str, default=None,
                         help="Output path for saved model weights")
+    parser.add_argument("--num-workers", type=int, default=1,
+                        help="Games played in parallel worker processes, with the "
+                             "learner batching their forward passes (default: 1)")
+    parser.add_argument("--mode",   choices=["sync", "async"], default="sync",
+                        help="async: workers play whole games with periodically "
+                             "published weights while this process trains (default: sync)")
     args = parser.parse_args()
 
     # Default output filename
@@ -43,24 +56,39 @@ def main():
     print(f"  Algorithm : {args.algo.upper()}")
     print(f"  Mode      : {'Hybrid' if args.hybrid else 'Standard'}")
     print(f"  Games     : {args.games}")
+    print(f"  Workers   : {args.num_workers} ({args.mode})")
     print(f"  Save to   : {args.out}")
     print(f"{'='*60}\n")
 
     start = time.time()
 
-    if args.algo == "ppo":
+    log_every = max(1, args.games // 50)
+    if args.mode == "async":
+        agent_cls = PPOAgent if args.algo == "ppo" else DDQNAgent
+        agent     = agent_cls(player_id=0, hybrid=args.hybrid)
+        history   = train_async(
+            agent,
+            is_ppo=args.algo == "ppo",
+            hybrid=args.hybrid,
+            n_games=args.games,
+            log_every=log_every,
+            num_workers=args.num_workers,
+        )
+    elif args.algo == "ppo":
         agent, history = train_ppo(
             hybrid=args.hybrid,
             player_id=0,
             n_games=args.games,
-            log_every=max(1, args.games // 50),
+            log_every=log_every,
+            num_envs=args.num_workers,
         )
     else:
         agent, history = train_ddqn(
             hybrid=args.hybrid,
             player_id=0,
             n_games=args.games,
-            log_every=max(1, args.games // 50),
+            log_every=log_every,
+            num_envs=args.num_workers,
         )
 
     elapsed = time.time() - start
@@ -72,8 +100,11 @@ def main():
 
     # Save training history
     history_path = args.out.replace(".pt", "_history.json")
-    with open(history_path, "w") as f:
-        json.dump(history, f, indent=2)
+    with open(history_path, "wb", buffering=1 << 20) as f:
+        if orjson is not None:
+            f.write(orjson.dumps(history, option=orjson.OPT_INDENT_2))
+        else:
+            f.write(json.dumps(history, indent=2).encode())
     print(f"Training history saved to: {history_path}")
 
     # Print final win rate